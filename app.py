@@ -1,11 +1,21 @@
-import uvicorn
 from fastapi import FastAPI
-from core.db.database_initializer import DatabaseInitializer
+from core.lifespan.app_lifespan import AppLifespan
+from core.response.dto_response import FastJSONResponse
 from core.config.logging.logger_config import LoggerConfig
 from core.exception.core_exception_handler import CoreExceptionHandler
 from core.middleware.cors_middleware_config import CORSMiddlewareConfig
 from domain.user.controller.oauth.oauth_controller import OauthController
 from domain.user.controller.profile.profile_controller import ProfileController
+from core.system.system_controller import SystemController
+from core.security.jwt.jwks_controller import JwksController
+from core.metrics.metrics_config import MetricsConfig
+from core.server.server_launcher import ServerLauncher
+from domain.user.repository.cache.user_cache import UserCache
+from domain.user.repository.refresh_token.refresh_token_cleaner import RefreshTokenCleaner
+from core.security.rate_limit.rate_limiter import RateLimiter
+from core.security.auth.revocation_index import RevocationIndex
+from core.db.write_behind.write_behind_buffer import WriteBehindBuffer
+from core.db.routing.primary_sticky_middleware import PrimaryStickyMiddleware
 
 # 로거 생성
 logger = LoggerConfig.get_logger("app")
@@ -13,22 +23,39 @@ logger = LoggerConfig.get_logger("app")
 # FastAPI 앱 생성
 app = FastAPI(
     title="FastAPI",
-    lifespan=DatabaseInitializer.db_lifespan
+    lifespan=AppLifespan.lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # 전역 예외처리 적용
 CoreExceptionHandler.register(app=app)
 # CORS 적용
 CORSMiddlewareConfig.register(app=app)
+# 쓰기 직후 같은 클라이언트의 읽기를 primary 로 고정 (read-your-writes)
+app.add_middleware(PrimaryStickyMiddleware)
+# 메트릭 수집 및 /metrics 적용
+MetricsConfig.register(app=app)
+MetricsConfig.register_collector(name="user_cache", collector=UserCache.stats)
+MetricsConfig.register_collector(name="rate_limit", collector=RateLimiter.stats)
+MetricsConfig.register_collector(name="revocation", collector=RevocationIndex.stats)
+MetricsConfig.register_collector(name="write_behind", collector=WriteBehindBuffer.stats)
+MetricsConfig.register_collector(name="logging", collector=LoggerConfig.stats)
+
+# 만료된 Refresh Token 주기적 삭제
+AppLifespan.register_background_task(RefreshTokenCleaner.run)
 
 # 컨트롤러 인스턴스 생성
 oauth_controller = OauthController()
 profile_controller = ProfileController()
+system_controller = SystemController()
+jwks_controller = JwksController()
 
 # 라우터 등록
 app.include_router(router=oauth_controller.router, prefix="/api")
 app.include_router(router=profile_controller.router, prefix="/api")
+app.include_router(router=system_controller.router, prefix="/api")
+app.include_router(router=jwks_controller.router)
 
+# 개발용 실행 (운영 환경은 python -m core.server.server_launcher)
 if __name__ == "__main__":
-    logger.info("FastAPI 서버를 시작합니다...")
-    uvicorn.run("app:app", host="127.0.0.1", port=8000, reload=True)
+    ServerLauncher.run(dev=True)
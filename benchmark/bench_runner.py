@@ -0,0 +1,97 @@
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+
+# 벤치마크 케이스 실행, 결과 저장 및 기준값 비교를 담당하는 클래스
+class BenchRunner:
+
+    def __init__(self, name_filter: str | None = None):
+        self.name_filter = name_filter
+        self.results: dict[str, dict[str, Any]] = {}
+
+    # 호출 1회의 소요 시간(ns) 목록 측정, 동기/비동기 함수 모두 지원
+    @staticmethod
+    async def _measure(fn: Callable[[], Any] | Callable[[], Awaitable[Any]], iterations: int, warmup: int) -> list[int]:
+        is_async = inspect.iscoroutinefunction(fn)
+
+        for _ in range(warmup):
+            if is_async:
+                await fn()
+            else:
+                fn()
+
+        durations = []
+        for _ in range(iterations):
+            started_at = time.perf_counter_ns()
+            if is_async:
+                await fn()
+            else:
+                fn()
+            durations.append(time.perf_counter_ns() - started_at)
+
+        return durations
+
+    # 케이스 실행 및 통계 기록
+    async def run(self, name: str, fn: Callable[[], Any], iterations: int = 1000, warmup: int = 50) -> None:
+        if self.name_filter and self.name_filter not in name:
+            return
+
+        durations = sorted(await BenchRunner._measure(fn=fn, iterations=iterations, warmup=warmup))
+        median_ns = statistics.median(durations)
+
+        self.results[name] = {
+            "iterations": iterations,
+            "median_ns": median_ns,
+            "mean_ns": statistics.fmean(durations),
+            "p95_ns": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+            "min_ns": durations[0],
+            "ops_per_sec": 1e9 / median_ns if median_ns else 0.0,
+        }
+        print(f"{name:<50} median={median_ns / 1000:>10.1f} us  p95={self.results[name]['p95_ns'] / 1000:>10.1f} us")
+
+    # 결과를 JSON 형태로 변환
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "meta": {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": self.results,
+        }
+
+    # 결과 파일 저장
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_json(), file, indent=2, sort_keys=True)
+
+    # 기준값 대비 중앙값이 threshold 비율 이상 느려진 케이스 목록 반환
+    def compare(self, baseline_path: str, threshold: float) -> list[str]:
+        with open(baseline_path, encoding="utf-8") as file:
+            baseline = json.load(file).get("results", {})
+
+        regressions = []
+        for name, result in self.results.items():
+            if name not in baseline:
+                continue
+
+            base_median = baseline[name]["median_ns"]
+            ratio = result["median_ns"] / base_median if base_median else 1.0
+            marker = "REGRESSION" if ratio > 1 + threshold else "ok"
+            print(f"{name:<50} {ratio:>6.2f}x  {marker}")
+
+            if ratio > 1 + threshold:
+                regressions.append(name)
+
+        return regressions
+
+    # 이벤트 루프에서 벤치마크 코루틴 실행
+    @staticmethod
+    def run_async(coro: Awaitable[None]) -> None:
+        asyncio.run(coro)
@@ -0,0 +1,48 @@
+from fastapi import status
+from fastapi.responses import JSONResponse
+from benchmark.bench_runner import BenchRunner
+from core.response.dto_response import DtoResponse, FastJSONResponse
+from domain.user.dto.response.profile.profile_dto_response import ProfileDtoResponse
+from domain.user.dto.response.oauth.signin_dto_response import SigninDtoResponse
+
+
+# DTO 직렬화 및 응답 렌더링 벤치마크
+class DtoBenchmark:
+
+    @staticmethod
+    def _profile_response() -> JSONResponse:
+        response = ProfileDtoResponse(
+            user_id="00000000-0000-4000-8000-000000000000",
+            username="benchmark",
+            email="benchmark@example.com",
+            bio="benchmark user",
+            status_code=status.HTTP_200_OK
+        ).model_dump()
+
+        return JSONResponse(content=response, status_code=response.get("status_code", 500))
+
+    @staticmethod
+    def _signin_response() -> JSONResponse:
+        response = SigninDtoResponse(
+            user_id="00000000-0000-4000-8000-000000000000",
+            access_token="x" * 180,
+            status_code=status.HTTP_200_OK
+        ).model_dump()
+
+        return JSONResponse(content=response, status_code=response.get("status_code", 500))
+
+    @staticmethod
+    def _profile_response_fast() -> FastJSONResponse:
+        return DtoResponse.of(dto=ProfileDtoResponse(
+            user_id="00000000-0000-4000-8000-000000000000",
+            username="benchmark",
+            email="benchmark@example.com",
+            bio="benchmark user",
+            status_code=status.HTTP_200_OK
+        ))
+
+    @staticmethod
+    async def run(runner: BenchRunner) -> None:
+        await runner.run("dto.profile_response", DtoBenchmark._profile_response, iterations=5000)
+        await runner.run("dto.signin_response", DtoBenchmark._signin_response, iterations=5000)
+        await runner.run("dto.profile_response.fast", DtoBenchmark._profile_response_fast, iterations=5000)
@@ -0,0 +1,61 @@
+import uuid
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from benchmark.bench_runner import BenchRunner
+from core.db.base import Base
+from domain.user.entity.oauth.oauth_entity import OauthEntity
+from domain.user.repository.oauth.oauth_repository import OauthRepository
+
+
+# 로컬 SQLite(aiosqlite)를 MySQL 대신 사용하는 Repository 벤치마크
+class RepositoryBenchmark:
+
+    USER_COUNT: int = 1000
+    DB_URL: str = "sqlite+aiosqlite:///:memory:"
+
+    @staticmethod
+    async def run(runner: BenchRunner) -> None:
+        engine = create_async_engine(url=RepositoryBenchmark.DB_URL, poolclass=StaticPool)
+        session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        # 테스트 데이터 생성
+        user_ids = [str(uuid.uuid4()) for _ in range(RepositoryBenchmark.USER_COUNT)]
+        async with session_factory() as session:
+            session.add_all([
+                OauthEntity(
+                    user_id=user_id,
+                    username=f"user{index}",
+                    email=f"user{index}@example.com",
+                    password="$argon2id$benchmark",
+                    bio="benchmark user",
+                )
+                for index, user_id in enumerate(user_ids)
+            ])
+            await session.commit()
+
+        target_user_id = user_ids[len(user_ids) // 2]
+        target_email = f"user{len(user_ids) // 2}@example.com"
+
+        try:
+            async with session_factory() as session:
+                async def find_by_user_id():
+                    session.expunge_all()
+                    await OauthRepository.find_by_user_id(session=session, user_id=target_user_id)
+
+                async def find_by_email():
+                    session.expunge_all()
+                    await OauthRepository.find_by_email(session=session, email=target_email)
+
+                async def update_bio():
+                    await OauthRepository.update_bio(session=session, user_id=target_user_id, new_bio="updated")
+
+                await runner.run("repository.find_by_user_id", find_by_user_id, iterations=2000)
+                await runner.run("repository.find_by_email", find_by_email, iterations=2000)
+                await runner.run("repository.update_bio", update_bio, iterations=1000)
+
+        finally:
+            await engine.dispose()
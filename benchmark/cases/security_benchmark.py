@@ -0,0 +1,46 @@
+from benchmark.bench_runner import BenchRunner
+from core.security.jwt.jwt_provider import JWTProvider
+from core.security.jwt.jwt_token_cache import JWTTokenCache
+from core.security.password.argon2_password_hasher import Argon2PasswordHasher
+
+
+# JWT / Argon2 핫패스 벤치마크
+class SecurityBenchmark:
+
+    USER_ID: str = "00000000-0000-4000-8000-000000000000"
+    PASSWORD: str = "benchmark-password-1234"
+
+    @staticmethod
+    async def run(runner: BenchRunner) -> None:
+        access_token = JWTProvider.create_access_token(user_id=SecurityBenchmark.USER_ID)
+
+        await runner.run("jwt.create_access_token", lambda: JWTProvider.create_access_token(user_id=SecurityBenchmark.USER_ID))
+        await runner.run("jwt.create_refresh_token", lambda: JWTProvider.create_refresh_token(user_id=SecurityBenchmark.USER_ID))
+
+        # 캐시를 끈 상태의 검증 비용과 캐시 적중 시 비용을 분리 측정
+        cache_enabled = JWTTokenCache.ENABLED
+        try:
+            JWTTokenCache.ENABLED = False
+            await runner.run("jwt.verify_token", lambda: JWTProvider.verify_token(token=access_token))
+
+            JWTTokenCache.ENABLED = True
+            JWTTokenCache.clear()
+            await runner.run("jwt.verify_token.cached", lambda: JWTProvider.verify_token(token=access_token))
+
+        finally:
+            JWTTokenCache.ENABLED = cache_enabled
+            JWTTokenCache.clear()
+
+        # Argon2는 호출당 수백 ms가 걸리므로 반복 횟수를 줄임
+        hashed_password = Argon2PasswordHasher.hash_password(password=SecurityBenchmark.PASSWORD)
+
+        await runner.run(
+            "argon2.hash_password",
+            lambda: Argon2PasswordHasher.hash_password(password=SecurityBenchmark.PASSWORD),
+            iterations=5, warmup=1,
+        )
+        await runner.run(
+            "argon2.verify_password",
+            lambda: Argon2PasswordHasher.verify_password(plain_password=SecurityBenchmark.PASSWORD, hashed_password=hashed_password),
+            iterations=5, warmup=1,
+        )
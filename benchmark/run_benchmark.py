@@ -0,0 +1,39 @@
+import argparse
+import sys
+from benchmark.bench_runner import BenchRunner
+from benchmark.cases.security_benchmark import SecurityBenchmark
+from benchmark.cases.dto_benchmark import DtoBenchmark
+from benchmark.cases.repository_benchmark import RepositoryBenchmark
+
+
+# 전체 벤치마크 실행
+# 사용법: python -m benchmark.run_benchmark --output bench_result.json --baseline benchmark/baseline.json
+async def run_all(runner: BenchRunner) -> None:
+    await SecurityBenchmark.run(runner=runner)
+    await DtoBenchmark.run(runner=runner)
+    await RepositoryBenchmark.run(runner=runner)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="보안 / Repository 핫패스 벤치마크")
+    parser.add_argument("--filter", default=None, help="이름에 포함된 케이스만 실행")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 중앙값 증가 비율")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 --baseline 경로에 기준값으로 저장")
+    args = parser.parse_args()
+
+    runner = BenchRunner(name_filter=args.filter)
+    BenchRunner.run_async(run_all(runner=runner))
+
+    if args.output:
+        runner.save(path=args.output)
+
+    if args.baseline and args.save_baseline:
+        runner.save(path=args.baseline)
+
+    elif args.baseline:
+        regressions = runner.compare(baseline_path=args.baseline, threshold=args.threshold)
+        if regressions:
+            print(f"성능 회귀 감지: {', '.join(regressions)}")
+            sys.exit(1)
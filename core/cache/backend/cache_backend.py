@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+# 캐시 저장소 추상화 (메모리, Redis 등 외부 저장소로 교체 가능)
+class CacheBackend(ABC):
+
+    # 값 조회, 없거나 만료되었으면 None
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        pass
+
+    # 값 저장 (ttl: 초)
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        pass
+
+    # 값이 없을 때만 저장 (ttl: 초), 저장했으면 True
+    @abstractmethod
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        pass
+
+    # 값 삭제
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    # 전체 삭제
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from typing import Any
+from core.cache.backend.cache_backend import CacheBackend
+
+# 프로세스 내 LRU + TTL 캐시 저장소
+class MemoryCacheBackend(CacheBackend):
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()  # key -> (값, 만료 시각)
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+
+        # 최대 크기를 넘으면 가장 오래 사용되지 않은 항목 제거
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        if await self.get(key) is not None:
+            return False
+
+        await self.set(key, value, ttl)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    # 현재 저장된 항목 수
+    def __len__(self) -> int:
+        return len(self._entries)
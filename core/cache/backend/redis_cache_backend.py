@@ -0,0 +1,81 @@
+import json
+from datetime import datetime
+from typing import Any
+from core.cache.backend.cache_backend import CacheBackend
+from core.cache.redis.fake_redis_client import FakeRedisClient
+from core.cache.redis.redis_protocol_client import RedisProtocolClient, RedisProtocolError
+from core.config.logging.logger_config import LoggerConfig
+
+# Redis 캐시 저장소 (모든 워커 / 인스턴스가 공유, 무효화도 공유됨)
+# 저장소 장애 시 조회는 캐시 미스로 처리하고 요청은 계속 진행
+class RedisCacheBackend(CacheBackend):
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.cache.backend.redis_cache_backend")
+
+    ERRORS: tuple[type[Exception], ...] = (ConnectionError, OSError, TimeoutError, RedisProtocolError)
+    DATETIME_TAG: str = "$datetime"
+
+    def __init__(self, client: RedisProtocolClient | FakeRedisClient, key_prefix: str = "cache"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    # JSON 직렬화 (datetime 은 태그를 붙여 보존)
+    @classmethod
+    def _encode(cls, value: Any) -> str:
+        def default(obj: Any) -> Any:
+            if isinstance(obj, datetime):
+                return {cls.DATETIME_TAG: obj.isoformat()}
+            raise TypeError(f"직렬화할 수 없는 값입니다: {type(obj).__name__}")
+
+        return json.dumps(value, default=default, separators=(",", ":"))
+
+    @classmethod
+    def _decode(cls, raw: str) -> Any:
+        def object_hook(obj: dict) -> Any:
+            if len(obj) == 1 and cls.DATETIME_TAG in obj:
+                return datetime.fromisoformat(obj[cls.DATETIME_TAG])
+            return obj
+
+        return json.loads(raw, object_hook=object_hook)
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self.client.execute("GET", self._key(key))
+        except self.ERRORS as e:
+            self.logger.warning("캐시 조회 실패 (key=%s): %s", key, e)
+            return None
+
+        return self._decode(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            await self.client.execute("SET", self._key(key), self._encode(value), "PX", int(ttl * 1000))
+        except self.ERRORS as e:
+            self.logger.warning("캐시 저장 실패 (key=%s): %s", key, e)
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        try:
+            reply = await self.client.execute("SET", self._key(key), self._encode(value), "PX", int(ttl * 1000), "NX")
+        except self.ERRORS as e:
+            self.logger.warning("캐시 저장 실패 (key=%s): %s", key, e)
+            return False
+
+        return reply is not None
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.client.execute("DEL", *(self._key(key) for key in keys))
+        except self.ERRORS as e:
+            # 무효화 실패 시 항목은 TTL 이 지나야 사라짐
+            self.logger.error("캐시 무효화 실패 (keys=%s): %s", keys, e)
+
+    async def clear(self) -> None:
+        keys = await self.client.execute("KEYS", f"{self.key_prefix}:*")
+        if keys:
+            await self.client.execute("DEL", *keys)
@@ -0,0 +1,121 @@
+import fnmatch
+import time
+from typing import Any
+from core.cache.redis.redis_protocol_client import RedisProtocolError
+
+
+# 테스트 / 로컬 실행용 Redis 대체 클라이언트 (RedisProtocolClient 와 같은 인터페이스)
+# 단일 이벤트 루프 안에서 명령이 순서대로 실행되므로 transaction 은 원자적으로 동작
+class FakeRedisClient:
+
+    def __init__(self):
+        self._data: dict[str, Any] = {}
+        self._expires: dict[str, float] = {}  # key -> 만료 시각 (monotonic)
+
+    # 만료된 키 제거
+    def _purge(self, key: str) -> None:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+
+    def _zset(self, key: str) -> dict[str, float]:
+        self._purge(key)
+        return self._data.setdefault(key, {})
+
+    async def execute(self, *args: Any) -> Any:
+        command, *params = args
+        handler = getattr(self, f"_cmd_{str(command).lower()}", None)
+        if handler is None:
+            raise RedisProtocolError(f"ERR unknown command '{command}'")
+        return handler(*params)
+
+    async def transaction(self, *commands: tuple) -> list[Any]:
+        return [await self.execute(*command) for command in commands]
+
+    async def close(self) -> None:
+        pass
+
+    # 문자열 / 키 명령
+    def _cmd_get(self, key: str) -> Any:
+        self._purge(key)
+        return self._data.get(key)
+
+    def _cmd_set(self, key: str, value: Any, *options: Any) -> str | None:
+        flags = [str(option).upper() for option in options]
+        if "NX" in flags:
+            self._purge(key)
+            if key in self._data:
+                return None
+
+        self._data[key] = str(value)
+        self._expires.pop(key, None)
+        if "PX" in flags:
+            self._expires[key] = time.monotonic() + int(options[flags.index("PX") + 1]) / 1000
+        return "OK"
+
+    def _cmd_del(self, *keys: str) -> int:
+        removed = sum(1 for key in keys if self._data.pop(key, None) is not None)
+        for key in keys:
+            self._expires.pop(key, None)
+        return removed
+
+    def _cmd_pexpire(self, key: str, milliseconds: Any) -> int:
+        self._purge(key)
+        if key not in self._data:
+            return 0
+        self._expires[key] = time.monotonic() + int(milliseconds) / 1000
+        return 1
+
+    def _cmd_keys(self, pattern: str) -> list[str]:
+        for key in list(self._data):
+            self._purge(key)
+        return [key for key in self._data if fnmatch.fnmatchcase(key, pattern)]
+
+    # Sorted Set 명령
+    def _cmd_zadd(self, key: str, *score_members: Any) -> int:
+        zset = self._zset(key)
+        added = 0
+        for score, member in zip(score_members[::2], score_members[1::2]):
+            added += member not in zset
+            zset[str(member)] = float(score)
+        return added
+
+    def _cmd_zrem(self, key: str, *members: Any) -> int:
+        zset = self._zset(key)
+        return sum(1 for member in members if zset.pop(str(member), None) is not None)
+
+    def _cmd_zcard(self, key: str) -> int:
+        return len(self._zset(key))
+
+    @staticmethod
+    def _bound(value: Any, default: float) -> float:
+        text = str(value)
+        if text in ("-inf", "+inf", "inf"):
+            return default
+        return float(text.lstrip("("))
+
+    def _cmd_zremrangebyscore(self, key: str, minimum: Any, maximum: Any) -> int:
+        zset = self._zset(key)
+        low, high = self._bound(minimum, float("-inf")), self._bound(maximum, float("inf"))
+        members = [member for member, score in zset.items() if low <= score <= high]
+        for member in members:
+            del zset[member]
+        return len(members)
+
+    def _cmd_zrangebyscore(self, key: str, minimum: Any, maximum: Any, *options: Any) -> list[str]:
+        zset = self._zset(key)
+        low, high = self._bound(minimum, float("-inf")), self._bound(maximum, float("inf"))
+        items = sorted((score, member) for member, score in zset.items() if low <= score <= high)
+        if options and str(options[0]).upper() == "WITHSCORES":
+            return [value for score, member in items for value in (member, repr(score))]
+        return [member for _, member in items]
+
+    def _cmd_zrange(self, key: str, start: Any, stop: Any, *options: Any) -> list[str]:
+        items = sorted((score, member) for member, score in self._zset(key).items())
+        start, stop = int(start), int(stop)
+        stop = len(items) + stop if stop < 0 else stop
+        items = items[start:stop + 1]
+        if options and str(options[0]).upper() == "WITHSCORES":
+            return [value for score, member in items for value in (member, repr(score))]
+        return [member for _, member in items]
@@ -0,0 +1,27 @@
+from core.cache.redis.fake_redis_client import FakeRedisClient
+from core.cache.redis.redis_protocol_client import RedisProtocolClient
+from core.config.environment.environment_config import environment_config
+
+
+# 프로세스 공용 Redis 클라이언트 제공 (REDIS_URL=fake:// 이면 로컬 대체 클라이언트 사용)
+class RedisClientProvider:
+
+    _client: RedisProtocolClient | FakeRedisClient | None = None
+
+    # 공용 클라이언트 반환 (최초 호출 시 생성)
+    @classmethod
+    def get(cls) -> RedisProtocolClient | FakeRedisClient:
+        if cls._client is None:
+            url = environment_config.redis_url
+            if url.startswith("fake://"):
+                cls._client = FakeRedisClient()
+            else:
+                cls._client = RedisProtocolClient(url=url, pool_size=environment_config.redis_pool_size, timeout=environment_config.redis_timeout)
+        return cls._client
+
+    # 클라이언트 종료
+    @classmethod
+    async def close(cls) -> None:
+        if cls._client is not None:
+            await cls._client.close()
+            cls._client = None
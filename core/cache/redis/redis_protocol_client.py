@@ -0,0 +1,134 @@
+import asyncio
+from typing import Any
+from urllib.parse import urlparse
+
+
+# Redis 서버가 반환한 오류
+class RedisProtocolError(Exception):
+    pass
+
+
+# RESP(Redis Serialization Protocol) 기반 최소 비동기 클라이언트 (Redis 호환 저장소 공용)
+class RedisProtocolClient:
+
+    def __init__(self, url: str, pool_size: int = 10, timeout: float = 1.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+
+        self._pool_size = pool_size
+        self._created = 0
+        self._idle: asyncio.Queue[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = asyncio.Queue()
+
+    # 명령을 RESP 배열로 인코딩
+    @staticmethod
+    def _encode(*args: Any) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            value = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+        return b"".join(parts)
+
+    # 응답 하나 읽기
+    @staticmethod
+    async def _read(reader: asyncio.StreamReader) -> Any:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("Redis 연결이 종료되었습니다.")
+
+        prefix, payload = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return payload.decode("utf-8")
+        if prefix == b"-":
+            return RedisProtocolError(payload.decode("utf-8"))
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = await reader.readexactly(length + 2)
+            return data[:-2].decode("utf-8")
+        if prefix == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [await RedisProtocolClient._read(reader) for _ in range(length)]
+
+        raise RedisProtocolError(f"알 수 없는 응답입니다: {line!r}")
+
+    # 새 연결 생성 (인증 / DB 선택 포함)
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+
+        for command in ([("AUTH", self.password)] if self.password else []) + ([("SELECT", self.db)] if self.db else []):
+            writer.write(RedisProtocolClient._encode(*command))
+            await writer.drain()
+            reply = await RedisProtocolClient._read(reader)
+            if isinstance(reply, RedisProtocolError):
+                writer.close()
+                raise reply
+
+        return reader, writer
+
+    # 유휴 연결을 가져오거나 새로 생성 (최대 pool_size 개), timeout 안에 얻지 못하면 TimeoutError
+    async def _acquire(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._idle.empty() and self._created < self._pool_size:
+            self._created += 1
+            try:
+                return await asyncio.wait_for(self._connect(), timeout=self.timeout)
+            except BaseException:
+                self._created -= 1
+                raise
+
+        return await asyncio.wait_for(self._idle.get(), timeout=self.timeout)
+
+    # 명령들을 한 번에 전송하고 응답 목록 반환
+    async def _round_trip(self, *commands: tuple) -> list[Any]:
+        connection = await self._acquire()
+        reader, writer = connection
+        try:
+            async with asyncio.timeout(self.timeout):
+                writer.write(b"".join(RedisProtocolClient._encode(*command) for command in commands))
+                await writer.drain()
+                replies = [await RedisProtocolClient._read(reader) for _ in commands]
+
+        except BaseException:
+            # 응답을 다 읽지 못한 연결은 재사용하지 않음
+            self._created -= 1
+            writer.close()
+            raise
+
+        self._idle.put_nowait(connection)
+        return replies
+
+    # 단일 명령 실행
+    async def execute(self, *args: Any) -> Any:
+        reply = (await self._round_trip(args))[0]
+        if isinstance(reply, RedisProtocolError):
+            raise reply
+        return reply
+
+    # MULTI / EXEC 로 여러 명령을 원자적으로 실행, 각 명령의 결과 목록 반환
+    async def transaction(self, *commands: tuple) -> list[Any]:
+        replies = await self._round_trip(("MULTI",), *commands, ("EXEC",))
+        results = replies[-1]
+
+        if isinstance(results, RedisProtocolError):
+            raise results
+        for result in results or []:
+            if isinstance(result, RedisProtocolError):
+                raise result
+
+        return results
+
+    # 모든 유휴 연결 종료
+    async def close(self) -> None:
+        while not self._idle.empty():
+            _, writer = self._idle.get_nowait()
+            writer.close()
+            self._created -= 1
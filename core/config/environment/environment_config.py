@@ -8,11 +8,38 @@ load_dotenv()
 
 # 실행 환경 설정
 class EnvironmentConfig(BaseModel):
+    # 서버 실행 정의 (core.server.server_launcher)
+    server_host: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    server_port: int = int(os.getenv("SERVER_PORT", "8000"))
+    server_workers: int = int(os.getenv("SERVER_WORKERS", str(os.cpu_count() or 1)))
+    server_backlog: int = int(os.getenv("SERVER_BACKLOG", "2048"))                  # 연결 대기열 크기
+    server_keep_alive: int = int(os.getenv("SERVER_KEEP_ALIVE", "5"))               # Keep-Alive 유지 시간 (초)
+    server_graceful_timeout: int = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))  # 종료 시 요청 처리 대기 시간 (초)
+
+    # 운영 / 내부 엔드포인트 (/metrics, /api/system, /api/profile/batch, /api/profile/list) 접근 허용 네트워크 (쉼표 구분 CIDR)
+    # 기본은 loopback 만 허용 (로드밸런서 뒤에서는 외부 요청도 사설 대역 주소로 보이므로 필요한 대역만 명시적으로 추가)
+    internal_allowed_networks: str = os.getenv("INTERNAL_ALLOWED_NETWORKS", "127.0.0.0/8,::1/128")
+
+    # 신뢰하는 프록시 (로드밸런서 / ingress) 네트워크 (쉼표 구분 CIDR) | 이 주소에서 온 요청은 X-Forwarded-For 로 클라이언트 IP 판별
+    trusted_proxies: str = os.getenv("TRUSTED_PROXIES", "")
+
+    # 메트릭 정의 | 다중 워커는 METRICS_MULTIPROC_DIR 에 워커별 사본을 기록해 /metrics 에서 합산 (server_launcher 가 설정)
+    metrics_multiproc_dir: str = os.getenv("METRICS_MULTIPROC_DIR", "")
+    metrics_snapshot_interval: float = float(os.getenv("METRICS_SNAPSHOT_INTERVAL", "5"))  # 워커별 사본 기록 주기 (초)
+
     # JWT 정의
     jwt_secret: str = os.getenv("JWT_SECRET", "devsecret")
-    jwt_algorithm: str = os.getenv("JWT_ALGORITHM", "HS256")
+    jwt_algorithm: str = os.getenv("JWT_ALGORITHM", "HS256")       # HS256 | RS256 | ES256 | EdDSA ...
+    jwt_key_dir: str = os.getenv("JWT_KEY_DIR", "")                 # 비대칭 키 PEM 파일 디렉터리 (<kid>.pem / <kid>.pub.pem)
+    jwt_active_kid: str = os.getenv("JWT_ACTIVE_KID", "")           # 새 토큰 서명에 사용할 kid
     access_token_expire: int = int(os.getenv("ACCESS_TOKEN_EXPIRE", "30"))
     refresh_token_expire: int = int(os.getenv("REFRESH_TOKEN_EXPIRE", "7"))
+    refresh_token_cleanup_interval: float = float(os.getenv("REFRESH_TOKEN_CLEANUP_INTERVAL", "3600"))  # 만료된 Refresh Token 삭제 주기 (초)
+
+    # 검증된 JWT 캐시 정의
+    jwt_verify_cache_enabled: bool = os.getenv("JWT_VERIFY_CACHE_ENABLED", "false").lower() == "true"
+    jwt_verify_cache_size: int = int(os.getenv("JWT_VERIFY_CACHE_SIZE", "10000"))
+    jwt_verify_cache_ttl: int = int(os.getenv("JWT_VERIFY_CACHE_TTL", "300"))  # 초, 토큰 exp 보다 길게 유지되지 않음
 
     # 데이터베이스 정의
     db_user: str = os.getenv("DB_USER", "appuser")
@@ -20,11 +47,80 @@ class EnvironmentConfig(BaseModel):
     db_host: str = os.getenv("DB_HOST", "127.0.0.1")
     db_port: str = os.getenv("DB_PORT", "3306")
     db_name: str = os.getenv("DB_NAME", "appdb")
+    db_auto_migrate: bool = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"  # 시작 시 마이그레이션 실행 (개발용)
+
+    # 커넥션 풀 정의
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))      # 커넥션 대기 최대 시간 (초)
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))        # 커넥션 재생성 주기 (초)
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    db_echo: bool = os.getenv("DB_ECHO", "false").lower() == "true"         # SQL 로그 출력 여부
+
+    # 읽기 전용 복제본(replica) 정의 | DB_REPLICA_HOST 가 비어 있으면 사용하지 않음
+    db_replica_host: str = os.getenv("DB_REPLICA_HOST", "")
+    db_replica_port: str = os.getenv("DB_REPLICA_PORT", os.getenv("DB_PORT", "3306"))
+    db_replica_sticky_seconds: float = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))       # 쓰기 후 primary 에서 읽는 시간 (초)
+    db_replica_health_interval: float = float(os.getenv("DB_REPLICA_HEALTH_INTERVAL", "10"))    # 상태 확인 주기 (초)
+
+    # Argon2 비용 파라미터 정의 (argon2_calibrator로 측정한 값 사용 권장)
+    argon2_memory_cost: int = int(os.getenv("ARGON2_MEMORY_COST", "102400"))  # KiB
+    argon2_time_cost: int = int(os.getenv("ARGON2_TIME_COST", "4"))
+    argon2_parallelism: int = int(os.getenv("ARGON2_PARALLELISM", "2"))
+
+    # 사용자 조회 캐시 정의
+    user_cache_enabled: bool = os.getenv("USER_CACHE_ENABLED", "false").lower() == "true"
+    user_cache_backend: str = os.getenv("USER_CACHE_BACKEND", "memory")  # memory(단일 워커 전용) | redis
+    user_cache_size: int = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    user_cache_ttl: int = int(os.getenv("USER_CACHE_TTL", "60"))  # 초
+    user_cache_invalidation_ttl: int = int(os.getenv("USER_CACHE_INVALIDATION_TTL", "5"))  # 무효화 후 다시 캐시하지 않는 시간 (초)
+
+    # 비밀번호 해싱 작업자 풀 정의
+    password_hash_executor: str = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")  # thread | process
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+    password_hash_queue_size: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+    password_hash_retry_after: int = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
+
+    # 프로필 일괄 / 목록 조회 정의
+    profile_batch_max_size: int = int(os.getenv("PROFILE_BATCH_MAX_SIZE", "100"))  # 요청당 최대 user_id 수
+    profile_list_max_limit: int = int(os.getenv("PROFILE_LIST_MAX_LIMIT", "100"))  # 목록 조회 페이지당 최대 행 수
+
+    # Redis 정의 | REDIS_URL=fake:// 이면 프로세스 내 대체 클라이언트 사용 (테스트 / 로컬용)
+    redis_url: str = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
+    redis_pool_size: int = int(os.getenv("REDIS_POOL_SIZE", "10"))
+    redis_timeout: float = float(os.getenv("REDIS_TIMEOUT", "1"))  # 명령 응답 대기 시간 (초)
+
+    # 요청 제한 정의 | 규칙 형식: "허용 횟수/윈도우(초)"
+    rate_limit_enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    rate_limit_backend: str = os.getenv("RATE_LIMIT_BACKEND", "redis" if os.getenv("REDIS_URL") else "memory")  # memory(단일 워커 전용) | redis, REDIS_URL 이 설정되어 있으면 redis 가 기본값
+    rate_limit_max_keys: int = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))  # memory 저장소의 최대 키 수
+    rate_limit_signin_ip: str = os.getenv("RATE_LIMIT_SIGNIN_IP", "20/60")
+    rate_limit_signin_email: str = os.getenv("RATE_LIMIT_SIGNIN_EMAIL", "5/60")
+    rate_limit_signup_ip: str = os.getenv("RATE_LIMIT_SIGNUP_IP", "5/60")
+    rate_limit_signup_email: str = os.getenv("RATE_LIMIT_SIGNUP_EMAIL", "3/600")
+
+    # 토큰 폐기 목록 정의 | memory: 워커 내에서만 유지 (단일 워커 전용), redis: 워커 / 인스턴스 간 공유
+    # REDIS_URL 이 설정되어 있으면 redis 가 기본값
+    revocation_backend: str = os.getenv("REVOCATION_BACKEND", "redis" if os.getenv("REDIS_URL") else "memory")
+    revocation_sync_interval: float = float(os.getenv("REVOCATION_SYNC_INTERVAL", "1"))  # 공유 저장소 동기화 주기 (초)
+
+    # 지연 쓰기(write-behind) 정의 | 사용자 / Refresh Token 마지막 사용 시각 기록에 사용
+    write_behind_enabled: bool = os.getenv("WRITE_BEHIND_ENABLED", "true").lower() == "true"  # false 면 활동 시각을 기록하지 않음
+    write_behind_interval: float = float(os.getenv("WRITE_BEHIND_INTERVAL", "1"))        # flush 주기 (초)
+    write_behind_max_pending: int = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "10000"))  # 버퍼별 최대 대기 키 수
+    write_behind_batch_size: int = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "500"))      # executemany 한 번에 보낼 행 수
 
     # DB URL 정의
     @property
     def async_db_url(self) -> str:
         return f"mysql+asyncmy://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}?charset=utf8mb4"
 
+    # Replica DB URL 정의 (설정되지 않았으면 None)
+    @property
+    def async_replica_db_url(self) -> str | None:
+        if not self.db_replica_host:
+            return None
+        return f"mysql+asyncmy://{self.db_user}:{self.db_password}@{self.db_replica_host}:{self.db_replica_port}/{self.db_name}?charset=utf8mb4"
+
 # 불변 객체 생성
 environment_config: Final[EnvironmentConfig] = EnvironmentConfig()
\ No newline at end of file
@@ -0,0 +1,22 @@
+import logging
+import queue
+from logging.handlers import QueueHandler
+
+
+# 메시지 포맷팅을 QueueListener 스레드로 미루는 QueueHandler
+class LazyQueueHandler(QueueHandler):
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped: int = 0  # 큐가 가득 차 버려진 로그 수
+
+    # 기본 구현은 호출 스레드에서 메시지를 포맷하므로, 레코드를 그대로 전달
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    # 큐가 가득 차면 요청 처리를 막지 않고 버림
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
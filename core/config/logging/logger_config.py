@@ -1,11 +1,28 @@
+import atexit
 import logging
+import queue
+import threading
+from typing import Any
+from logging.handlers import QueueListener
+from core.config.logging.lazy_queue_handler import LazyQueueHandler
+from core.config.logging.rate_limit_filter import RateLimitFilter
 
 # 전역 로거 처리를 담당하는 클래스
+# 로그는 큐에 넣기만 하고, 포맷팅과 출력은 백그라운드 QueueListener 스레드에서 처리
 class LoggerConfig:
     LOG_LEVEL: int = logging.INFO
     LOG_FORMAT: str = "[%(asctime)s] [PID:%(process)d] [%(levelname)s] [%(name)s] - %(message)s"
     DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+    QUEUE_SIZE: int = 10000             # 로그 큐 최대 크기 (가득 차면 버림)
+    RATE_LIMIT_WINDOW: float = 10.0     # 반복 로그 제한 구간 (초)
+    RATE_LIMIT_BURST: int = 20          # 구간당 같은 로그 최대 출력 수 (WARNING 이상)
+
+    _queue_handler: LazyQueueHandler | None = None
+    _rate_limit_filter: RateLimitFilter | None = None
+    _listener: QueueListener | None = None
+    _lock = threading.Lock()
+
     @staticmethod
     def _create_formatter() -> logging.Formatter:
         # Formatter 인스턴스 생성
@@ -22,6 +39,50 @@ class LoggerConfig:
         handler.setFormatter(LoggerConfig._create_formatter())
         return handler
 
+    @staticmethod
+    def _get_queue_handler() -> LazyQueueHandler:
+        # 모든 로거가 공유하는 QueueHandler 생성 및 QueueListener 시작 (최초 1회)
+        with LoggerConfig._lock:
+            if LoggerConfig._queue_handler is None:
+                log_queue: queue.Queue = queue.Queue(maxsize=LoggerConfig.QUEUE_SIZE)
+
+                handler = LazyQueueHandler(log_queue)
+                handler.setLevel(LoggerConfig.LOG_LEVEL)
+                rate_limit_filter = RateLimitFilter(
+                    window=LoggerConfig.RATE_LIMIT_WINDOW,
+                    burst=LoggerConfig.RATE_LIMIT_BURST
+                )
+                handler.addFilter(rate_limit_filter)
+
+                LoggerConfig._listener = QueueListener(
+                    log_queue,
+                    LoggerConfig._create_console_handler(),
+                    respect_handler_level=True
+                )
+                LoggerConfig._listener.start()
+                atexit.register(LoggerConfig.shutdown)
+
+                LoggerConfig._queue_handler = handler
+                LoggerConfig._rate_limit_filter = rate_limit_filter
+
+            return LoggerConfig._queue_handler
+
+    @staticmethod
+    def shutdown() -> None:
+        # 큐에 남은 로그를 모두 출력하고 리스너 종료
+        with LoggerConfig._lock:
+            if LoggerConfig._listener is not None:
+                LoggerConfig._listener.stop()
+                LoggerConfig._listener = None
+
+    @staticmethod
+    def stats() -> dict[str, Any]:
+        # 큐가 가득 차 버려진 로그 수 / 반복되어 생략된 로그 수 (메트릭 수집용)
+        return {
+            "dropped": LoggerConfig._queue_handler.dropped if LoggerConfig._queue_handler is not None else 0,
+            "suppressed": LoggerConfig._rate_limit_filter.suppressed if LoggerConfig._rate_limit_filter is not None else 0,
+        }
+
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
         # 전역 로거 반환
@@ -29,7 +90,7 @@ class LoggerConfig:
         logger.setLevel(LoggerConfig.LOG_LEVEL)
 
         if not logger.hasHandlers():
-            handler = LoggerConfig._create_console_handler()
+            handler = LoggerConfig._get_queue_handler()
             logger.addHandler(handler)
 
         return logger
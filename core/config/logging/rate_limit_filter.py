@@ -0,0 +1,60 @@
+import logging
+import threading
+import time
+
+
+# 같은 로그가 반복될 때 구간당 출력 수를 제한하는 필터
+class RateLimitFilter(logging.Filter):
+
+    MAX_KEYS: int = 10000  # 추적하는 메시지 종류 최대 수
+
+    def __init__(self, window: float, burst: int, min_level: int = logging.WARNING):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.min_level = min_level
+        self._states: dict[tuple, list] = {}  # 키 -> [구간 시작 시각, 출력 수, 생략 수]
+        self.suppressed: int = 0  # 생략된 로그 누적 수
+        # filter 는 로그를 남기는 각 스레드에서 핸들러 락 밖에서 호출되므로 상태 변경을 직렬화
+        self._lock = threading.Lock()
+
+    # 메시지 템플릿과 첫 번째 문자열 인자로 같은 로그 판단 (포맷팅 없이 비교)
+    @staticmethod
+    def _key(record: logging.LogRecord) -> tuple:
+        first_arg = record.args[0] if isinstance(record.args, tuple) and record.args else None
+        return record.name, record.levelno, record.msg, first_arg if isinstance(first_arg, str) else type(first_arg).__name__
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level:
+            return True
+
+        now = time.monotonic()
+        key = RateLimitFilter._key(record)
+        with self._lock:
+            return self._admit(record=record, key=key, now=now)
+
+    # 구간당 출력 수 확인 및 상태 갱신 (락을 잡은 상태에서 호출)
+    def _admit(self, record: logging.LogRecord, key: tuple, now: float) -> bool:
+        state = self._states.get(key)
+
+        if state is None:
+            if len(self._states) >= RateLimitFilter.MAX_KEYS:
+                self._states.clear()
+            self._states[key] = [now, 1, 0]
+            return True
+
+        # 새 구간 시작, 이전 구간에서 생략된 수를 함께 출력
+        if now - state[0] >= self.window:
+            suppressed = state[2]
+            state[0], state[1], state[2] = now, 1, 0
+            if suppressed:
+                record.msg = f"{record.msg} (직전 {self.window:g}초 동안 동일 로그 {suppressed}건 생략)"
+            return True
+
+        if state[1] < self.burst:
+            state[1] += 1
+            return True
+
+        state[2] += 1
+        self.suppressed += 1
+        return False
@@ -1,21 +1,41 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from core.config.environment.environment_config import environment_config
-from typing import AsyncGenerator
+from core.db.pool.timed_queue_pool import TimedAsyncAdaptedQueuePool
+from core.db.routing.database_router import DatabaseRouter
+from core.db.routing.routing_session import RoutingSession
+from typing import Any, AsyncGenerator
 
 
 # 비동기 SQLAlchemy 엔진 및 세션 관리를 담당하는 클래스
 class Database:
+
+    # 엔진 생성 (primary / replica 공통 설정)
+    @staticmethod
+    def _create_engine(url: str) -> AsyncEngine:
+        return create_async_engine(
+            url=url,
+            echo=environment_config.db_echo,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            pool_size=environment_config.db_pool_size,
+            max_overflow=environment_config.db_max_overflow,
+            pool_timeout=environment_config.db_pool_timeout,
+            pool_recycle=environment_config.db_pool_recycle,
+            pool_pre_ping=environment_config.db_pool_pre_ping,
+        )
+
     # 데이터베이스 엔진 생성
-    engine = create_async_engine(
-        url=environment_config.async_db_url,
-        echo=True,
-    )
+    engine = _create_engine(environment_config.async_db_url)
+
+    # 읽기 전용 replica 엔진 생성 (설정된 경우에만)
+    replica_engine = _create_engine(environment_config.async_replica_db_url) if environment_config.async_replica_db_url else None
+    DatabaseRouter.configure(replica_engine=replica_engine)
 
-    # 세션 팩토리(sessionmaker) 설정
+    # 세션 팩토리(sessionmaker) 설정 | 읽기는 replica, 쓰기는 primary 로 라우팅
     async_session_factory = sessionmaker(
         bind=engine,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
         expire_on_commit=False,
     )
 
@@ -23,4 +43,16 @@ class Database:
     @staticmethod
     async def get_session() -> AsyncGenerator[AsyncSession, None]:
         async with Database.async_session_factory() as session:
-            yield session
\ No newline at end of file
+            yield session
+
+    # 커넥션 풀 통계 (체크아웃 수, overflow, 대기 시간)
+    @staticmethod
+    def pool_statistics() -> dict[str, Any]:
+        return Database.engine.pool.statistics()
+
+    # Replica 커넥션 풀 통계
+    @staticmethod
+    def replica_pool_statistics() -> dict[str, Any]:
+        if Database.replica_engine is None:
+            return {}
+        return {**Database.replica_engine.pool.statistics(), "healthy": DatabaseRouter.replica_healthy}
\ No newline at end of file
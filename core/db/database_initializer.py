@@ -2,11 +2,12 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from core.db.database import Database
-from core.db.base import Base
+from core.db.migration.schema_migrator import SchemaMigrator
+from core.config.environment.environment_config import environment_config
 from core.config.logging.logger_config import LoggerConfig
 
 
-# DB 초기화 및 연결 검증을 담당하는 클래스
+# DB 연결 및 스키마 버전 검증을 담당하는 클래스
 class DatabaseInitializer:
 
     # 로거 정의
@@ -18,13 +19,27 @@ class DatabaseInitializer:
         DatabaseInitializer.logger.info("데이터베이스 초기화 시작")
 
         try:
-            async with Database.engine.begin() as conn:
-                # 테이블 생성
-                await conn.run_sync(Base.metadata.create_all)
-            DatabaseInitializer.logger.info("데이터베이스 연결 성공")
-            
+            # 개발 환경에서만 시작 시 마이그레이션 실행 (잠금으로 워커 간 중복 실행 방지)
+            if environment_config.db_auto_migrate:
+                await SchemaMigrator.upgrade(engine=Database.engine)
+
+            # 스키마 버전만 확인 (테이블 생성/리플렉션 없음)
+            await SchemaMigrator.verify(engine=Database.engine)
+            DatabaseInitializer.logger.info("데이터베이스 연결 및 스키마 버전 확인 완료")
+
         except Exception as e:
-            DatabaseInitializer.logger.exception(f"데이터베이스 연결 실패: {e}")
+            # DB 에 연결할 수 없거나 스키마가 맞지 않으면 서버를 시작하지 않음
+            DatabaseInitializer.logger.exception("데이터베이스 초기화 실패, 서버를 시작하지 않습니다: %s", e)
+            raise
+
+        try:
+            yield  # 애플리케이션 실행 중
 
-        yield  # 애플리케이션 실행 중
-        DatabaseInitializer.logger.info("데이터베이스 세션 종료 및 자원 정리 완료")
+        finally:
+            # 커넥션 풀 정리 (애플리케이션 실행 / 종료 처리 중 예외가 발생해도 실행)
+            try:
+                await Database.engine.dispose()
+            finally:
+                if Database.replica_engine is not None:
+                    await Database.replica_engine.dispose()
+            DatabaseInitializer.logger.info("데이터베이스 세션 종료 및 자원 정리 완료")
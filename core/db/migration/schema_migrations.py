@@ -0,0 +1,92 @@
+from typing import Callable
+from sqlalchemy import CHAR, Column, Connection, DateTime, Integer, MetaData, String, Table, inspect, text
+
+
+# 버전별 스키마 변경 정의
+# 각 마이그레이션은 해당 시점의 스키마를 직접 정의하며, 이미 적용된 변경은 건너뛰도록 작성
+class SchemaMigrations:
+
+    USER_TABLE: str = "fastapi_jwt_example"
+    REFRESH_TOKEN_TABLE: str = "fastapi_jwt_example_refresh_token"
+
+    # 테이블 존재 여부
+    @staticmethod
+    def has_table(conn: Connection, table: str) -> bool:
+        return inspect(conn).has_table(table)
+
+    # 컬럼 존재 여부
+    @staticmethod
+    def has_column(conn: Connection, table: str, column: str) -> bool:
+        return any(col["name"] == column for col in inspect(conn).get_columns(table))
+
+    # v1: 사용자 테이블 생성
+    @staticmethod
+    def v1_create_user_table(conn: Connection) -> None:
+        metadata = MetaData()
+        Table(
+            SchemaMigrations.USER_TABLE, metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True, index=True),
+            Column("user_id", String(length=1000), nullable=False, unique=True),
+            Column("username", String(length=1000), nullable=False),
+            Column("email", String(length=1000), nullable=False, unique=True),
+            Column("password", String(length=1000), nullable=False),
+            Column("bio", String(length=1000), nullable=False),
+            Column("access_token", String(length=1000), nullable=True),
+            Column("refresh_token", String(length=1000), nullable=True),
+        )
+        metadata.create_all(conn, checkfirst=True)
+
+    # v2: Refresh Token 테이블 분리, 사용자 테이블의 토큰 컬럼 제거
+    @staticmethod
+    def v2_split_refresh_token_table(conn: Connection) -> None:
+        metadata = MetaData()
+        Table(
+            SchemaMigrations.REFRESH_TOKEN_TABLE, metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("token_hash", CHAR(length=64), nullable=False, unique=True),
+            Column("user_id", String(length=1000), nullable=False, index=True),
+            Column("expires_at", DateTime, nullable=False, index=True),
+        )
+        metadata.create_all(conn, checkfirst=True)
+
+        for column in ("access_token", "refresh_token"):
+            if SchemaMigrations.has_column(conn, SchemaMigrations.USER_TABLE, column):
+                conn.execute(text(f"ALTER TABLE {SchemaMigrations.USER_TABLE} DROP COLUMN {column}"))
+
+    # v3: 사용자 테이블에 행 버전 컬럼 추가
+    @staticmethod
+    def v3_add_user_version(conn: Connection) -> None:
+        if not SchemaMigrations.has_column(conn, SchemaMigrations.USER_TABLE, "version"):
+            conn.execute(text(f"ALTER TABLE {SchemaMigrations.USER_TABLE} ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+    # v4: 사용자 / Refresh Token 마지막 사용 시각 컬럼 추가
+    @staticmethod
+    def v4_add_last_activity(conn: Connection) -> None:
+        for table, column in ((SchemaMigrations.USER_TABLE, "last_seen_at"), (SchemaMigrations.REFRESH_TOKEN_TABLE, "last_used_at")):
+            if not SchemaMigrations.has_column(conn, table, column):
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} DATETIME NULL"))
+
+    # v5: Refresh Token 의 user_id 를 사용자 테이블과 같은 길이로 확장 (v2 를 String(36) 으로 적용한 DB 용)
+    @staticmethod
+    def v5_widen_refresh_token_user_id(conn: Connection) -> None:
+        # SQLite 는 VARCHAR 길이를 강제하지 않으므로 변경 불필요
+        if conn.dialect.name != "mysql":
+            return
+
+        column = next(col for col in inspect(conn).get_columns(SchemaMigrations.REFRESH_TOKEN_TABLE) if col["name"] == "user_id")
+        if (getattr(column["type"], "length", None) or 0) < 1000:
+            conn.execute(text(f"ALTER TABLE {SchemaMigrations.REFRESH_TOKEN_TABLE} MODIFY COLUMN user_id VARCHAR(1000) NOT NULL"))
+
+    # (버전, 설명, 적용 함수) 목록, 버전 오름차순
+    MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+        (1, "create user table", v1_create_user_table),
+        (2, "split refresh token table", v2_split_refresh_token_table),
+        (3, "add user version", v3_add_user_version),
+        (4, "add last activity columns", v4_add_last_activity),
+        (5, "widen refresh token user_id", v5_widen_refresh_token_user_id),
+    ]
+
+    # 최신 스키마 버전
+    @staticmethod
+    def latest_version() -> int:
+        return SchemaMigrations.MIGRATIONS[-1][0]
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+from sqlalchemy import Column, Connection, Integer, MetaData, Table, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from core.db.migration.schema_migrations import SchemaMigrations
+from core.config.logging.logger_config import LoggerConfig
+
+
+# 스키마 버전 확인 및 마이그레이션 실행을 담당하는 클래스
+# 배포 시 한 번 실행: python -m core.db.migration.schema_migrator upgrade
+class SchemaMigrator:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.db.migration.schema_migrator")
+
+    LOCK_NAME: str = "fastapi_jwt_example_schema_migration"
+    LOCK_TIMEOUT: int = 60  # 다른 프로세스의 마이그레이션 완료 대기 시간 (초)
+
+    # 스키마 버전 테이블 (한 행만 저장)
+    _metadata = MetaData()
+    version_table = Table(
+        "schema_version", _metadata,
+        Column("version", Integer, nullable=False),
+    )
+
+    # 현재 스키마 버전 조회 (버전 테이블이 없으면 0)
+    @staticmethod
+    def _current_version(conn: Connection) -> int:
+        if not SchemaMigrations.has_table(conn, SchemaMigrator.version_table.name):
+            return 0
+        return conn.execute(select(SchemaMigrator.version_table.c.version)).scalar() or 0
+
+    # 여러 프로세스가 동시에 마이그레이션하지 않도록 잠금 (MySQL GET_LOCK)
+    @staticmethod
+    def _acquire_lock(conn: Connection) -> None:
+        if conn.dialect.name != "mysql":
+            return
+
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": SchemaMigrator.LOCK_NAME, "timeout": SchemaMigrator.LOCK_TIMEOUT}
+        ).scalar()
+
+        if acquired != 1:
+            raise RuntimeError("스키마 마이그레이션 잠금을 얻지 못했습니다.")
+
+    @staticmethod
+    def _release_lock(conn: Connection) -> None:
+        if conn.dialect.name == "mysql":
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": SchemaMigrator.LOCK_NAME})
+
+    # 미적용 마이그레이션 실행 (동기 커넥션)
+    @staticmethod
+    def _upgrade(conn: Connection) -> int:
+        SchemaMigrator._acquire_lock(conn)
+        try:
+            SchemaMigrator._metadata.create_all(conn, checkfirst=True)
+            current = SchemaMigrator._current_version(conn)
+
+            if conn.execute(select(SchemaMigrator.version_table.c.version)).first() is None:
+                conn.execute(SchemaMigrator.version_table.insert().values(version=0))
+            conn.commit()
+
+            for version, description, migrate in SchemaMigrations.MIGRATIONS:
+                if version <= current:
+                    continue
+
+                SchemaMigrator.logger.info("스키마 마이그레이션 적용: v%d (%s)", version, description)
+                migrate(conn)
+                conn.execute(SchemaMigrator.version_table.update().values(version=version))
+                conn.commit()
+                current = version
+
+            return current
+
+        finally:
+            SchemaMigrator._release_lock(conn)
+
+    # 마이그레이션 실행
+    @staticmethod
+    async def upgrade(engine: AsyncEngine) -> int:
+        async with engine.connect() as conn:
+            version = await conn.run_sync(SchemaMigrator._upgrade)
+        SchemaMigrator.logger.info("스키마 버전: v%d", version)
+        return version
+
+    # 현재 스키마 버전 조회
+    @staticmethod
+    async def current_version(engine: AsyncEngine) -> int:
+        async with engine.connect() as conn:
+            return await conn.run_sync(SchemaMigrator._current_version)
+
+    # 워커 시작 시 스키마 버전만 확인 (DB 에 연결할 수 없거나 버전이 낮으면 예외)
+    @staticmethod
+    async def verify(engine: AsyncEngine) -> None:
+        async with engine.connect() as conn:
+            current = (await conn.execute(select(SchemaMigrator.version_table.c.version))).scalar() or 0
+
+        latest = SchemaMigrations.latest_version()
+        if current < latest:
+            raise RuntimeError(
+                f"스키마 버전(v{current})이 필요한 버전(v{latest})보다 낮습니다. "
+                "python -m core.db.migration.schema_migrator upgrade 를 먼저 실행하세요."
+            )
+
+
+if __name__ == "__main__":
+    from core.db.database import Database
+
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument("command", choices=["upgrade", "current"], help="upgrade: 마이그레이션 실행, current: 현재 버전 출력")
+    args = parser.parse_args()
+
+    async def main() -> None:
+        try:
+            if args.command == "upgrade":
+                await SchemaMigrator.upgrade(engine=Database.engine)
+            else:
+                print(f"v{await SchemaMigrator.current_version(engine=Database.engine)} (최신: v{SchemaMigrations.latest_version()})")
+        finally:
+            await Database.engine.dispose()
+
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+import time
+from typing import Any
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# 커넥션 체크아웃 대기 시간을 기록하는 커넥션 풀
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_count: int = 0        # 체크아웃 횟수
+        self.total_wait: float = 0.0        # 누적 대기 시간 (초)
+        self.max_wait: float = 0.0          # 최대 대기 시간 (초)
+        self.failed_count: int = 0          # 대기 시간 초과 또는 연결 실패 횟수
+
+    # 풀에서 커넥션을 꺼낼 때까지 걸린 시간 기록 (새 커넥션 생성 시간 포함)
+    def _do_get(self) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+
+        except Exception:
+            self.failed_count += 1
+            raise
+
+        finally:
+            wait = time.perf_counter() - started_at
+            self.checkout_count += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    # 현재 풀 상태
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "checkout_count": self.checkout_count,
+            "failed_count": self.failed_count,
+            "avg_wait_seconds": self.total_wait / self.checkout_count if self.checkout_count else 0.0,
+            "max_wait_seconds": self.max_wait,
+        }
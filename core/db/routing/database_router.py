@@ -0,0 +1,95 @@
+import asyncio
+from typing import Any
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+from core.db.routing.primary_sticky_context import primary_sticky_context
+
+
+# 읽기 쿼리를 replica 로, 쓰기 쿼리를 primary 로 보내는 라우팅 규칙
+class DatabaseRouter:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.db.routing.database_router")
+
+    STICKY_SECONDS: float = environment_config.db_replica_sticky_seconds  # 쓰기 후 같은 클라이언트가 primary 에서 읽는 시간 (초)
+    HEALTH_INTERVAL: float = environment_config.db_replica_health_interval
+
+    # session.info 키
+    WROTE_KEY: str = "router_wrote"             # 이 세션에서 쓰기가 발생함 (이후 읽기는 primary)
+    FORCE_PRIMARY_KEY: str = "router_primary"   # 이 세션의 모든 쿼리를 primary 로 보냄
+
+    replica_engine: AsyncEngine | None = None
+    replica_healthy: bool = True
+
+    # replica 엔진 설정
+    @classmethod
+    def configure(cls, replica_engine: AsyncEngine | None) -> None:
+        cls.replica_engine = replica_engine
+
+    # 쿼리를 실행할 엔진 선택, primary 를 사용해야 하면 None 반환
+    @classmethod
+    def select_bind(cls, session: Session, clause: Any) -> Engine | None:
+        # 쓰기 쿼리 / flush(clause 없이 변경 대기 객체가 있는 경우)는 primary
+        # 이후 같은 세션의 읽기도 primary, 같은 클라이언트의 다음 요청도 일정 시간 primary (read-your-writes)
+        if getattr(clause, "is_dml", False) or (clause is None and (session.new or session.dirty or session.deleted)):
+            session.info[cls.WROTE_KEY] = True
+            cls.mark_write()
+            return None
+
+        if cls.replica_engine is None or not cls.replica_healthy:
+            return None
+
+        if session.info.get(cls.WROTE_KEY) or session.info.get(cls.FORCE_PRIMARY_KEY):
+            return None
+
+        sticky = primary_sticky_context.get()
+        if sticky is not None and sticky.sticky:
+            return None
+
+        if not getattr(clause, "is_select", False):
+            return None
+
+        return cls.replica_engine.sync_engine
+
+    # 세션의 이후 쿼리를 primary 로 고정
+    @classmethod
+    def use_primary(cls, session: Any) -> None:
+        session.info[cls.FORCE_PRIMARY_KEY] = True
+
+    # 현재 요청에서 쓰기가 발생했음을 기록 (PrimaryStickyMiddleware 가 응답에 고정 쿠키 설정)
+    @classmethod
+    def mark_write(cls) -> None:
+        sticky = primary_sticky_context.get()
+        if sticky is not None:
+            sticky.wrote = True
+
+    # replica 상태 확인 (실패 시 primary 로 대체)
+    @classmethod
+    async def check_replica(cls) -> bool:
+        if cls.replica_engine is None:
+            return False
+
+        try:
+            async with asyncio.timeout(cls.HEALTH_INTERVAL):
+                async with cls.replica_engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            healthy = True
+
+        except Exception as e:
+            cls.logger.warning("Replica 상태 확인 실패, primary 로 대체합니다: %s", e)
+            healthy = False
+
+        if healthy != cls.replica_healthy:
+            cls.logger.info("Replica 상태 변경: %s", "정상" if healthy else "비정상")
+        cls.replica_healthy = healthy
+        return healthy
+
+    # 주기적으로 replica 상태 확인 (lifespan 에서 태스크로 실행)
+    @classmethod
+    async def run_health_check(cls) -> None:
+        while True:
+            await cls.check_replica()
+            await asyncio.sleep(cls.HEALTH_INTERVAL)
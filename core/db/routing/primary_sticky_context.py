@@ -0,0 +1,14 @@
+from contextvars import ContextVar
+
+# 요청 하나의 primary 고정 상태 (read-your-writes)
+class PrimarySticky:
+
+    __slots__ = ("sticky", "wrote")
+
+    def __init__(self, sticky: bool):
+        self.sticky: bool = sticky  # 최근 쓰기가 있었던 클라이언트의 요청 (모든 읽기를 primary 로)
+        self.wrote: bool = False    # 이 요청에서 쓰기가 발생함 (응답에 고정 쿠키 설정)
+
+
+# 현재 요청의 PrimarySticky (SQLAlchemy greenlet 에서도 같은 컨텍스트가 전달됨)
+primary_sticky_context: ContextVar[PrimarySticky | None] = ContextVar("primary_sticky_context", default=None)
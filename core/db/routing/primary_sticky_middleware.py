@@ -0,0 +1,50 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.db.routing.database_router import DatabaseRouter
+from core.db.routing.primary_sticky_context import PrimarySticky, primary_sticky_context
+
+
+# 쓰기가 발생한 클라이언트의 이후 요청을 일정 시간 primary 에서 읽도록 하는 ASGI 미들웨어
+# 고정 상태를 쿠키로 전달하므로 다른 워커 / 인스턴스가 요청을 받아도 유지됨
+class PrimaryStickyMiddleware:
+
+    COOKIE_NAME: str = "db_primary_until"  # 값: primary 고정 만료 시각 (epoch 초)
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    # 요청 쿠키에서 고정 만료 시각 추출 (클라이언트가 임의로 늘리지 못하도록 STICKY_SECONDS 이내만 인정)
+    @staticmethod
+    def _is_sticky(scope: Scope) -> bool:
+        now = time.time()
+        for name, value in scope["headers"]:
+            if name != b"cookie":
+                continue
+
+            for part in value.decode("latin-1").split(";"):
+                key, _, raw = part.strip().partition("=")
+                if key == PrimaryStickyMiddleware.COOKIE_NAME and raw.isdigit():
+                    return now < int(raw) <= now + DatabaseRouter.STICKY_SECONDS
+
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or DatabaseRouter.replica_engine is None:
+            await self.app(scope, receive, send)
+            return
+
+        state = PrimarySticky(sticky=PrimaryStickyMiddleware._is_sticky(scope))
+        token = primary_sticky_context.set(state)
+
+        async def send_wrapper(message: Message) -> None:
+            # 이 요청에서 쓰기가 있었으면 고정 쿠키 설정 (헤더 전송 시점까지 발생한 쓰기 기준)
+            if message["type"] == "http.response.start" and state.wrote:
+                until = int(time.time() + DatabaseRouter.STICKY_SECONDS)
+                cookie = f"{PrimaryStickyMiddleware.COOKIE_NAME}={until}; Max-Age={int(DatabaseRouter.STICKY_SECONDS)}; Path=/; HttpOnly; SameSite=Lax"
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            primary_sticky_context.reset(token)
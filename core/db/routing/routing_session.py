@@ -0,0 +1,16 @@
+from typing import Any
+from sqlalchemy.orm import Session
+from core.db.routing.database_router import DatabaseRouter
+
+
+# DatabaseRouter 규칙에 따라 쿼리별로 엔진을 선택하는 세션
+class RoutingSession(Session):
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        # bind 가 명시된 경우에는 그대로 사용
+        if kw.get("bind") is None:
+            replica = DatabaseRouter.select_bind(session=self, clause=clause)
+            if replica is not None:
+                return replica
+
+        return super().get_bind(mapper, clause=clause, **kw)
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Hashable
+from sqlalchemy import Executable
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+from core.db.database import Database
+
+
+# 요청 경로에서 분리된 지연 쓰기 버퍼 (같은 키의 변경은 마지막 값으로 합쳐 주기적으로 executemany 실행)
+# 보안상 즉시 반영되어야 하는 쓰기(토큰 발급 / 폐기 등)에는 사용하지 않음
+class WriteBehindBuffer:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.db.write_behind.write_behind_buffer")
+
+    ENABLED: bool = environment_config.write_behind_enabled  # False 면 기록하지 않음 (요청 경로에 쓰기를 추가하지 않음)
+    INTERVAL: float = environment_config.write_behind_interval
+    MAX_PENDING: int = environment_config.write_behind_max_pending  # 버퍼별 최대 대기 키 수
+    BATCH_SIZE: int = environment_config.write_behind_batch_size    # executemany 한 번에 보낼 행 수
+
+    _buffers: list["WriteBehindBuffer"] = []
+    _flush_requested = asyncio.Event()
+
+    def __init__(self, name: str, statement: Executable):
+        self.name = name
+        self.statement = statement
+        self._pending: dict[Hashable, dict[str, Any]] = {}  # key -> 마지막 파라미터
+
+        # 통계 값
+        self.flushed = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+        WriteBehindBuffer._buffers.append(self)
+
+    # 파라미터 목록을 한 트랜잭션에서 배치 단위로 실행
+    async def _execute(self, params: list[dict[str, Any]]) -> None:
+        async with Database.engine.begin() as conn:
+            for start in range(0, len(params), self.BATCH_SIZE):
+                await conn.execute(self.statement, params[start:start + self.BATCH_SIZE])
+
+    # 변경 기록 (같은 키가 대기 중이면 덮어씀), 버퍼가 가득 차면 새 키는 버리고 즉시 flush 요청
+    async def add(self, key: Hashable, params: dict[str, Any]) -> None:
+        if not self.ENABLED:
+            return
+
+        if key in self._pending:
+            self.coalesced += 1
+        elif len(self._pending) >= self.MAX_PENDING:
+            self.dropped += 1
+            WriteBehindBuffer._flush_requested.set()
+            return
+
+        self._pending[key] = params
+
+    # 대기 중인 변경 실행, 실패하면 더 새로운 값을 덮어쓰지 않는 범위에서 버퍼로 되돌림
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        try:
+            await self._execute(list(pending.values()))
+        except BaseException:  # 종료 중 취소된 경우도 포함
+            for key, params in pending.items():
+                if len(self._pending) < self.MAX_PENDING:
+                    self._pending.setdefault(key, params)
+                else:
+                    self.dropped += 1
+            raise
+
+        self.flushed += len(pending)
+        return len(pending)
+
+    # 등록된 모든 버퍼 실행 (종료 시에도 호출)
+    @classmethod
+    async def flush_all(cls) -> None:
+        for buffer in cls._buffers:
+            try:
+                await buffer.flush()
+            except Exception as e:
+                cls.logger.warning("지연 쓰기 실패 (buffer=%s, pending=%d): %s", buffer.name, len(buffer._pending), e)
+
+    # 주기적 실행 (애플리케이션 실행 중 백그라운드 태스크로 실행)
+    @classmethod
+    async def run_flush(cls) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(cls._flush_requested.wait(), timeout=cls.INTERVAL)
+            except TimeoutError:
+                pass
+
+            cls._flush_requested.clear()
+            await cls.flush_all()
+
+    # 버퍼별 대기 / 처리 통계
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        stats: dict[str, Any] = {"enabled": cls.ENABLED}
+        for buffer in cls._buffers:
+            stats[f"{buffer.name}_pending"] = len(buffer._pending)
+            stats[f"{buffer.name}_flushed"] = buffer.flushed
+            stats[f"{buffer.name}_coalesced"] = buffer.coalesced
+            stats[f"{buffer.name}_dropped"] = buffer.dropped
+        return stats
@@ -1,8 +1,10 @@
+import re
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm.exc import StaleDataError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from core.config.logging.logger_config import LoggerConfig
 
@@ -12,6 +14,30 @@ class CoreExceptionHandler:
 
     logger = LoggerConfig.get_logger("core.exception.core_exception_handler")
 
+    # 고유 제약 조건 위반 컬럼별 응답 메시지
+    UNIQUE_CONFLICT_MESSAGES: dict[str, str] = {
+        "email": "이미 등록된 이메일입니다.",
+        "user_id": "사용자 고유 ID 생성 과정에서 문제가 발생했습니다. 잠시 후 다시시도하세요.",
+    }
+    DEFAULT_CONFLICT_MESSAGE: str = "데이터베이스에 이미 존재하는 데이터입니다."
+
+    # 위반된 컬럼(키) 이름 추출 (MySQL / SQLite / PostgreSQL)
+    UNIQUE_CONFLICT_PATTERN = re.compile(
+        r"for key '(?:\w+\.)?(\w+)'"
+        r"|UNIQUE constraint failed: \w+\.(\w+)"
+        r"|Key \((\w+)\)="
+    )
+
+    # IntegrityError 에서 충돌 메시지 결정
+    @staticmethod
+    def resolve_conflict_message(exc: IntegrityError) -> str:
+        match = CoreExceptionHandler.UNIQUE_CONFLICT_PATTERN.search(str(exc.orig))
+        if match:
+            column = next(group for group in match.groups() if group)
+            return CoreExceptionHandler.UNIQUE_CONFLICT_MESSAGES.get(column, CoreExceptionHandler.DEFAULT_CONFLICT_MESSAGE)
+
+        return CoreExceptionHandler.DEFAULT_CONFLICT_MESSAGE
+
     @staticmethod
     def register(app: FastAPI):
 
@@ -19,7 +45,7 @@ class CoreExceptionHandler:
         @app.exception_handler(RequestValidationError)
         async def handle_validation_error(request: Request, exc: RequestValidationError):
             msg = exc.errors()[0].get("msg", "요청 데이터의 형식이 올바르지 않습니다.")
-            CoreExceptionHandler.logger.error(f"[ValidationError]: '{msg}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[ValidationError]: '%s' (URL: %s)", msg, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -33,7 +59,7 @@ class CoreExceptionHandler:
         @app.exception_handler(ValidationError)
         async def handle_pydantic_error(request: Request, exc: ValidationError):
             msg = str(exc.errors()[0].get("msg", "데이터 유효성 검증 실패"))
-            CoreExceptionHandler.logger.error(f"[PydanticError]: '{msg}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[PydanticError]: '%s' (URL: %s)", msg, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -46,20 +72,33 @@ class CoreExceptionHandler:
         # SQL 제약 조건 위반 (IntegrityError)
         @app.exception_handler(IntegrityError)
         async def handle_integrity_error(request: Request, exc: IntegrityError):
-            CoreExceptionHandler.logger.error(f"[IntegrityError]: '{exc}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[IntegrityError]: '%s' (URL: %s)", exc, request.url)
+
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content={
+                    "status": "CONFLICT",
+                    "message": CoreExceptionHandler.resolve_conflict_message(exc),
+                },
+            )
+
+        # 동시 수정 충돌 (StaleDataError, 조회한 버전이 이미 변경됨)
+        @app.exception_handler(StaleDataError)
+        async def handle_stale_data_error(request: Request, exc: StaleDataError):
+            CoreExceptionHandler.logger.warning("[StaleDataError]: '%s' (URL: %s)", exc, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_409_CONFLICT,
                 content={
                     "status": "CONFLICT",
-                    "message": "데이터베이스에 이미 존재하는 데이터입니다.",
+                    "message": "다른 요청에 의해 이미 변경되었습니다. 최신 정보를 다시 조회한 뒤 시도해주세요.",
                 },
             )
 
         # DB 연결 실패 (OperationalError)
         @app.exception_handler(OperationalError)
         async def handle_db_connection_error(request: Request, exc: OperationalError):
-            CoreExceptionHandler.logger.error(f"[OperationalError]: '{exc}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[OperationalError]: '%s' (URL: %s)", exc, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -72,7 +111,7 @@ class CoreExceptionHandler:
         # 잘못된 인자나 로직 오류
         @app.exception_handler(ValueError)
         async def handle_value_error(request: Request, exc: ValueError):
-            CoreExceptionHandler.logger.error(f"[ValueError]: '{exc}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[ValueError]: '%s' (URL: %s)", exc, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -85,7 +124,7 @@ class CoreExceptionHandler:
         # 인증 실패 또는 권한 부족
         @app.exception_handler(PermissionError)
         async def handle_permission_error(request: Request, exc: PermissionError):
-            CoreExceptionHandler.logger.error(f"[PermissionError]: '{exc}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[PermissionError]: '%s' (URL: %s)", exc, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -98,7 +137,7 @@ class CoreExceptionHandler:
         # HTTPException (FastAPI/Starlette 기본 예외)
         @app.exception_handler(StarletteHTTPException)
         async def handle_http_exception(request: Request, exc: StarletteHTTPException):
-            CoreExceptionHandler.logger.error(f"[HTTPException]: '{exc.detail}' (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[HTTPException]: '%s' (URL: %s)", exc.detail, request.url)
 
             return JSONResponse(
                 status_code=exc.status_code,
@@ -106,12 +145,13 @@ class CoreExceptionHandler:
                     "status": "HTTP_ERROR",
                     "message": exc.detail or "HTTP 요청 처리 중 오류가 발생했습니다.",
                 },
+                headers=getattr(exc, "headers", None),  # Retry-After 등 예외에 지정된 헤더 유지
             )
 
         # 처리되지 않은 예외 (서버 내부 오류)
         @app.exception_handler(Exception)
         async def handle_unhandled_exception(request: Request, exc: Exception):
-            CoreExceptionHandler.logger.error(f"[UnhandledException]: '{type(exc).__name__}': {exc} (URL: {request.url})")
+            CoreExceptionHandler.logger.error("[UnhandledException]: '%s': %s (URL: %s)", type(exc).__name__, exc, request.url)
 
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
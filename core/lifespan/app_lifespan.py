@@ -0,0 +1,69 @@
+import asyncio
+from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Awaitable, Callable
+from core.db.database import Database
+from core.db.database_initializer import DatabaseInitializer
+from core.db.routing.database_router import DatabaseRouter
+from core.cache.redis.redis_client_provider import RedisClientProvider
+from core.security.auth.revocation_index import RevocationIndex
+from core.security.jwt.jwt_key_store import JWTKeyStore
+from core.db.write_behind.write_behind_buffer import WriteBehindBuffer
+from core.security.password.password_hash_executor import PasswordHashExecutor
+from core.config.logging.logger_config import LoggerConfig
+
+
+# 애플리케이션 시작/종료 시 필요한 자원을 관리하는 클래스
+class AppLifespan:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.lifespan.app_lifespan")
+
+    # 애플리케이션 실행 중 함께 실행할 백그라운드 태스크 (도메인 계층에서 등록)
+    background_tasks: list[Callable[[], Awaitable[None]]] = []
+
+    # 백그라운드 태스크 등록 (종료 시 취소됨)
+    @classmethod
+    def register_background_task(cls, task: Callable[[], Awaitable[None]]) -> None:
+        cls.background_tasks.append(task)
+
+    @staticmethod
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+        # JWT 키 파싱 (키 설정이 잘못되었으면 시작하지 않음)
+        JWTKeyStore.load()
+
+        async with DatabaseInitializer.db_lifespan(app):
+            # Replica 상태 확인 태스크 시작 (replica 가 설정된 경우)
+            health_check_task = asyncio.create_task(DatabaseRouter.run_health_check()) if Database.replica_engine is not None else None
+
+            # 폐기 목록 동기화 / 만료 항목 정리 태스크 시작
+            revocation_sync_task = asyncio.create_task(RevocationIndex.run_sync())
+
+            # 지연 쓰기 flush 태스크 시작 (사용하는 경우)
+            write_behind_task = asyncio.create_task(WriteBehindBuffer.run_flush()) if WriteBehindBuffer.ENABLED else None
+
+            # 등록된 백그라운드 태스크 시작
+            registered_tasks = [asyncio.create_task(task()) for task in AppLifespan.background_tasks]
+
+            try:
+                yield  # 애플리케이션 실행 중
+
+            finally:
+                if health_check_task is not None:
+                    health_check_task.cancel()
+                revocation_sync_task.cancel()
+                for task in registered_tasks:
+                    task.cancel()
+
+                # 남은 지연 쓰기 반영 (커넥션 풀 정리 전에 실행)
+                if write_behind_task is not None:
+                    write_behind_task.cancel()
+                    await asyncio.gather(write_behind_task, return_exceptions=True)
+                await WriteBehindBuffer.flush_all()
+
+                # 비밀번호 해싱 작업자 풀 종료
+                PasswordHashExecutor.shutdown()
+                # Redis 연결 종료
+                await RedisClientProvider.close()
+                AppLifespan.logger.info("애플리케이션 자원 정리 완료")
@@ -0,0 +1,67 @@
+from core.metrics.metrics_registry import Counter, Histogram, MetricsRegistry
+
+# 애플리케이션 전역 메트릭 정의
+class AppMetrics:
+
+    # 라우트별 요청 처리 시간
+    http_request_duration = MetricsRegistry.register(Histogram(
+        name="http_request_duration_seconds",
+        documentation="HTTP request latency by route",
+        label_names=("method", "route", "status"),
+    ))
+
+    # 요청당 SQL 실행 횟수
+    db_statements_per_request = MetricsRegistry.register(Histogram(
+        name="db_statements_per_request",
+        documentation="Number of SQL statements executed per request",
+        label_names=("method", "route"),
+        buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21),
+    ))
+
+    # 요청당 SQL 실행 시간 합계
+    db_time_per_request = MetricsRegistry.register(Histogram(
+        name="db_time_per_request_seconds",
+        documentation="Total SQL statement time per request",
+        label_names=("method", "route"),
+    ))
+
+    # SQL 실행 시간 (요청 외부 실행 포함)
+    db_statement_duration = MetricsRegistry.register(Histogram(
+        name="db_statement_duration_seconds",
+        documentation="SQL statement execution time",
+    ))
+
+    # Argon2 해싱/검증 연산 시간 (작업자 내부 실행 시간)
+    password_hash_duration = MetricsRegistry.register(Histogram(
+        name="password_hash_duration_seconds",
+        documentation="Argon2 hash/verify execution time",
+        label_names=("operation",),
+    ))
+
+    # Argon2 작업자 풀 대기 시간
+    password_hash_queue_wait = MetricsRegistry.register(Histogram(
+        name="password_hash_queue_wait_seconds",
+        documentation="Time spent waiting for a password hash worker",
+    ))
+
+    # JWT 검증 시간
+    jwt_verify_duration = MetricsRegistry.register(Histogram(
+        name="jwt_verify_duration_seconds",
+        documentation="JWT verification time",
+        label_names=("cached",),
+        buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005),
+    ))
+
+    # 처리된 요청 수
+    http_requests_total = MetricsRegistry.register(Counter(
+        name="http_requests_total",
+        documentation="Total HTTP requests by route",
+        label_names=("method", "route", "status"),
+    ))
+
+    # 요청 제한으로 거절된 요청 수
+    rate_limit_rejected_total = MetricsRegistry.register(Counter(
+        name="rate_limit_rejected_total",
+        documentation="Requests rejected by the rate limiter",
+        label_names=("route", "scope"),
+    ))
@@ -0,0 +1,45 @@
+import time
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from core.metrics.app_metrics import AppMetrics
+from core.metrics.request_metrics_context import request_metrics_context
+
+
+# 엔진 이벤트로 SQL 실행 횟수/시간을 기록하는 클래스
+class DatabaseMetrics:
+
+    START_TIME_KEY: str = "metrics_query_start_time"
+
+    # 엔진에 이벤트 등록
+    @staticmethod
+    def instrument(engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", DatabaseMetrics._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", DatabaseMetrics._after_cursor_execute)
+        event.listen(engine.sync_engine, "handle_error", DatabaseMetrics._handle_error)
+
+    @staticmethod
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault(DatabaseMetrics.START_TIME_KEY, []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info[DatabaseMetrics.START_TIME_KEY].pop()
+        AppMetrics.db_statement_duration.observe(elapsed)
+
+        # 요청 처리 중이면 요청 단위 통계에 누적
+        request_metrics = request_metrics_context.get()
+        if request_metrics is not None:
+            request_metrics.statement_count += 1
+            request_metrics.statement_seconds += elapsed
+
+    # 실패한 SQL 은 after_cursor_execute 가 호출되지 않으므로 시작 시각 제거 (풀에 반환된 커넥션에 남지 않도록)
+    @staticmethod
+    def _handle_error(exception_context: Any) -> None:
+        conn = exception_context.connection
+        if conn is None or exception_context.cursor is None:
+            return
+
+        start_times = conn.info.get(DatabaseMetrics.START_TIME_KEY)
+        if start_times:
+            start_times.pop()
@@ -0,0 +1,37 @@
+from typing import Any, Callable
+from fastapi import FastAPI
+from core.db.database import Database
+from core.lifespan.app_lifespan import AppLifespan
+from core.metrics.database_metrics import DatabaseMetrics
+from core.metrics.metrics_controller import MetricsController
+from core.metrics.metrics_middleware import MetricsMiddleware
+from core.metrics.metrics_registry import MetricsRegistry
+from core.security.jwt.jwt_token_cache import JWTTokenCache
+from core.security.password.password_hash_executor import PasswordHashExecutor
+
+
+# 메트릭 수집 설정 클래스
+class MetricsConfig:
+
+    # 미들웨어, DB 이벤트, 통계 수집기, /metrics 라우터 등록
+    @staticmethod
+    def register(app: FastAPI) -> None:
+        app.add_middleware(MetricsMiddleware)
+        DatabaseMetrics.instrument(engine=Database.engine)
+        if Database.replica_engine is not None:
+            DatabaseMetrics.instrument(engine=Database.replica_engine)
+            MetricsConfig.register_collector(name="db_replica_pool", collector=Database.replica_pool_statistics)
+
+        MetricsConfig.register_collector(name="db_pool", collector=Database.pool_statistics)
+        MetricsConfig.register_collector(name="password_hash", collector=PasswordHashExecutor.stats)
+        MetricsConfig.register_collector(name="jwt_cache", collector=JWTTokenCache.stats)
+
+        # 다중 워커면 워커별 사본을 주기적으로 기록 (/metrics 에서 합산)
+        AppLifespan.register_background_task(MetricsRegistry.run_snapshot)
+
+        app.include_router(router=MetricsController().router)
+
+    # 통계 수집 함수 추가 등록 (dict 의 숫자 값이 gauge 로 출력됨)
+    @staticmethod
+    def register_collector(name: str, collector: Callable[[], dict[str, Any]]) -> None:
+        MetricsRegistry.register_collector(name=name, collector=collector)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from core.metrics.metrics_registry import MetricsRegistry
+from core.security.internal.internal_network_dependency import InternalNetworkDependency
+
+# Prometheus 메트릭 조회 라우터 구현
+class MetricsController:
+    def __init__(self):
+
+        # 라우터 인스턴스 생성 (내부 네트워크에서만 접근 가능)
+        self.router = APIRouter(tags=["system"], dependencies=[Depends(InternalNetworkDependency.require)])
+
+        # 라우터 등록
+        self.router.add_api_route(
+            path="/metrics",
+            endpoint=self.metrics,
+            methods=["get"],
+            include_in_schema=False
+        )
+
+    # Prometheus 텍스트 포맷 출력
+    async def metrics(self) -> PlainTextResponse:
+        return PlainTextResponse(
+            content=MetricsRegistry.render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -0,0 +1,46 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.metrics.app_metrics import AppMetrics
+from core.metrics.request_metrics_context import RequestMetrics, request_metrics_context
+
+
+# 라우트별 요청 지연 시간과 요청당 SQL 통계를 기록하는 ASGI 미들웨어
+class MetricsMiddleware:
+
+    UNMATCHED_ROUTE: str = "unmatched"  # 라우트가 없는 요청은 하나로 묶어 라벨 수 제한
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        request_metrics = RequestMetrics()
+        token = request_metrics_context.set(request_metrics)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        finally:
+            elapsed = time.perf_counter() - started_at
+            request_metrics_context.reset(token)
+
+            # 라우터가 매칭한 경로 템플릿 사용 (/api/profile/me 등)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or MetricsMiddleware.UNMATCHED_ROUTE
+            method = scope["method"]
+
+            AppMetrics.http_request_duration.observe(elapsed, method, route_path, status_code)
+            AppMetrics.http_requests_total.inc(method, route_path, status_code)
+            AppMetrics.db_statements_per_request.observe(request_metrics.statement_count, method, route_path)
+            AppMetrics.db_time_per_request.observe(request_metrics.statement_seconds, method, route_path)
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Callable
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+
+
+# Prometheus 텍스트 포맷 라벨 값 이스케이프
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+# 라벨 문자열 생성
+def _format_labels(names: tuple[str, ...], values: tuple[Any, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+# 누적 카운터
+class Counter:
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: Any, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    # 현재 값 사본 (다른 워커와 합산용)
+    def snapshot(self) -> list[list]:
+        with self._lock:
+            return [[list(label_values), value] for label_values, value in self._values.items()]
+
+    # 여러 워커의 사본 합산
+    @staticmethod
+    def merge(snapshots: list[list[list]]) -> dict[tuple, float]:
+        merged: dict[tuple, float] = {}
+        for snapshot in snapshots:
+            for label_values, value in snapshot:
+                key = tuple(label_values)
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+    # merged 가 주어지면 (워커 합산 값) 그 값을 출력
+    def render(self, merged: dict[tuple, float] | None = None) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in (self._values if merged is None else merged).items():
+                lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {value}")
+        return lines
+
+
+# 구간별 분포 히스토그램
+class Histogram:
+
+    DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple, list[float]] = {}  # 라벨 -> [구간별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: Any) -> None:
+        with self._lock:
+            values = self._values.get(label_values)
+            if values is None:
+                values = self._values[label_values] = [0.0] * (len(self.buckets) + 2)
+
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[index] += 1
+                    break
+
+            values[-2] += value
+            values[-1] += 1
+
+    # 현재 값 사본 (다른 워커와 합산용)
+    def snapshot(self) -> list[list]:
+        with self._lock:
+            return [[list(label_values), list(values)] for label_values, values in self._values.items()]
+
+    # 여러 워커의 사본 합산 (같은 코드의 같은 구간을 사용하므로 항목별로 더함)
+    @staticmethod
+    def merge(snapshots: list[list[list]]) -> dict[tuple, list[float]]:
+        merged: dict[tuple, list[float]] = {}
+        for snapshot in snapshots:
+            for label_values, values in snapshot:
+                key = tuple(label_values)
+                current = merged.get(key)
+                merged[key] = list(values) if current is None else [a + b for a, b in zip(current, values)]
+        return merged
+
+    # merged 가 주어지면 (워커 합산 값) 그 값을 출력
+    def render(self, merged: dict[tuple, list[float]] | None = None) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_values, values in (self._values if merged is None else merged).items():
+                cumulative = 0.0
+                for bound, count in zip(self.buckets, values):
+                    cumulative += count
+                    bucket_labels = _format_labels(self.label_names, label_values, 'le="%s"' % bound)
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+
+                labels = _format_labels(self.label_names, label_values)
+                inf_labels = _format_labels(self.label_names, label_values, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{inf_labels} {values[-1]}")
+                lines.append(f"{self.name}_sum{labels} {values[-2]}")
+                lines.append(f"{self.name}_count{labels} {values[-1]}")
+        return lines
+
+
+# 메트릭 등록 및 Prometheus 텍스트 포맷 출력
+# 다중 워커에서는 각 워커가 MULTIPROC_DIR 에 <pid>.json 사본을 기록하고, /metrics 는 모든 사본을 합산해 출력
+# (어느 워커가 응답해도 같은 누적 값이 나오며, 종료된 워커의 카운터도 유지됨)
+class MetricsRegistry:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.metrics.metrics_registry")
+
+    MULTIPROC_DIR: str = environment_config.metrics_multiproc_dir   # 비어 있으면 워커 내 값만 출력
+    SNAPSHOT_INTERVAL: float = environment_config.metrics_snapshot_interval
+
+    _metrics: list[Counter | Histogram] = []
+    _collectors: dict[str, Callable[[], dict[str, Any]]] = {}  # 이름 -> 통계 dict 반환 함수 (gauge로 출력)
+
+    # 메트릭 등록
+    @classmethod
+    def register(cls, metric: Counter | Histogram) -> Counter | Histogram:
+        cls._metrics.append(metric)
+        return metric
+
+    # 통계 수집 함수 등록 (숫자 값만 gauge로 출력)
+    @classmethod
+    def register_collector(cls, name: str, collector: Callable[[], dict[str, Any]]) -> None:
+        cls._collectors[name] = collector
+
+    # 통계 수집 함수의 숫자 값 (gauge 이름 -> 값)
+    @classmethod
+    def _gauges(cls) -> dict[str, float]:
+        gauges: dict[str, float] = {}
+        for name, collector in cls._collectors.items():
+            for key, value in collector().items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if not isinstance(value, (int, float)):
+                    continue
+                gauges[f"app_{name}_{key}"] = value
+        return gauges
+
+    # 현재 워커의 사본을 <pid>.json 으로 기록 (임시 파일 후 교체, 읽는 쪽이 쓰다 만 파일을 보지 않도록)
+    @classmethod
+    def write_snapshot(cls) -> None:
+        pid = os.getpid()
+        snapshot = {
+            "pid": pid,
+            "metrics": {metric.name: metric.snapshot() for metric in cls._metrics},
+            "gauges": cls._gauges(),
+        }
+        path = os.path.join(cls.MULTIPROC_DIR, f"{pid}.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(path + ".tmp", path)
+
+    # 모든 워커의 사본 읽기
+    @classmethod
+    def _read_snapshots(cls) -> list[dict[str, Any]]:
+        snapshots = []
+        for filename in os.listdir(cls.MULTIPROC_DIR):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(cls.MULTIPROC_DIR, filename), encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError) as e:
+                cls.logger.warning("메트릭 사본을 읽을 수 없습니다 (%s): %s", filename, e)
+        return snapshots
+
+    # 실행 중인 프로세스인지 확인 (종료된 워커의 gauge 는 출력하지 않음)
+    @staticmethod
+    def _is_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    # 주기적으로 사본 기록 (다중 워커일 때 lifespan 백그라운드 태스크로 실행, 종료 시 마지막 값 기록)
+    @classmethod
+    async def run_snapshot(cls) -> None:
+        if not cls.MULTIPROC_DIR:
+            return
+
+        try:
+            while True:
+                cls.write_snapshot()
+                await asyncio.sleep(cls.SNAPSHOT_INTERVAL)
+        finally:
+            cls.write_snapshot()
+
+    # 전체 메트릭 출력
+    @classmethod
+    def render(cls) -> str:
+        if cls.MULTIPROC_DIR:
+            return cls._render_multiprocess()
+
+        lines: list[str] = []
+        for metric in cls._metrics:
+            lines.extend(metric.render())
+
+        for metric_name, value in cls._gauges().items():
+            lines.append(f"# TYPE {metric_name} gauge")
+            lines.append(f"{metric_name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    # 모든 워커의 사본을 합산해 출력 (카운터 / 히스토그램은 합계, gauge 는 pid 라벨로 워커별 출력)
+    @classmethod
+    def _render_multiprocess(cls) -> str:
+        cls.write_snapshot()
+        snapshots = cls._read_snapshots()
+
+        lines: list[str] = []
+        for metric in cls._metrics:
+            merged = metric.merge([snapshot["metrics"].get(metric.name, []) for snapshot in snapshots])
+            lines.extend(metric.render(merged=merged))
+
+        gauges: dict[str, list[str]] = {}
+        for snapshot in snapshots:
+            if not cls._is_alive(snapshot["pid"]):
+                continue
+            for metric_name, value in snapshot["gauges"].items():
+                gauges.setdefault(metric_name, []).append(f'{metric_name}{{pid="{snapshot["pid"]}"}} {value}')
+
+        for metric_name, samples in gauges.items():
+            lines.append(f"# TYPE {metric_name} gauge")
+            lines.extend(samples)
+
+        return "\n".join(lines) + "\n"
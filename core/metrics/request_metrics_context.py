@@ -0,0 +1,14 @@
+from contextvars import ContextVar
+
+# 요청 하나에서 누적되는 SQL 통계
+class RequestMetrics:
+
+    __slots__ = ("statement_count", "statement_seconds")
+
+    def __init__(self):
+        self.statement_count: int = 0
+        self.statement_seconds: float = 0.0
+
+
+# 현재 요청의 RequestMetrics (SQLAlchemy greenlet 에서도 같은 컨텍스트가 전달됨)
+request_metrics_context: ContextVar[RequestMetrics | None] = ContextVar("request_metrics_context", default=None)
@@ -0,0 +1,25 @@
+import base64
+import json
+
+
+# keyset 페이지네이션 커서 인코딩 (클라이언트에는 의미 없는 문자열로 전달)
+class KeysetCursor:
+
+    # 마지막 행의 키를 커서 문자열로 변환
+    @staticmethod
+    def encode(last_id: int) -> str:
+        raw = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    # 커서 문자열에서 마지막 행의 키 복원, 형식이 잘못되었으면 ValueError
+    @staticmethod
+    def decode(cursor: str) -> int:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            last_id = json.loads(raw)["id"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("유효하지 않은 커서입니다.")
+
+        if not isinstance(last_id, int) or isinstance(last_id, bool):
+            raise ValueError("유효하지 않은 커서입니다.")
+        return last_id
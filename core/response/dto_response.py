@@ -0,0 +1,36 @@
+from typing import Any, Mapping
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# orjson이 설치되어 있으면 dict 직렬화에 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# DTO를 dict 변환 없이 바로 JSON bytes로 직렬화하는 응답 클래스 (앱 기본 응답 클래스)
+class FastJSONResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        # Pydantic DTO는 Rust 직렬화기로 바로 bytes 생성
+        if isinstance(content, BaseModel):
+            return type(content).__pydantic_serializer__.to_json(content)
+
+        if orjson is not None:
+            return orjson.dumps(content)
+
+        return super().render(content)
+
+
+# DTO 응답 생성 헬퍼
+class DtoResponse:
+
+    # DTO의 status_code 필드를 HTTP 상태 코드로 사용
+    @staticmethod
+    def of(dto: BaseModel, headers: Mapping[str, str] | None = None) -> FastJSONResponse:
+        return FastJSONResponse(
+            content=dto,
+            status_code=getattr(dto, "status_code", 200),
+            headers=headers
+        )
@@ -0,0 +1,44 @@
+from fastapi import Response, status
+
+
+# ETag 생성 / If-None-Match 비교 헬퍼
+class ETag:
+
+    MISMATCH: int = -1  # 어떤 버전과도 일치하지 않는 If-Match 값 (버전은 1부터 시작)
+
+    # 리소스 식별 값으로 강한 ETag 생성
+    @staticmethod
+    def of(*parts: object) -> str:
+        return '"' + ":".join(str(part) for part in parts) + '"'
+
+    # If-None-Match 헤더가 ETag 와 일치하는지 확인 (약한 비교, 여러 값 / * 허용)
+    @staticmethod
+    def matches(if_none_match: str | None, etag: str) -> bool:
+        if not if_none_match:
+            return False
+
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+    # If-Match 헤더에서 버전 추출 (ETag.of(..., version) 형식), * 이면 None
+    # 다른 리소스의 ETag / 형식이 다른 값 / 여러 값은 어떤 버전과도 일치하지 않는 MISMATCH 반환 (버전 충돌 409)
+    @staticmethod
+    def version_of(if_match: str, *parts: object) -> int | None:
+        candidates = [candidate.strip().removeprefix("W/") for candidate in if_match.split(",")]
+        if "*" in candidates:
+            return None
+
+        if len(candidates) != 1:
+            return ETag.MISMATCH
+
+        value = candidates[0]
+        prefix = '"' + "".join(f"{part}:" for part in parts)
+        if not (value.startswith(prefix) and value.endswith('"') and value[len(prefix):-1].isdigit()):
+            return ETag.MISMATCH
+
+        return int(value[len(prefix):-1])
+
+    # 본문 없는 304 응답
+    @staticmethod
+    def not_modified(etag: str) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
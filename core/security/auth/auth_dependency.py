@@ -0,0 +1,34 @@
+from fastapi import HTTPException, Request, status
+from core.security.jwt.jwt_filter import JWTFilter
+from core.security.jwt.jwt_provider import JWTProvider
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
+from core.security.auth.revocation_index import RevocationIndex
+
+
+# 라우터 단위로 선언하는 인증 의존성 (CPU 연산만 수행, DB 조회 없음)
+class AuthDependency:
+
+    # Bearer 토큰을 검증하고 인증 주체 반환
+    @staticmethod
+    async def get_principal(request: Request) -> AuthenticatedPrincipal:
+        # Bearer 헤더 검증
+        token = JWTFilter.resolve_token(request=request)
+
+        # jwt 검증
+        payload = JWTProvider.verify_token(token=token)
+        user_id = payload.get("sub", None)
+
+        if not user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Access Token이 유효하지 않습니다."
+            )
+
+        # 폐기된 토큰 / 삭제된 사용자 확인
+        if RevocationIndex.is_token_revoked(token=token) or RevocationIndex.is_user_deleted(user_id=user_id):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="폐기된 토큰이거나 존재하지 않는 사용자입니다."
+            )
+
+        return AuthenticatedPrincipal(user_id=user_id, token=token, payload=payload)
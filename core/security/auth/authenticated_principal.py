@@ -0,0 +1,10 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# 인증된 요청의 주체 정보
+class AuthenticatedPrincipal(BaseModel):
+    user_id: str = Field(..., description="사용자 고유 id (JWT sub)")
+    token: str = Field(..., description="검증된 Access Token")
+    payload: dict = Field(..., description="검증된 JWT payload")
+
+    # 모델 설정
+    model_config = ConfigDict(frozen=True)
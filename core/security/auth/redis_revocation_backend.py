@@ -0,0 +1,38 @@
+import time
+from core.cache.redis.fake_redis_client import FakeRedisClient
+from core.cache.redis.redis_protocol_client import RedisProtocolClient
+from core.security.auth.revocation_backend import RevocationBackend
+
+
+# Redis Sorted Set 기반 폐기 목록 (score: 기록 시각, member: "kind:value:exp")
+class RedisRevocationBackend(RevocationBackend):
+
+    KEY: str = "revocation:log"
+    CLOCK_SKEW: float = 5.0  # 인스턴스 간 시계 오차를 감안해 cursor 를 겹쳐 조회 (중복 적용은 무해)
+
+    def __init__(self, client: RedisProtocolClient | FakeRedisClient, retention: float):
+        self.client = client
+        self.retention = retention  # 가장 긴 토큰 수명 (초), 이후에는 기록이 필요 없음
+
+    async def publish(self, kind: str, value: str, exp: float) -> None:
+        now = time.time()
+        await self.client.transaction(
+            ("ZADD", self.KEY, now, f"{kind}:{value}:{int(exp)}"),
+            ("ZREMRANGEBYSCORE", self.KEY, "-inf", now - self.retention),
+        )
+
+    async def fetch_since(self, cursor: float) -> tuple[list[tuple[str, str, float]], float]:
+        reply = await self.client.execute("ZRANGEBYSCORE", self.KEY, max(0.0, cursor - self.CLOCK_SKEW), "+inf", "WITHSCORES")
+
+        entries = []
+        next_cursor = cursor
+        for member, score in zip(reply[::2], reply[1::2]):
+            next_cursor = max(next_cursor, float(score))
+            try:
+                kind, value, exp = member.split(":", 2)
+                entries.append((kind, value, float(exp)))
+            except ValueError:
+                # 형식이 잘못된 항목은 건너뜀 (cursor 는 진행시켜 매번 다시 읽지 않음)
+                continue
+
+        return entries, next_cursor
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+# 워커 / 인스턴스 간 폐기 목록 공유 저장소 인터페이스
+class RevocationBackend(ABC):
+
+    # 폐기 항목 기록 | kind: token(다이제스트 hex) / user(사용자 고유 id), exp: 항목 만료 시각 (epoch 초)
+    @abstractmethod
+    async def publish(self, kind: str, value: str, exp: float) -> None:
+        pass
+
+    # cursor 이후 기록된 항목과 다음 cursor 반환
+    @abstractmethod
+    async def fetch_since(self, cursor: float) -> tuple[list[tuple[str, str, float]], float]:
+        pass
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from typing import Any
+from core.cache.redis.redis_client_provider import RedisClientProvider
+from core.cache.redis.redis_protocol_client import RedisProtocolError
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+from core.security.auth.redis_revocation_backend import RedisRevocationBackend
+from core.security.auth.revocation_backend import RevocationBackend
+from core.security.jwt.jwt_token_cache import JWTTokenCache
+from core.security.jwt.token_digest import TokenDigest
+
+
+# 폐기된 토큰 / 삭제된 사용자를 메모리에서 관리하는 인덱스 (DB 조회 없이 인증 판단)
+# 워커마다 메모리 사본을 두고, 공유 저장소가 설정되면 주기적으로 다른 워커의 폐기 항목을 가져옴
+class RevocationIndex:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.security.auth.revocation_index")
+
+    SYNC_INTERVAL: float = environment_config.revocation_sync_interval
+    USER_RETENTION: float = environment_config.refresh_token_expire * 24 * 60 * 60  # 삭제 이전에 발급된 토큰이 모두 만료되는 시간 (초)
+
+    # 토큰 다이제스트 -> 토큰 만료 시각 (만료 후에는 어차피 검증에 실패하므로 제거)
+    _revoked_tokens: dict[bytes, float] = {}
+    # 삭제된 사용자 고유 id -> 항목 만료 시각
+    _deleted_users: dict[str, float] = {}
+    _lock = threading.Lock()
+
+    # 공유 저장소 (None 이면 워커 내에서만 유지)
+    backend: RevocationBackend | None = (
+        RedisRevocationBackend(client=RedisClientProvider.get(), retention=USER_RETENTION)
+        if environment_config.revocation_backend == "redis" else None
+    )
+    _cursor: float = 0.0
+
+    # 공유 저장소 교체
+    @classmethod
+    def configure(cls, backend: RevocationBackend | None) -> None:
+        cls.backend = backend
+        cls._cursor = 0.0
+
+    # 메모리 사본에 반영
+    @classmethod
+    def _apply(cls, kind: str, value: str, exp: float) -> None:
+        with cls._lock:
+            if kind == "token":
+                cls._revoked_tokens[bytes.fromhex(value)] = exp
+            elif kind == "user":
+                cls._deleted_users[value] = exp
+
+    # 공유 저장소에 기록 (실패해도 현재 워커에는 이미 반영됨)
+    @classmethod
+    async def _publish(cls, kind: str, value: str, exp: float) -> None:
+        if cls.backend is None:
+            return
+        try:
+            await cls.backend.publish(kind=kind, value=value, exp=exp)
+        except (ConnectionError, OSError, TimeoutError, RedisProtocolError, ValueError) as e:
+            cls.logger.warning("폐기 항목 공유 실패 (kind=%s): %s", kind, e)
+
+    # 토큰 폐기
+    @classmethod
+    async def revoke_token(cls, token: str, exp: float) -> None:
+        digest = TokenDigest.hexdigest(token)
+        cls._apply(kind="token", value=digest, exp=exp)
+        JWTTokenCache.invalidate(token)
+        await cls._publish(kind="token", value=digest, exp=exp)
+
+    # 폐기된 토큰인지 확인
+    @classmethod
+    def is_token_revoked(cls, token: str) -> bool:
+        key = TokenDigest.digest(token)
+        with cls._lock:
+            exp = cls._revoked_tokens.get(key)
+            if exp is None:
+                return False
+
+            if exp <= time.time():
+                del cls._revoked_tokens[key]
+                return False
+
+            return True
+
+    # 사용자 삭제 표시
+    @classmethod
+    async def mark_user_deleted(cls, user_id: str) -> None:
+        exp = time.time() + cls.USER_RETENTION
+        cls._apply(kind="user", value=user_id, exp=exp)
+        await cls._publish(kind="user", value=user_id, exp=exp)
+
+    # 삭제된 사용자인지 확인
+    @classmethod
+    def is_user_deleted(cls, user_id: str) -> bool:
+        exp = cls._deleted_users.get(user_id)
+        return exp is not None and exp > time.time()
+
+    # 만료된 폐기 항목 정리
+    @classmethod
+    def purge_expired(cls) -> None:
+        now = time.time()
+        with cls._lock:
+            for key in [key for key, exp in cls._revoked_tokens.items() if exp <= now]:
+                del cls._revoked_tokens[key]
+            for user_id in [user_id for user_id, exp in cls._deleted_users.items() if exp <= now]:
+                del cls._deleted_users[user_id]
+
+    # 공유 저장소에서 마지막 동기화 이후 항목을 가져와 반영
+    @classmethod
+    async def sync(cls) -> None:
+        if cls.backend is None:
+            return
+
+        entries, cls._cursor = await cls.backend.fetch_since(cursor=cls._cursor)
+        now = time.time()
+        for kind, value, exp in entries:
+            if exp <= now:
+                continue
+            try:
+                cls._apply(kind=kind, value=value, exp=exp)
+            except ValueError as e:
+                cls.logger.warning("잘못된 폐기 항목 무시 (kind=%s): %s", kind, e)
+
+    # 주기적 동기화 / 정리 (애플리케이션 실행 중 백그라운드 태스크로 실행)
+    @classmethod
+    async def run_sync(cls) -> None:
+        while True:
+            try:
+                await cls.sync()
+            except Exception as e:
+                # 저장소 오류 / 잘못된 항목이 있어도 태스크는 계속 실행
+                cls.logger.warning("폐기 목록 동기화 실패: %s", e)
+
+            cls.purge_expired()
+            await asyncio.sleep(cls.SYNC_INTERVAL)
+
+    # 폐기 목록 크기
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "backend": type(cls.backend).__name__ if cls.backend is not None else None,
+            "revoked_tokens": len(cls._revoked_tokens),
+            "deleted_users": len(cls._deleted_users),
+        }
@@ -0,0 +1,45 @@
+import ipaddress
+from fastapi import Request
+from core.config.environment.environment_config import environment_config
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+# 클라이언트 IP 판별 (신뢰하는 프록시를 거친 요청은 X-Forwarded-For 에서 실제 클라이언트 주소를 찾음)
+class ClientAddress:
+
+    # 쉼표 구분 CIDR 목록 파싱
+    @staticmethod
+    def parse_networks(value: str) -> tuple[IPNetwork, ...]:
+        return tuple(ipaddress.ip_network(network.strip(), strict=False) for network in value.split(",") if network.strip())
+
+    # 주소가 네트워크 목록에 속하는지 확인 (주소 형식이 아니면 False)
+    @staticmethod
+    def in_networks(host: str | None, networks: tuple[IPNetwork, ...]) -> bool:
+        if not host:
+            return False
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in networks)
+
+    # 신뢰하는 프록시 (로드밸런서 / ingress) 네트워크, 비어 있으면 X-Forwarded-For 를 사용하지 않음
+    TRUSTED_PROXIES: tuple[IPNetwork, ...] = parse_networks(environment_config.trusted_proxies)
+
+    # 요청한 클라이언트 IP
+    # 직접 연결한 주소가 신뢰하는 프록시이면 X-Forwarded-For 를 오른쪽부터 읽어 신뢰하지 않는 첫 주소를 사용
+    # (클라이언트가 임의로 넣은 왼쪽 값은 신뢰하는 프록시가 덧붙인 값보다 앞에 있으므로 무시됨)
+    @classmethod
+    def resolve(cls, request: Request) -> str | None:
+        peer = request.client.host if request.client else None
+        if not cls.in_networks(peer, cls.TRUSTED_PROXIES):
+            return peer
+
+        hops = [hop.strip() for value in request.headers.getlist("x-forwarded-for") for hop in value.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not cls.in_networks(hop, cls.TRUSTED_PROXIES):
+                return hop
+
+        return hops[0] if hops else peer
+
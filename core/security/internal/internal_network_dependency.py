@@ -0,0 +1,20 @@
+from fastapi import HTTPException, Request, status
+from core.config.environment.environment_config import environment_config
+from core.security.client.client_address import ClientAddress, IPNetwork
+
+
+# 운영 / 내부 엔드포인트를 허용 네트워크 (INTERNAL_ALLOWED_NETWORKS) 에서만 허용하는 의존성
+class InternalNetworkDependency:
+
+    # 허용 네트워크 (시작 시 한 번만 파싱)
+    ALLOWED_NETWORKS: tuple[IPNetwork, ...] = ClientAddress.parse_networks(environment_config.internal_allowed_networks)
+
+    # 직접 연결한 클라이언트 주소가 허용 네트워크에 속하는지 확인
+    @staticmethod
+    async def require(request: Request) -> None:
+        host = request.client.host if request.client is not None else None
+        if not ClientAddress.in_networks(host, InternalNetworkDependency.ALLOWED_NETWORKS):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="내부 네트워크에서만 접근할 수 있습니다."
+            )
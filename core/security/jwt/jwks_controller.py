@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from core.security.jwt.jwt_key_store import JWTKeyStore
+
+# JWT 공개 키(JWKS) 라우터 구현 | 게이트웨이 / 다른 서비스가 토큰을 직접 검증할 때 사용
+class JwksController:
+    def __init__(self):
+
+        # 라우터 인스턴스 생성
+        self.router = APIRouter(prefix="/.well-known", tags=["jwks"])
+
+        # 라우터 등록
+        self.router.add_api_route(
+            path="/jwks.json",
+            endpoint=self.jwks,
+            methods=["get"]
+        )
+
+    # 공개 키 목록 조회 (키는 시작 시 한 번 로드되므로 캐시 허용)
+    async def jwks(self) -> JSONResponse:
+        return JSONResponse(content=JWTKeyStore.jwks(), headers={"Cache-Control": "public, max-age=300"})
@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+from typing import Any
+import jwt
+from jwt.algorithms import get_default_algorithms
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+
+
+# JWT 서명 / 검증 키 저장소
+# HS* 는 JWT_SECRET 을 사용하고, RS* / PS* / ES* / EdDSA 는 JWT_KEY_DIR 의 PEM 파일을 kid 별로 한 번만 파싱해 보관
+# 키 파일: <kid>.pem (개인 키, 서명 + 검증) / <kid>.pub.pem (공개 키, 교체 후 이전 토큰 검증용)
+class JWTKeyStore:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.security.jwt.jwt_key_store")
+
+    ALGORITHM: str = environment_config.jwt_algorithm
+    KEY_DIR: str = environment_config.jwt_key_dir
+    ACTIVE_KID: str = environment_config.jwt_active_kid
+
+    _signing_keys: dict[str, Any] = {}    # kid -> 개인 키 객체
+    _verifying_keys: dict[str, Any] = {}  # kid -> 공개 키 객체
+    _jwks: dict[str, Any] = {"keys": []}
+    _loaded: bool = False
+    _lock = threading.Lock()
+
+    # 대칭 키(HS*) 알고리즘인지 확인
+    @classmethod
+    def is_symmetric(cls) -> bool:
+        return cls.ALGORITHM.startswith("HS")
+
+    # 키 파일 로드 및 JWKS 생성 (시작 시 한 번 호출, 키가 잘못되었으면 예외 발생)
+    @classmethod
+    def load(cls) -> None:
+        with cls._lock:
+            if cls._loaded:
+                return
+
+            if not cls.is_symmetric():
+                cls._load_key_files()
+
+            cls._loaded = True
+
+    @classmethod
+    def _load_key_files(cls) -> None:
+        from cryptography.hazmat.primitives import serialization
+
+        if not cls.KEY_DIR or not os.path.isdir(cls.KEY_DIR):
+            raise RuntimeError(f"{cls.ALGORITHM} 서명에는 JWT_KEY_DIR 이 필요합니다: '{cls.KEY_DIR}'")
+
+        algorithm = get_default_algorithms()[cls.ALGORITHM]
+        public_keys: dict[str, Any] = {}  # kid -> .pub.pem 공개 키
+
+        for filename in sorted(os.listdir(cls.KEY_DIR)):
+            path = os.path.join(cls.KEY_DIR, filename)
+            with open(path, "rb") as f:
+                data = f.read()
+
+            if filename.endswith(".pub.pem"):
+                public_keys[filename[:-len(".pub.pem")]] = serialization.load_pem_public_key(data)
+            elif filename.endswith(".pem"):
+                private_key = serialization.load_pem_private_key(data, password=None)
+                cls._signing_keys[filename[:-len(".pem")]] = private_key
+
+        # 같은 kid 의 <kid>.pem / <kid>.pub.pem 이 모두 있으면 개인 키에서 얻은 공개 키 사용 (kid 당 JWK 하나)
+        for kid, public_key in public_keys.items():
+            if kid in cls._signing_keys:
+                cls.logger.warning("kid '%s' 의 개인 키가 있어 %s.pub.pem 은 무시합니다.", kid, kid)
+                continue
+            cls._verifying_keys[kid] = public_key
+        for kid, private_key in cls._signing_keys.items():
+            cls._verifying_keys[kid] = private_key.public_key()
+
+        jwks = []
+        for kid, public_key in sorted(cls._verifying_keys.items()):
+            jwk = json.loads(algorithm.to_jwk(public_key))
+            jwk.update({"kid": kid, "use": "sig", "alg": cls.ALGORITHM})
+            jwks.append(jwk)
+
+        if cls.ACTIVE_KID not in cls._signing_keys:
+            raise RuntimeError(f"JWT_ACTIVE_KID 에 해당하는 개인 키가 없습니다: '{cls.ACTIVE_KID}'")
+
+        cls._jwks = {"keys": jwks}
+        cls.logger.info("JWT 키 로드 완료 (algorithm=%s, active_kid=%s, keys=%s)", cls.ALGORITHM, cls.ACTIVE_KID, list(cls._verifying_keys))
+
+    # 서명 키 (대칭 키면 secret)
+    @classmethod
+    def signing_key(cls) -> Any:
+        if cls.is_symmetric():
+            return environment_config.jwt_secret
+
+        cls.load()
+        return cls._signing_keys[cls.ACTIVE_KID]
+
+    # 토큰 헤더 (비대칭 키면 kid 포함)
+    @classmethod
+    def headers(cls) -> dict[str, str] | None:
+        return None if cls.is_symmetric() else {"kid": cls.ACTIVE_KID}
+
+    # 토큰 헤더의 kid 로 검증 키 선택, 알 수 없는 kid 면 InvalidTokenError
+    @classmethod
+    def verifying_key(cls, token: str) -> Any:
+        if cls.is_symmetric():
+            return environment_config.jwt_secret
+
+        cls.load()
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = cls._verifying_keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"알 수 없는 kid 입니다: '{kid}'")
+        return key
+
+    # 공개 키 목록 (JWKS, 대칭 키면 빈 목록)
+    @classmethod
+    def jwks(cls) -> dict[str, Any]:
+        cls.load()
+        return cls._jwks
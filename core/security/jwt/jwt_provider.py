@@ -1,6 +1,11 @@
 import jwt
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from core.config.environment.environment_config import environment_config
+from core.security.jwt.jwt_token_cache import JWTTokenCache
+from core.security.jwt.jwt_key_store import JWTKeyStore
+from core.metrics.app_metrics import AppMetrics
 
 # Access / Refresh 토큰 발급 및 검증
 class JWTProvider:
@@ -14,29 +19,40 @@ class JWTProvider:
                 hours=environment_config.access_token_expire
             )
         }
-        return jwt.encode(payload=payload, key=environment_config.jwt_secret, algorithm=environment_config.jwt_algorithm)
+        return jwt.encode(payload=payload, key=JWTKeyStore.signing_key(), algorithm=JWTKeyStore.ALGORITHM, headers=JWTKeyStore.headers())
 
     # Refresh Token 생성
     @staticmethod
     def create_refresh_token(user_id: str) -> str:
         payload = {
             "sub": user_id,
+            "jti": uuid.uuid4().hex,  # 같은 시각에 발급되어도 다이제스트가 겹치지 않도록 고유 id 부여
             "exp": datetime.now(timezone.utc) + timedelta(
                 days=environment_config.refresh_token_expire
             )
         }
         
-        return jwt.encode(payload=payload, key=environment_config.jwt_secret, algorithm=environment_config.jwt_algorithm)
+        return jwt.encode(payload=payload, key=JWTKeyStore.signing_key(), algorithm=JWTKeyStore.ALGORITHM, headers=JWTKeyStore.headers())
 
     # JWT 검증
     @staticmethod
     def verify_token(token: str) -> dict:
+        started_at = time.perf_counter()
+
+        # 이미 검증된 토큰이면 캐시된 payload 반환
+        cached = JWTTokenCache.get(token)
+        if cached is not None:
+            AppMetrics.jwt_verify_duration.observe(time.perf_counter() - started_at, "true")
+            return cached
+
         try:
             payload = jwt.decode(
                 jwt=token,
-                key=environment_config.jwt_secret,
-                algorithms=[environment_config.jwt_algorithm],
+                key=JWTKeyStore.verifying_key(token),
+                algorithms=[JWTKeyStore.ALGORITHM],
             )
+            JWTTokenCache.put(token, payload)
+            AppMetrics.jwt_verify_duration.observe(time.perf_counter() - started_at, "false")
             return payload
         
         except jwt.ExpiredSignatureError:
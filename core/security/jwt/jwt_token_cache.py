@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from core.config.environment.environment_config import environment_config
+from core.security.jwt.token_digest import TokenDigest
+
+
+# 검증이 끝난 JWT payload를 보관하는 LRU 캐시
+class JWTTokenCache:
+
+    ENABLED: bool = environment_config.jwt_verify_cache_enabled
+    MAX_SIZE: int = environment_config.jwt_verify_cache_size
+    TTL: int = environment_config.jwt_verify_cache_ttl
+
+    # 토큰 다이제스트 -> (payload, 만료 시각)
+    _entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+    _lock = threading.Lock()
+
+    # 통계 값
+    hits: int = 0
+    misses: int = 0
+
+    # 캐시 조회, 없거나 만료되었으면 None
+    @classmethod
+    def get(cls, token: str) -> dict | None:
+        if not cls.ENABLED or not token:
+            return None
+
+        key = TokenDigest.digest(token)
+        with cls._lock:
+            entry = cls._entries.get(key)
+
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del cls._entries[key]
+                cls.misses += 1
+                return None
+
+            cls._entries.move_to_end(key)
+            cls.hits += 1
+            return dict(entry[0])
+
+    # 검증된 payload 저장, 토큰 exp 이후까지 유지되지 않도록 만료 시각 제한
+    @classmethod
+    def put(cls, token: str, payload: dict) -> None:
+        if not cls.ENABLED:
+            return
+
+        expires_at = time.time() + cls.TTL
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        key = TokenDigest.digest(token)
+        with cls._lock:
+            cls._entries[key] = (dict(payload), expires_at)
+            cls._entries.move_to_end(key)
+
+            while len(cls._entries) > cls.MAX_SIZE:
+                cls._entries.popitem(last=False)
+
+    # 폐기된 토큰 제거
+    @classmethod
+    def invalidate(cls, token: str) -> None:
+        if not token:
+            return
+
+        with cls._lock:
+            cls._entries.pop(TokenDigest.digest(token), None)
+
+    # 전체 비우기
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+
+    # 적중/실패 통계
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        with cls._lock:
+            total = cls.hits + cls.misses
+            return {
+                "enabled": cls.ENABLED,
+                "size": len(cls._entries),
+                "max_size": cls.MAX_SIZE,
+                "hits": cls.hits,
+                "misses": cls.misses,
+                "hit_ratio": cls.hits / total if total else 0.0,
+            }
@@ -0,0 +1,14 @@
+import hashlib
+
+# 토큰 원문 대신 저장/비교에 사용하는 고정 길이 다이제스트
+class TokenDigest:
+
+    # 바이너리 다이제스트 (메모리 내 키로 사용)
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    # 16진수 다이제스트 (DB/외부 저장소 키로 사용)
+    @staticmethod
+    def hexdigest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
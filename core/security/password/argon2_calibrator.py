@@ -0,0 +1,82 @@
+import argparse
+import os
+import statistics
+import time
+from passlib.context import CryptContext
+
+
+# 현재 호스트에서 목표 검증 시간에 맞는 Argon2 파라미터를 측정하는 클래스
+# 사용법: python -m core.security.password.argon2_calibrator --target-ms 250
+class Argon2Calibrator:
+
+    MIN_MEMORY_COST: int = 8 * 1024    # 최소 메모리 사용량 (KiB)
+    MAX_TIME_COST: int = 32            # 최대 연산 난이도
+    SAMPLE_PASSWORD: str = "calibration-password-1234"
+
+    # 주어진 파라미터로 검증 시간(초)의 중앙값 측정
+    @staticmethod
+    def measure(memory_cost: int, time_cost: int, parallelism: int, samples: int) -> float:
+        context = CryptContext(
+            schemes=["argon2"],
+            argon2__type="id",
+            argon2__memory_cost=memory_cost,
+            argon2__time_cost=time_cost,
+            argon2__parallelism=parallelism,
+        )
+        hashed = context.hash(secret=Argon2Calibrator.SAMPLE_PASSWORD)
+
+        durations = []
+        for _ in range(samples):
+            started_at = time.perf_counter()
+            context.verify(secret=Argon2Calibrator.SAMPLE_PASSWORD, hash=hashed)
+            durations.append(time.perf_counter() - started_at)
+
+        return statistics.median(durations)
+
+    # 메모리를 최대한 확보한 뒤, 목표 시간 안에서 연산 난이도를 올림
+    @staticmethod
+    def calibrate(target_seconds: float, max_memory_cost: int, parallelism: int, samples: int) -> dict[str, int | float]:
+        memory_cost = max_memory_cost
+        time_cost = 1
+        elapsed = Argon2Calibrator.measure(memory_cost, time_cost, parallelism, samples)
+
+        # time_cost=1 에서도 목표를 넘으면 메모리를 절반씩 줄임
+        while elapsed > target_seconds and memory_cost // 2 >= Argon2Calibrator.MIN_MEMORY_COST:
+            memory_cost //= 2
+            elapsed = Argon2Calibrator.measure(memory_cost, time_cost, parallelism, samples)
+
+        # 목표 시간을 넘지 않는 범위에서 time_cost 증가
+        while time_cost < Argon2Calibrator.MAX_TIME_COST:
+            next_elapsed = Argon2Calibrator.measure(memory_cost, time_cost + 1, parallelism, samples)
+            if next_elapsed > target_seconds:
+                break
+            time_cost += 1
+            elapsed = next_elapsed
+
+        return {
+            "memory_cost": memory_cost,
+            "time_cost": time_cost,
+            "parallelism": parallelism,
+            "verify_seconds": elapsed,
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Argon2 파라미터 보정")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="목표 검증 시간 (ms)")
+    parser.add_argument("--max-memory-mb", type=int, default=100, help="최대 메모리 사용량 (MiB)")
+    parser.add_argument("--parallelism", type=int, default=min(os.cpu_count() or 1, 4), help="병렬 스레드 수")
+    parser.add_argument("--samples", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    result = Argon2Calibrator.calibrate(
+        target_seconds=args.target_ms / 1000,
+        max_memory_cost=args.max_memory_mb * 1024,
+        parallelism=args.parallelism,
+        samples=args.samples,
+    )
+
+    print(f"# 측정된 검증 시간: {result['verify_seconds'] * 1000:.1f} ms")
+    print(f"ARGON2_MEMORY_COST={result['memory_cost']}")
+    print(f"ARGON2_TIME_COST={result['time_cost']}")
+    print(f"ARGON2_PARALLELISM={result['parallelism']}")
@@ -1,4 +1,6 @@
 from passlib.context import CryptContext
+from core.config.environment.environment_config import environment_config
+from core.security.password.password_hash_executor import PasswordHashExecutor
 
 # 비밀번호 해싱 및 검증 서비스
 class Argon2PasswordHasher:
@@ -8,9 +10,10 @@ class Argon2PasswordHasher:
         schemes=["argon2"],
         deprecated="auto",
         argon2__type="id",
-        argon2__memory_cost=102400,   # 100 MB
-        argon2__time_cost=4,          # 연산 난이도
-        argon2__parallelism=2         # 병렬 스레드
+        argon2__memory_cost=environment_config.argon2_memory_cost,   # 메모리 사용량 (KiB)
+        argon2__time_cost=environment_config.argon2_time_cost,       # 연산 난이도
+        argon2__min_rounds=environment_config.argon2_time_cost,      # 이보다 낮은 난이도의 해시는 재해싱 대상
+        argon2__parallelism=environment_config.argon2_parallelism    # 병렬 스레드
     )
     
     # 비밀번호를 argon2 해시로 변환
@@ -22,3 +25,18 @@ class Argon2PasswordHasher:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         return Argon2PasswordHasher.pwd_context.verify(secret=plain_password, hash=hashed_password)
+
+    # 저장된 해시가 현재 파라미터보다 오래된 설정으로 만들어졌는지 확인 (해싱 연산 없음)
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        return Argon2PasswordHasher.pwd_context.needs_update(hash=hashed_password)
+
+    # 비밀번호 해싱 (작업자 풀에서 실행, 이벤트 루프를 막지 않음)
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        return await PasswordHashExecutor.run(Argon2PasswordHasher.hash_password, password)
+
+    # 비밀번호 검증 (작업자 풀에서 실행, 이벤트 루프를 막지 않음)
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        return await PasswordHashExecutor.run(Argon2PasswordHasher.verify_password, plain_password, hashed_password)
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+from fastapi import HTTPException, status
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+from core.metrics.app_metrics import AppMetrics
+
+
+# 작업자(스레드/프로세스)에서 실행되는 함수, 실제 실행 시작 시각과 실행 시간을 함께 반환
+def _timed_call(fn: Callable[..., Any], *args: Any) -> tuple[float, float, Any]:
+    started_at = time.monotonic()
+    result = fn(*args)
+    return started_at, time.monotonic() - started_at, result
+
+
+# 비밀번호 해싱을 이벤트 루프 밖의 제한된 작업자 풀에서 실행하는 클래스
+class PasswordHashExecutor:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.security.password.password_hash_executor")
+
+    EXECUTOR_TYPE: str = environment_config.password_hash_executor  # thread | process
+    MAX_WORKERS: int = max(1, environment_config.password_hash_workers)  # 동시에 실행되는 해싱 작업 수
+    MAX_QUEUE_SIZE: int = max(0, environment_config.password_hash_queue_size)  # 실행 대기 가능한 작업 수
+    RETRY_AFTER: int = environment_config.password_hash_retry_after  # 503 응답의 Retry-After (초)
+
+    _executor: Executor | None = None
+    _lock = threading.Lock()
+
+    # 통계 값
+    _in_flight: int = 0       # 대기 + 실행 중인 작업 수
+    _completed: int = 0       # 완료된 작업 수
+    _rejected: int = 0        # 큐가 가득 차 거절된 작업 수
+    _wait_count: int = 0      # 대기 시간이 기록된 작업 수
+    _total_wait: float = 0.0  # 누적 대기 시간 (초)
+    _max_wait: float = 0.0    # 최대 대기 시간 (초)
+
+    # 작업자 풀 생성 (최초 호출 시)
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if cls._executor is None:
+            if cls.EXECUTOR_TYPE == "process":
+                cls._executor = ProcessPoolExecutor(max_workers=cls.MAX_WORKERS)
+            else:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="password-hash")
+            cls.logger.info(
+                "비밀번호 해싱 작업자 풀 생성 (type=%s, workers=%d, queue=%d)",
+                cls.EXECUTOR_TYPE, cls.MAX_WORKERS, cls.MAX_QUEUE_SIZE,
+            )
+        return cls._executor
+
+    # 작업 완료 시 호출 (작업자 스레드에서 실행될 수 있음)
+    @classmethod
+    def _on_done(cls, future: Future) -> None:
+        with cls._lock:
+            cls._in_flight -= 1
+            cls._completed += 1
+
+    # 대기 시간 기록
+    @classmethod
+    def _record_wait(cls, wait: float) -> None:
+        with cls._lock:
+            cls._wait_count += 1
+            cls._total_wait += wait
+            cls._max_wait = max(cls._max_wait, wait)
+
+    # 작업을 풀에 제출하고 결과를 기다림, 큐가 가득 차면 503 반환
+    @classmethod
+    async def run(cls, fn: Callable[..., Any], *args: Any) -> Any:
+        with cls._lock:
+            if cls._in_flight >= cls.MAX_WORKERS + cls.MAX_QUEUE_SIZE:
+                cls._rejected += 1
+                rejected = True
+            else:
+                cls._in_flight += 1
+                rejected = False
+
+        if rejected:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(cls.RETRY_AFTER)},
+            )
+
+        submitted_at = time.monotonic()
+        try:
+            future = cls._get_executor().submit(_timed_call, fn, *args)
+        except Exception:
+            with cls._lock:
+                cls._in_flight -= 1
+            raise
+
+        # 요청이 취소되더라도 작업이 끝날 때까지 슬롯을 유지
+        future.add_done_callback(cls._on_done)
+
+        started_at, elapsed, result = await asyncio.wrap_future(future)
+        wait = max(0.0, started_at - submitted_at)
+        cls._record_wait(wait)
+
+        AppMetrics.password_hash_queue_wait.observe(wait)
+        AppMetrics.password_hash_duration.observe(elapsed, fn.__name__)
+        return result
+
+    # 큐 길이 및 대기 시간 통계
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        with cls._lock:
+            return {
+                "executor": cls.EXECUTOR_TYPE,
+                "workers": cls.MAX_WORKERS,
+                "max_queue_size": cls.MAX_QUEUE_SIZE,
+                "in_flight": cls._in_flight,
+                "queue_depth": max(0, cls._in_flight - cls.MAX_WORKERS),
+                "completed": cls._completed,
+                "rejected": cls._rejected,
+                "avg_wait_seconds": cls._total_wait / cls._wait_count if cls._wait_count else 0.0,
+                "max_wait_seconds": cls._max_wait,
+            }
+
+    # 작업자 풀 종료
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True, cancel_futures=True)
+            cls._executor = None
+            cls.logger.info("비밀번호 해싱 작업자 풀 종료")
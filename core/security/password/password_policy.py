@@ -0,0 +1,14 @@
+import re
+
+
+# 평문 비밀번호 허용 규칙 (회원가입 / 사용자 가져오기 공용)
+class PasswordPolicy:
+
+    # 비밀번호 허용 문자 패턴 (요청마다 컴파일하지 않도록 미리 컴파일)
+    PATTERN = re.compile(r"^[A-Za-z0-9!@#$%^&*()_+\-]+$")
+    MESSAGE: str = "비밀번호는 영어, 숫자, 특수문자만 포함해야 합니다."
+
+    # 영문, 숫자, 일반적으로 자주 사용되는 특수문자만 포함하는지 확인
+    @staticmethod
+    def is_allowed(password: str) -> bool:
+        return PasswordPolicy.PATTERN.match(password) is not None
@@ -0,0 +1,37 @@
+import time
+from collections import OrderedDict, deque
+from core.security.rate_limit.rate_limit_backend import RateLimitBackend
+
+
+# 프로세스 내 슬라이딩 윈도우 저장소 (워커마다 따로 집계됨)
+class MemoryRateLimitBackend(RateLimitBackend):
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._windows: OrderedDict[str, deque[float]] = OrderedDict()  # key -> 허용된 요청 시각 목록
+
+    async def hit(self, key: str, limit: int, window: float) -> float | None:
+        now = time.monotonic()
+        timestamps = self._windows.get(key)
+        if timestamps is None:
+            timestamps = self._windows[key] = deque()
+
+        # 윈도우를 벗어난 기록 제거
+        while timestamps and timestamps[0] <= now - window:
+            timestamps.popleft()
+
+        self._windows.move_to_end(key)
+
+        # 키가 너무 많으면 가장 오래 사용되지 않은 키 제거
+        while len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+
+        if len(timestamps) >= limit:
+            return timestamps[0] + window - now
+
+        timestamps.append(now)
+        return None
+
+    # 현재 추적 중인 키 수
+    def __len__(self) -> int:
+        return len(self._windows)
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+# 슬라이딩 윈도우 요청 제한 저장소 인터페이스
+class RateLimitBackend(ABC):
+
+    # 요청 1회 기록, 허용되면 None / 초과하면 재시도까지 남은 시간(초) 반환
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> float | None:
+        pass
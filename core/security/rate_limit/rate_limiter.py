@@ -0,0 +1,128 @@
+import hashlib
+import json
+from typing import Any, Awaitable, Callable
+from fastapi import HTTPException, Request, status
+from core.cache.redis.redis_client_provider import RedisClientProvider
+from core.cache.redis.redis_protocol_client import RedisProtocolError
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+from core.metrics.app_metrics import AppMetrics
+from core.security.client.client_address import ClientAddress
+from core.security.rate_limit.memory_rate_limit_backend import MemoryRateLimitBackend
+from core.security.rate_limit.rate_limit_backend import RateLimitBackend
+from core.security.rate_limit.redis_rate_limit_backend import RedisRateLimitBackend
+
+
+# 라우트별 요청 제한 (클라이언트 IP / 이메일 기준), 라우트 의존성으로 등록해 DB 조회와 해싱보다 먼저 실행
+class RateLimiter:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.security.rate_limit.rate_limiter")
+
+    ENABLED: bool = environment_config.rate_limit_enabled
+
+    # 라우트별 제한 규칙 | scope -> "허용 횟수/윈도우(초)"
+    RULES: dict[str, dict[str, str]] = {
+        "signin": {
+            "ip": environment_config.rate_limit_signin_ip,
+            "email": environment_config.rate_limit_signin_email,
+        },
+        "signup": {
+            "ip": environment_config.rate_limit_signup_ip,
+            "email": environment_config.rate_limit_signup_email,
+        },
+    }
+
+    _backend: RateLimitBackend | None = None
+
+    # 저장소 생성 (최초 호출 시)
+    @classmethod
+    def _get_backend(cls) -> RateLimitBackend:
+        if cls._backend is None:
+            if environment_config.rate_limit_backend == "redis":
+                cls._backend = RedisRateLimitBackend(client=RedisClientProvider.get())
+            else:
+                cls._backend = MemoryRateLimitBackend(max_keys=environment_config.rate_limit_max_keys)
+        return cls._backend
+
+    # 저장소 교체
+    @classmethod
+    def configure(cls, backend: RateLimitBackend, enabled: bool = True) -> None:
+        cls._backend = backend
+        cls.ENABLED = enabled
+
+    # "5/60" 형식의 규칙 해석
+    @staticmethod
+    def _parse_rule(rule: str) -> tuple[int, float]:
+        limit, window = rule.split("/")
+        return int(limit), float(window)
+
+    # 요청 본문에서 이메일 추출 (FastAPI가 이미 읽은 본문을 재사용)
+    @staticmethod
+    async def _email_of(request: Request) -> str | None:
+        try:
+            body = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+        email = body.get("email") if isinstance(body, dict) else None
+        if not isinstance(email, str) or not email:
+            return None
+
+        # 이메일 원문이 저장소 키에 남지 않도록 해시 사용
+        return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+
+    # 제한 기준 값 조회
+    @staticmethod
+    async def _identity_of(request: Request, scope: str) -> str | None:
+        if scope == "ip":
+            return ClientAddress.resolve(request)
+        if scope == "email":
+            return await RateLimiter._email_of(request)
+        return None
+
+    # 요청 1회 기록, 초과 시 429 반환
+    @classmethod
+    async def check(cls, route: str, request: Request) -> None:
+        if not cls.ENABLED:
+            return
+
+        for scope, rule in cls.RULES[route].items():
+            identity = await cls._identity_of(request, scope)
+            if identity is None:
+                continue
+
+            limit, window = cls._parse_rule(rule)
+            try:
+                retry_after = await cls._get_backend().hit(f"{route}:{scope}:{identity}", limit, window)
+            except (ConnectionError, OSError, TimeoutError, RedisProtocolError) as e:
+                # 저장소 장애로 인증 자체가 막히지 않도록 통과시킴
+                cls.logger.warning("요청 제한 저장소 오류로 제한 생략: %s", e)
+                return
+
+            if retry_after is not None:
+                AppMetrics.rate_limit_rejected_total.inc(route, scope)
+                cls.logger.warning("요청 제한 초과 (route=%s, scope=%s, retry_after=%.1fs)", route, scope, retry_after)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                    headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+                )
+
+    # 라우트 의존성 생성 | dependencies=[Depends(RateLimiter.limit("signin"))]
+    @classmethod
+    def limit(cls, route: str) -> Callable[[Request], Awaitable[None]]:
+        async def dependency(request: Request) -> None:
+            await cls.check(route=route, request=request)
+
+        return dependency
+
+    # 저장소 상태
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        backend = cls._get_backend()
+        return {
+            "enabled": cls.ENABLED,
+            "backend": type(backend).__name__,
+            "tracked_keys": len(backend) if isinstance(backend, MemoryRateLimitBackend) else None,
+        }
@@ -0,0 +1,38 @@
+import time
+import uuid
+from core.cache.redis.fake_redis_client import FakeRedisClient
+from core.cache.redis.redis_protocol_client import RedisProtocolClient
+from core.security.rate_limit.rate_limit_backend import RateLimitBackend
+
+
+# Redis Sorted Set 기반 슬라이딩 윈도우 저장소 (모든 워커 / 인스턴스가 공유)
+class RedisRateLimitBackend(RateLimitBackend):
+
+    KEY_PREFIX: str = "rate_limit"
+
+    def __init__(self, client: RedisProtocolClient | FakeRedisClient):
+        self.client = client
+
+    async def hit(self, key: str, limit: int, window: float) -> float | None:
+        redis_key = f"{self.KEY_PREFIX}:{key}"
+        now_ms = int(time.time() * 1000)
+        window_ms = int(window * 1000)
+        member = f"{now_ms}:{uuid.uuid4().hex[:8]}"
+
+        # 오래된 기록 제거 + 이번 요청 기록 + 개수 / 가장 오래된 기록 조회를 한 번에 실행
+        results = await self.client.transaction(
+            ("ZREMRANGEBYSCORE", redis_key, "-inf", now_ms - window_ms),
+            ("ZADD", redis_key, now_ms, member),
+            ("ZCARD", redis_key),
+            ("ZRANGE", redis_key, 0, 0, "WITHSCORES"),
+            ("PEXPIRE", redis_key, window_ms),
+        )
+
+        if int(results[2]) <= limit:
+            return None
+
+        # 거절된 요청은 윈도우에 남기지 않음
+        await self.client.execute("ZREM", redis_key, member)
+
+        oldest_ms = float(results[3][1]) if results[3] else now_ms
+        return max(0.0, (oldest_ms + window_ms - now_ms) / 1000)
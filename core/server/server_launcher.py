@@ -0,0 +1,103 @@
+import argparse
+import glob
+import importlib.util
+import os
+import shutil
+import tempfile
+from typing import Any
+import uvicorn
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+
+
+# uvicorn 실행 옵션 구성 및 서버 실행을 담당하는 클래스
+# 운영: python -m core.server.server_launcher
+# 개발: python -m core.server.server_launcher --dev (또는 python app.py)
+class ServerLauncher:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("core.server.server_launcher")
+
+    APP: str = "app:app"
+    DEV_HOST: str = "127.0.0.1"
+
+    # 설치되어 있으면 사용, 없으면 uvicorn 기본 구현 사용
+    @staticmethod
+    def _optional(module: str) -> str:
+        return module if importlib.util.find_spec(module) is not None else "auto"
+
+    # uvicorn 실행 옵션 구성
+    @staticmethod
+    def build_options(dev: bool) -> dict[str, Any]:
+        # 개발 모드: 단일 프로세스 + 코드 변경 시 재시작
+        if dev:
+            return {
+                "host": ServerLauncher.DEV_HOST,
+                "port": environment_config.server_port,
+                "reload": True,
+            }
+
+        # 폐기 목록이 워커 메모리에만 있으면 다른 워커가 폐기된 토큰 / 삭제된 사용자를 허용하므로 시작하지 않음
+        if environment_config.server_workers > 1 and environment_config.revocation_backend == "memory":
+            raise RuntimeError(
+                "REVOCATION_BACKEND=memory 는 단일 워커에서만 사용할 수 있습니다. "
+                f"(SERVER_WORKERS={environment_config.server_workers}) REDIS_URL 또는 REVOCATION_BACKEND=redis 를 설정하세요."
+            )
+
+        # 요청 제한 한도가 워커 메모리에만 있으면 실제 한도가 워커 수만큼 늘어나므로 시작하지 않음
+        if environment_config.server_workers > 1 and environment_config.rate_limit_enabled and environment_config.rate_limit_backend == "memory":
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=memory 는 단일 워커에서만 사용할 수 있습니다. "
+                f"(SERVER_WORKERS={environment_config.server_workers}) REDIS_URL 또는 RATE_LIMIT_BACKEND=redis 를 설정하세요."
+            )
+
+        # 운영 모드: 다중 워커, uvloop / httptools, 종료 시 처리 중인 요청 완료 대기 (SIGTERM)
+        return {
+            "host": environment_config.server_host,
+            "port": environment_config.server_port,
+            "workers": max(1, environment_config.server_workers),
+            "loop": ServerLauncher._optional("uvloop"),
+            "http": ServerLauncher._optional("httptools"),
+            "backlog": environment_config.server_backlog,
+            "timeout_keep_alive": environment_config.server_keep_alive,
+            "timeout_graceful_shutdown": environment_config.server_graceful_timeout,
+            "access_log": False,
+        }
+
+    # 다중 워커 메트릭 사본 디렉터리 준비 (워커는 환경 변수를 상속), 직접 만든 임시 디렉터리면 경로 반환
+    @staticmethod
+    def _prepare_metrics_dir(workers: int) -> str | None:
+        directory = environment_config.metrics_multiproc_dir
+        if directory:
+            # 이전 실행의 사본이 합산되지 않도록 정리
+            os.makedirs(directory, exist_ok=True)
+            for path in glob.glob(os.path.join(directory, "*.json")):
+                os.remove(path)
+            return None
+
+        if workers <= 1:
+            return None
+
+        directory = tempfile.mkdtemp(prefix="fastapi-metrics-")
+        os.environ["METRICS_MULTIPROC_DIR"] = directory
+        return directory
+
+    # 서버 실행
+    @staticmethod
+    def run(dev: bool = False) -> None:
+        options = ServerLauncher.build_options(dev=dev)
+        metrics_dir = ServerLauncher._prepare_metrics_dir(workers=options.get("workers", 1))
+        ServerLauncher.logger.info("FastAPI 서버를 시작합니다... (%s)", ", ".join(f"{key}={value}" for key, value in options.items()))
+        try:
+            uvicorn.run(ServerLauncher.APP, **options)
+        finally:
+            if metrics_dir is not None:
+                shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FastAPI 서버 실행")
+    parser.add_argument("--dev", action="store_true", help="개발 모드 (단일 프로세스, reload)")
+    args = parser.parse_args()
+
+    ServerLauncher.run(dev=args.dev)
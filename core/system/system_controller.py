@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from core.db.database import Database
+from core.security.internal.internal_network_dependency import InternalNetworkDependency
+
+# 운영 상태 조회 라우터 구현
+class SystemController:
+    def __init__(self):
+
+        # 라우터 인스턴스 생성 (내부 네트워크에서만 접근 가능)
+        self.router = APIRouter(prefix="/system", tags=["system"], dependencies=[Depends(InternalNetworkDependency.require)])
+
+        # 라우터 등록
+        self.router.add_api_route(
+            path="/db-pool",
+            endpoint=self.db_pool,
+            methods=["get"],
+            include_in_schema=False
+        )
+
+    # 커넥션 풀 통계 조회
+    async def db_pool(self) -> JSONResponse:
+        return JSONResponse(content=Database.pool_statistics())
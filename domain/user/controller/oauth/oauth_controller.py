@@ -5,6 +5,9 @@ from domain.user.dto.request.oauth.signup_dto_request import SignupDtoRequest
 from domain.user.dto.request.oauth.signin_dto_request import SigninDtoRequest 
 from domain.user.service.impl.oauth.oauth_service_impl import OauthServiceImpl
 from core.db.database import Database
+from core.security.rate_limit.rate_limiter import RateLimiter
+from core.security.auth.auth_dependency import AuthDependency
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
 
 # 사용자 라우터 구현
 class OauthController:
@@ -17,14 +20,16 @@ class OauthController:
         self.router.add_api_route(
             path="/signup",
             endpoint=self.signup,
-            methods=["post"]
+            methods=["post"],
+            dependencies=[Depends(RateLimiter.limit("signup"))]  # DB 조회 / 해싱 전에 요청 제한 적용
         )
 
         # 라우터 등록
         self.router.add_api_route(
             path="/signin",
             endpoint=self.signin,
-            methods=["post"]
+            methods=["post"],
+            dependencies=[Depends(RateLimiter.limit("signin"))]  # DB 조회 / 해싱 전에 요청 제한 적용
         )
 
         # 라우터 등록
@@ -33,6 +38,13 @@ class OauthController:
             endpoint=self.refresh_token,
             methods=["post"]
         )
+
+        # 라우터 등록
+        self.router.add_api_route(
+            path="/signout",
+            endpoint=self.signout,
+            methods=["post"]
+        )
         
     # 회원가입 | Depends를 사용하여 의존성 주입
     async def signup(self, dto: SignupDtoRequest, session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
@@ -52,5 +64,12 @@ class OauthController:
     async def refresh_token(self, request: Request, session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
         response = await OauthServiceImpl.refresh_token(request=request, session=session)
         
+        # 반환
+        return response
+
+    # 로그아웃 | Depends를 사용하여 의존성 주입
+    async def signout(self, request: Request, principal: AuthenticatedPrincipal = Depends(AuthDependency.get_principal), session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
+        response = await OauthServiceImpl.signout(principal=principal, request=request, session=session)
+        
         # 반환
         return response
\ No newline at end of file
@@ -1,16 +1,25 @@
-from fastapi import APIRouter, Depends, Header, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.db.database import Database
+from core.config.environment.environment_config import environment_config
+from core.security.auth.auth_dependency import AuthDependency
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
+from core.security.internal.internal_network_dependency import InternalNetworkDependency
 from domain.user.service.impl.profile.profile_service_impl import ProfileServiceImpl
 from domain.user.dto.request.profile.profile_update_dto_request import ProfileUpdateDtoRequest
+from domain.user.dto.request.profile.profile_batch_dto_request import ProfileBatchDtoRequest
 
 # 프로필 라우터 구현
 class ProfileController:
     def __init__(self):
         
-        # 라우터 인스턴스 셍성
-        self.router = APIRouter(prefix="/profile", tags=["user"])
+        # 라우터 인스턴스 셍성 | 모든 프로필 라우트에 인증 의존성 적용
+        self.router = APIRouter(
+            prefix="/profile",
+            tags=["user"],
+            dependencies=[Depends(AuthDependency.get_principal)]
+        )
         
         # 라우터 등록
         self.router.add_api_route(
@@ -24,18 +33,55 @@ class ProfileController:
             endpoint=self.update,
             methods=["put"]
         )
+
+        # 서비스 간 내부 조회용 (임의 사용자의 프로필을 반환하므로 내부 네트워크에서만 허용)
+        self.router.add_api_route(
+            path="/batch",
+            endpoint=self.batch,
+            methods=["post"],
+            dependencies=[Depends(InternalNetworkDependency.require)]
+        )
+
+        # 전체 사용자를 순회할 수 있으므로 내부 네트워크에서만 허용
+        self.router.add_api_route(
+            path="/list",
+            endpoint=self.list_users,
+            methods=["get"],
+            dependencies=[Depends(InternalNetworkDependency.require)]
+        )
         
-    # 프로필 조회 | Depends를 사용하여 의존성 주입
-    async def me(self, request: Request, session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
-        response = await ProfileServiceImpl.me(request=request, session=session)
+    # 프로필 조회 | If-None-Match 가 현재 ETag 와 같으면 304 | 인증 의존성은 요청 단위로 캐시되어 한 번만 실행됨
+    async def me(self, if_none_match: str | None = Header(default=None), principal: AuthenticatedPrincipal = Depends(AuthDependency.get_principal), session: AsyncSession = Depends(Database.get_session)) -> Response:
+        response = await ProfileServiceImpl.me(principal=principal, session=session, if_none_match=if_none_match)
+        
+        # 반환
+        return response
+    
+    
+    # 프로필 수정 | If-Match 로 조회 시점의 ETag 를 보내면 그 사이 다른 변경이 있을 때 409 | 인증 의존성은 요청 단위로 캐시되어 한 번만 실행됨
+    async def update(self, dto: ProfileUpdateDtoRequest, if_match: str | None = Header(default=None), principal: AuthenticatedPrincipal = Depends(AuthDependency.get_principal), session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
+        response = await ProfileServiceImpl.update(principal=principal, dto=dto, session=session, if_match=if_match)
+        
+        # 반환
+        return response
+    
+    
+    # 프로필 일괄 조회 | 여러 사용자를 요청 한 번, SELECT 한 번으로 조회
+    async def batch(self, dto: ProfileBatchDtoRequest, session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
+        response = await ProfileServiceImpl.batch(dto=dto, session=session)
         
         # 반환
         return response
     
     
-    # 프로필 수정 | Depends를 사용하여 의존성 주입
-    async def update(self, request: Request, dto: ProfileUpdateDtoRequest, session: AsyncSession = Depends(Database.get_session)) -> JSONResponse:
-        response = await ProfileServiceImpl.update(request=request, dto=dto, session=session)
+    # 프로필 목록 조회 | cursor 는 이전 응답의 next_cursor 값
+    async def list_users(
+        self,
+        cursor: str | None = Query(default=None, description="다음 페이지 커서"),
+        limit: int = Query(default=20, ge=1, le=environment_config.profile_list_max_limit, description="페이지 크기"),
+        session: AsyncSession = Depends(Database.get_session)
+    ) -> JSONResponse:
+        response = await ProfileServiceImpl.list_users(cursor=cursor, limit=limit, session=session)
         
         # 반환
         return response
\ No newline at end of file
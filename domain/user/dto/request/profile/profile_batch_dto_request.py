@@ -0,0 +1,9 @@
+from pydantic import BaseModel, ConfigDict, Field
+from core.config.environment.environment_config import environment_config
+
+# 프로필 일괄 조회 요청 Dto
+class ProfileBatchDtoRequest(BaseModel):
+    user_ids: list[str] = Field(..., min_length=1, max_length=environment_config.profile_batch_max_size, description="조회할 사용자 고유 id 목록")
+    
+    # 모델 설정
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
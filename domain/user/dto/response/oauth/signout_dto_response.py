@@ -0,0 +1,9 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# 로그아웃 응답 Dto
+class SignoutDtoResponse(BaseModel):
+    user_id: str = Field(..., description="로그아웃한 사용자 고유 id")
+    status_code: int = Field(..., description="HTTP 상태 코드")
+    
+    # 모델 설정
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# 프로필 일괄 조회 응답 Dto | 필드 이름은 한 번만 내려주고 각 사용자는 배열로 표현
+class ProfileBatchDtoResponse(BaseModel):
+    fields: list[str] = Field(..., description="rows 각 항목의 필드 순서")
+    rows: list[list[str]] = Field(..., description="요청 순서대로 정렬된 사용자 목록")
+    missing: list[str] = Field(..., description="존재하지 않는 사용자 고유 id 목록")
+    status_code: int = Field(..., description="HTTP 상태 코드")
+    
+    # 모델 설정
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
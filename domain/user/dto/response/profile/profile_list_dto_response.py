@@ -0,0 +1,11 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# 프로필 목록 조회 응답 Dto | 필드 이름은 한 번만 내려주고 각 사용자는 배열로 표현
+class ProfileListDtoResponse(BaseModel):
+    fields: list[str] = Field(..., description="rows 각 항목의 필드 순서")
+    rows: list[list[str]] = Field(..., description="가입 순서대로 정렬된 사용자 목록")
+    next_cursor: str | None = Field(..., description="다음 페이지 커서 (마지막 페이지면 null)")
+    status_code: int = Field(..., description="HTTP 상태 코드")
+    
+    # 모델 설정
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
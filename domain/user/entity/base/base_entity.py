@@ -1,5 +1,6 @@
-from sqlalchemy import Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 from core.db.base import Base
 from core.config.logging.logger_config import LoggerConfig
 
@@ -18,9 +19,12 @@ class BaseEntity(Base):
     email: Mapped[str] = mapped_column(String(length=1000), nullable=False, unique=True) # 이메일
     password: Mapped[str] = mapped_column(String(length=1000), nullable=False) # 비밀번호 (암호화된 값)
     bio: Mapped[str] = mapped_column(String(length=1000), nullable=False, unique=False) # 사용자 소개
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1") # 행 버전 (변경마다 1 증가, ETag 로 사용)
+    last_seen_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True) # 마지막 활동 시각 (UTC, 지연 쓰기로 기록)
     
-    # JWT 토큰
-    access_token: Mapped[str] = mapped_column(String(length=1000), nullable=True)           # Access Token
-    refresh_token: Mapped[str] = mapped_column(String(length=1000), nullable=True)          # Refresh Token
+    # ORM UPDATE / DELETE 시 WHERE version = <조회한 버전> 조건을 붙이고 버전을 증가시킴 (동시 수정 감지)
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {"version_id_col": cls.__table__.c.version}
     
-    
\ No newline at end of file
+    # JWT 토큰은 사용자 행에 저장하지 않음 (Refresh Token은 RefreshTokenEntity 참고)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy import CHAR, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from core.db.base import Base
+from core.config.logging.logger_config import LoggerConfig
+
+# 로거 생성
+logger = LoggerConfig.get_logger("domain.entity.refresh_token_entity")
+
+# Refresh Token 엔티티 | 토큰 원문 대신 고정 길이 다이제스트만 저장
+class RefreshTokenEntity(Base):
+    # DB 테이블명 정의
+    __tablename__ = "fastapi_jwt_example_refresh_token"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True) # 기본키 (자동 증가)
+
+    token_hash: Mapped[str] = mapped_column(CHAR(length=64), nullable=False, unique=True) # SHA-256 다이제스트 (16진수)
+    user_id: Mapped[str] = mapped_column(String(length=1000), nullable=False, index=True) # 사용자 고유 아이디 (사용자 테이블과 같은 타입)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True) # 만료 시각 (UTC)
+    last_used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True) # 마지막 사용 시각 (UTC, 지연 쓰기로 기록)
@@ -0,0 +1,199 @@
+import argparse
+import asyncio
+import csv
+import itertools
+import json
+import os
+import sys
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Iterator, TextIO
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine
+from core.config.logging.logger_config import LoggerConfig
+from core.security.password.argon2_password_hasher import Argon2PasswordHasher
+from core.security.password.password_policy import PasswordPolicy
+from domain.user.entity.base.base_entity import BaseEntity
+from domain.user.dto.request.oauth.signup_dto_request import SignupDtoRequest
+
+
+# 레거시 사용자 일괄 가져오기 (CSV / JSONL 스트리밍, 비밀번호는 프로세스 풀에서 해싱)
+# 사용법: python -m domain.user.importer.user_bulk_importer users.csv --batch-size 500 --report conflicts.jsonl
+# 입력 필드: email, username, password, bio(선택), user_id(선택, 없으면 생성)
+# password 가 이미 argon2 해시($argon2...)면 그대로 저장
+class UserBulkImporter:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("domain.user.importer.user_bulk_importer")
+
+    HASH_PREFIX: str = "$argon2"
+
+    table = BaseEntity.__table__
+
+    # 입력 파일을 한 행씩 읽음 (줄 번호, 행)
+    @staticmethod
+    def read_rows(file: TextIO, format: str) -> Iterator[tuple[int, dict[str, Any]]]:
+        if format == "csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_no, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError:
+                    yield line_no, None
+
+    # 행 검증 및 저장용 값 생성, 잘못된 행이면 오류 메시지 반환
+    # 회원가입과 같은 SignupDtoRequest 규칙 적용 (EmailStr, 길이), 평문 비밀번호는 허용 문자 규칙도 적용
+    @staticmethod
+    def _prepare(row: dict[str, Any] | None) -> dict[str, Any] | str:
+        if not isinstance(row, dict):
+            return "행 형식이 올바르지 않습니다."
+
+        try:
+            dto = SignupDtoRequest.model_validate({**row, "bio": row.get("bio") or ""})
+        except ValidationError as e:
+            return "; ".join(f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors())
+
+        if not dto.password.startswith(UserBulkImporter.HASH_PREFIX) and not PasswordPolicy.is_allowed(dto.password):
+            return PasswordPolicy.MESSAGE
+
+        # user_id 는 Dto 에 없으므로 타입 / 컬럼 길이만 확인
+        user_id = row.get("user_id") or str(uuid.uuid4())
+        if not isinstance(user_id, str) or len(user_id) > UserBulkImporter.table.c.user_id.type.length:
+            return "user_id 가 올바르지 않습니다."
+
+        return {
+            "user_id": user_id,
+            "username": dto.username,
+            "email": dto.email,
+            "password": dto.password,
+            "bio": dto.bio,
+        }
+
+    # 평문 비밀번호만 프로세스 풀에서 해싱 (이미 해시된 값은 그대로 사용)
+    @staticmethod
+    async def _hash_passwords(executor: Executor, values: list[dict[str, Any]]) -> None:
+        loop = asyncio.get_running_loop()
+        plain = [value for value in values if not value["password"].startswith(UserBulkImporter.HASH_PREFIX)]
+        hashed = await asyncio.gather(*(
+            loop.run_in_executor(executor, Argon2PasswordHasher.hash_password, value["password"]) for value in plain
+        ))
+        for value, hashed_password in zip(plain, hashed):
+            value["password"] = hashed_password
+
+    # 중복 키만 건너뛰는 INSERT 문 생성
+    # INSERT IGNORE 는 길이 초과 / NOT NULL 위반 등 다른 오류도 경고로 바꿔 저장하므로 사용하지 않음
+    @staticmethod
+    def _insert_statement(engine: AsyncEngine) -> Any:
+        table = UserBulkImporter.table
+        if engine.dialect.name == "sqlite":
+            return sqlite.insert(table).on_conflict_do_nothing()
+
+        return mysql.insert(table).on_duplicate_key_update(id=table.c.id)
+
+    # 한 배치를 executemany 로 저장하고, 저장되지 않은 (중복) 행의 인덱스 반환
+    @staticmethod
+    async def _insert_batch(engine: AsyncEngine, values: list[dict[str, Any]]) -> set[int]:
+        table = UserBulkImporter.table
+        stmt = UserBulkImporter._insert_statement(engine)
+
+        async with engine.begin() as conn:
+            await conn.execute(stmt, values)
+
+            # 이번 배치가 저장한 행만 같은 해시를 가짐 (해시마다 salt 가 다름)
+            result = await conn.execute(
+                select(table.c.user_id, table.c.password).where(table.c.user_id.in_([value["user_id"] for value in values]))
+            )
+            stored = {user_id: password for user_id, password in result}
+
+        return {index for index, value in enumerate(values) if stored.get(value["user_id"]) != value["password"]}
+
+    # 파일 전체 가져오기, 배치 N 을 저장하는 동안 배치 N+1 을 해싱 (메모리에는 최대 두 배치만 유지)
+    @staticmethod
+    async def run(engine: AsyncEngine, rows: Iterator[tuple[int, dict[str, Any]]], batch_size: int, workers: int, report: TextIO) -> dict[str, int]:
+        summary = {"total": 0, "inserted": 0, "conflicts": 0, "invalid": 0}
+
+        def write_report(line_no: int, email: Any, error: str) -> None:
+            report.write(json.dumps({"line": line_no, "email": email, "error": error}, ensure_ascii=False) + "\n")
+
+        async def prepare_batch(executor: Executor, batch: list[tuple[int, dict[str, Any]]]) -> list[tuple[int, dict[str, Any]]]:
+            prepared = []
+            for line_no, row in batch:
+                summary["total"] += 1
+                value = UserBulkImporter._prepare(row)
+                if isinstance(value, str):
+                    summary["invalid"] += 1
+                    write_report(line_no, row.get("email") if isinstance(row, dict) else None, value)
+                else:
+                    prepared.append((line_no, value))
+
+            await UserBulkImporter._hash_passwords(executor, [value for _, value in prepared])
+            return prepared
+
+        batches = iter(lambda: list(itertools.islice(rows, batch_size)), [])
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            next_batch = next(batches, None)
+            pending = asyncio.create_task(prepare_batch(executor, next_batch)) if next_batch else None
+
+            while pending is not None:
+                prepared = await pending
+
+                next_batch = next(batches, None)
+                pending = asyncio.create_task(prepare_batch(executor, next_batch)) if next_batch else None
+
+                if not prepared:
+                    continue
+
+                conflicts = await UserBulkImporter._insert_batch(engine, [value for _, value in prepared])
+                for index, (line_no, value) in enumerate(prepared):
+                    if index in conflicts:
+                        write_report(line_no, value["email"], "이미 존재하는 user_id 또는 email 입니다.")
+
+                summary["conflicts"] += len(conflicts)
+                summary["inserted"] += len(prepared) - len(conflicts)
+                UserBulkImporter.logger.info("가져오기 진행: %s", summary)
+
+        return summary
+
+
+if __name__ == "__main__":
+    from core.db.database import Database
+    from core.db.migration.schema_migrator import SchemaMigrator
+
+    parser = argparse.ArgumentParser(description="사용자 일괄 가져오기")
+    parser.add_argument("path", help="CSV 또는 JSONL 파일 경로")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--batch-size", type=int, default=500, help="INSERT 한 번에 저장할 행 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="해싱 프로세스 수")
+    parser.add_argument("--report", default=None, help="실패한 행 기록 파일 (JSONL, 기본: stdout)")
+    args = parser.parse_args()
+
+    input_format = args.format or ("csv" if args.path.endswith(".csv") else "jsonl")
+
+    async def main() -> None:
+        report = open(args.report, "w", encoding="utf-8") if args.report else sys.stdout
+        try:
+            await SchemaMigrator.verify(engine=Database.engine)
+
+            with open(args.path, newline="", encoding="utf-8") as file:
+                summary = await UserBulkImporter.run(
+                    engine=Database.engine,
+                    rows=UserBulkImporter.read_rows(file=file, format=input_format),
+                    batch_size=args.batch_size,
+                    workers=args.workers,
+                    report=report,
+                )
+            print(f"# {summary}", file=sys.stderr)
+        finally:
+            if report is not sys.stdout:
+                report.close()
+            await Database.engine.dispose()
+
+    asyncio.run(main())
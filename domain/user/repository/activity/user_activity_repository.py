@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+from sqlalchemy import bindparam, update
+from core.db.write_behind.write_behind_buffer import WriteBehindBuffer
+from core.security.jwt.token_digest import TokenDigest
+from domain.user.entity.base.base_entity import BaseEntity
+from domain.user.entity.refresh_token.refresh_token_entity import RefreshTokenEntity
+
+# 사용자 / Refresh Token 마지막 사용 시각 기록 레이어 (지연 쓰기)
+# 활동 시각은 사용자 행 버전(ETag / 낙관적 잠금)을 바꾸지 않도록 Core UPDATE 로 기록
+class UserActivityRepository:
+
+    user_table = BaseEntity.__table__
+    refresh_token_table = RefreshTokenEntity.__table__
+
+    # 사용자 마지막 활동 시각
+    last_seen_buffer = WriteBehindBuffer(
+        name="user_last_seen",
+        statement=update(user_table)
+        .where(user_table.c.user_id == bindparam("b_user_id"))
+        .values(last_seen_at=bindparam("b_seen_at")),
+    )
+
+    # Refresh Token 마지막 사용 시각
+    refresh_token_used_buffer = WriteBehindBuffer(
+        name="refresh_token_last_used",
+        statement=update(refresh_token_table)
+        .where(refresh_token_table.c.token_hash == bindparam("b_token_hash"))
+        .values(last_used_at=bindparam("b_used_at")),
+    )
+
+    # DB 저장용 현재 시각 (UTC, timezone 정보 제거)
+    @staticmethod
+    def _utcnow() -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    # 사용자 활동 기록
+    @classmethod
+    async def touch_user(cls, user_id: str) -> None:
+        await cls.last_seen_buffer.add(key=user_id, params={"b_user_id": user_id, "b_seen_at": cls._utcnow()})
+
+    # Refresh Token 사용 기록
+    @classmethod
+    async def touch_refresh_token(cls, token: str) -> None:
+        token_hash = TokenDigest.hexdigest(token)
+        await cls.refresh_token_used_buffer.add(key=token_hash, params={"b_token_hash": token_hash, "b_used_at": cls._utcnow()})
@@ -1,6 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import Row, select, update, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.exc import StaleDataError
 from domain.user.entity.base.base_entity import BaseEntity
+from domain.user.repository.cache.user_cache import UserCache
+from core.db.routing.database_router import DatabaseRouter
+from core.security.auth.revocation_index import RevocationIndex
 from typing import Any, Mapping, TypeVar
 
 # 제네릭 타입 힌트
@@ -13,21 +18,94 @@ class BaseRepository:
     # 공통 메서드, 내부에서만 사용됨
     @classmethod
     async def __find_one_by(cls, session: AsyncSession, **filters) -> T | None:
+        # 단일 필드 조회는 캐시 우선 확인
+        cacheable = len(filters) == 1 and UserCache.supports(field=next(iter(filters)))
+        if cacheable:
+            field, value = next(iter(filters.items()))
+            snapshot = await UserCache.get(field=field, value=value)
+            if snapshot is not None:
+                return await cls.__attach(session=session, snapshot=snapshot)
+
         stmt = select(cls.entity).filter_by(**filters)
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+
+        if cacheable and user is not None:
+            await UserCache.put(snapshot=cls.__snapshot(user=user))
+
+        return user
 
-    # 내부에서만 사용됨
+    # 캐시 저장용 컬럼 스냅샷 생성
     @classmethod
-    async def __update_one_by_id(cls, session: AsyncSession, user_id: int, **values) -> None:
-        stmt = (
-            update(cls.entity)
-            .where(cls.entity.user_id == user_id)
-            .values(**values)
-            .execution_options(synchronize_session="fetch")
-        )
-        await session.execute(stmt)
-        await session.commit()
+    def __snapshot(cls, user: T) -> dict:
+        return {attr.key: getattr(user, attr.key) for attr in inspect(cls.entity).column_attrs}
+
+    # 캐시된 스냅샷을 SELECT 없이 세션에 연결된 엔티티로 복원
+    @classmethod
+    async def __attach(cls, session: AsyncSession, snapshot: dict) -> T:
+        user = cls.entity(**snapshot)
+        make_transient_to_detached(user)
+        return await session.merge(user, load=False)
+
+    # 내부에서만 사용됨, 변경된 엔티티 반환 (사용자가 없으면 None)
+    # expected_version 이 주어지면 해당 버전일 때만 변경하고, 다른 요청이 먼저 변경했으면 StaleDataError (409)
+    @classmethod
+    async def __update_one_by_id(cls, session: AsyncSession, user_id: str, user: T | None = None, expected_version: int | None = None, **values) -> T | None:
+        # 버전 비교는 항상 최신 값 기준 (replica 지연 / 캐시 사본으로 인한 오판 방지)
+        DatabaseRouter.use_primary(session=session)
+
+        try:
+            # RETURNING 지원 DB는 조건부 UPDATE 한 번으로 변경된 행을 받아옴
+            if user is None and session.get_bind().dialect.update_returning:
+                conditions = [cls.entity.user_id == user_id]
+                if expected_version is not None:
+                    conditions.append(cls.entity.version == expected_version)
+
+                stmt = (
+                    update(cls.entity)
+                    .where(*conditions)
+                    .values(**values, version=cls.entity.version + 1)
+                    .returning(cls.entity)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(stmt)
+                updated_user = result.scalar_one_or_none()
+                await session.commit()
+
+                # 변경된 행이 없으면 사용자가 없는지, 버전이 달라졌는지 구분 (실패한 경우에만 조회)
+                if updated_user is None and expected_version is not None:
+                    current = await session.execute(select(cls.entity.version).where(cls.entity.user_id == user_id))
+                    if current.scalar_one_or_none() is not None:
+                        raise StaleDataError(f"user_id={user_id} 의 버전이 {expected_version} 이 아닙니다.")
+
+            # 그 외에는 primary 에서 조회한 엔티티에 값을 반영
+            # version_id_col 설정으로 UPDATE 문에 WHERE version = <조회한 버전> 이 붙고 버전이 증가함
+            else:
+                if user is None:
+                    # identity map 에 캐시 사본으로 붙은 엔티티가 있어도 primary 의 최신 값 / 버전으로 덮어씀
+                    stmt = select(cls.entity).where(cls.entity.user_id == user_id).execution_options(populate_existing=True)
+                    result = await session.execute(stmt)
+                    user = result.scalar_one_or_none()
+
+                if user is not None:
+                    if expected_version is not None and user.version != expected_version:
+                        raise StaleDataError(f"user_id={user_id} 의 버전이 {expected_version} 이 아닙니다.")
+
+                    for key, value in values.items():
+                        setattr(user, key, value)
+                    await session.commit()
+
+                updated_user = user
+
+        except StaleDataError:
+            # 오래된 캐시 사본 제거 후 409 로 응답
+            await UserCache.invalidate(user_id=user_id)
+            raise
+
+        # 변경된 사용자 캐시 무효화
+        await UserCache.invalidate(user_id=user_id)
+
+        return updated_user
 
 
     # 이메일로 사용자 조회
@@ -46,37 +124,65 @@ class BaseRepository:
         return await cls.__find_one_by(session=session, user_id=user_id)
 
 
+    # 사용자 행 버전만 조회 (버전 컬럼만 SELECT), 사용자가 없으면 None
+    # 304 판단에 쓰이므로 다른 워커의 변경을 놓칠 수 있는 캐시 사본은 사용하지 않음
+    @classmethod
+    async def find_version_by_user_id(cls, session: AsyncSession, user_id: str) -> int | None:
+        result = await session.execute(select(cls.entity.version).where(cls.entity.user_id == user_id))
+        return result.scalar_one_or_none()
+
+
+    # 사용자 고유 id 목록으로 필요한 컬럼만 일괄 조회 (IN 쿼리 한 번), 순서는 보장하지 않음
+    @classmethod
+    async def find_all_by_user_ids(cls, session: AsyncSession, user_ids: list[str], columns: tuple[str, ...]) -> list[Row]:
+        if not user_ids:
+            return []
+
+        stmt = select(*(getattr(cls.entity, column) for column in columns)).where(cls.entity.user_id.in_(user_ids))
+        result = await session.execute(stmt)
+        return list(result.all())
+
+
+    # id 기준 keyset 페이지 조회 (after_id 다음 행부터 limit 개, OFFSET 없이 기본키 인덱스 탐색)
+    # 반환 행의 첫 컬럼은 다음 커서용 id
+    @classmethod
+    async def find_page_after_id(cls, session: AsyncSession, after_id: int | None, limit: int, columns: tuple[str, ...]) -> list[Row]:
+        stmt = select(cls.entity.id, *(getattr(cls.entity, column) for column in columns)).order_by(cls.entity.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(cls.entity.id > after_id)
+
+        result = await session.execute(stmt)
+        return list(result.all())
+
+
     # 이메일 수정
     @classmethod
-    async def update_email(cls, session: AsyncSession, user_id: int, new_email: str) -> None:
-        await cls.__update_one_by_id(session=session, user_id=user_id, email=new_email)
+    async def update_email(cls, session: AsyncSession, user_id: str, new_email: str, user: T | None = None, expected_version: int | None = None) -> T | None:
+        return await cls.__update_one_by_id(session=session, user_id=user_id, user=user, expected_version=expected_version, email=new_email)
 
     # 이름(username) 수정
     @classmethod
-    async def update_username(cls, session: AsyncSession, user_id: int, new_username: str) -> None:
-        await cls.__update_one_by_id(session=session, user_id=user_id, username=new_username)
+    async def update_username(cls, session: AsyncSession, user_id: str, new_username: str, user: T | None = None, expected_version: int | None = None) -> T | None:
+        return await cls.__update_one_by_id(session=session, user_id=user_id, user=user, expected_version=expected_version, username=new_username)
 
     # 비밀번호(password) 수정
     @classmethod
-    async def update_password(cls, session: AsyncSession, user_id: int, new_password: str) -> None:
-        await cls.__update_one_by_id(session=session, user_id=user_id, password=new_password) 
+    async def update_password(cls, session: AsyncSession, user_id: str, new_password: str, user: T | None = None, expected_version: int | None = None) -> T | None:
+        return await cls.__update_one_by_id(session=session, user_id=user_id, user=user, expected_version=expected_version, password=new_password)
         
-    # Access / Refresh Token 업데이트용 메서드
-    @classmethod
-    async def update_tokens(cls, session: AsyncSession, user_id: str, access_token: str, refresh_token: str) -> None:
-        await cls.__update_one_by_id(session=session, user_id=user_id, access_token=access_token, refresh_token=refresh_token) 
-
     # 사용자 소개 (bio) 수정
     @classmethod
-    async def update_bio(cls, session: AsyncSession, user_id: int, new_bio: str) -> None:
-        await cls.__update_one_by_id(session=session, user_id=user_id, bio=new_bio) 
+    async def update_bio(cls, session: AsyncSession, user_id: str, new_bio: str, user: T | None = None, expected_version: int | None = None) -> T | None:
+        return await cls.__update_one_by_id(session=session, user_id=user_id, user=user, expected_version=expected_version, bio=new_bio)
 
-    # 새 사용자 저장
+    # 새 사용자 저장 | 자동 증가 id는 INSERT 결과로 채워지므로 refresh 하지 않음
     @classmethod
     async def save(cls, session: AsyncSession, user: T) -> T | None:
         session.add(user)
         await session.commit()
-        await session.refresh(user)
+
+        # 같은 user_id로 남아 있을 수 있는 캐시 무효화
+        await UserCache.invalidate(user_id=user.user_id)
         return user
 
     # 사용자 삭제
@@ -86,3 +192,9 @@ class BaseRepository:
         if user:
             await session.delete(user)
             await session.commit()
+
+            # 삭제된 사용자 캐시 무효화
+            await UserCache.invalidate(user_id=user.user_id)
+
+            # 인증 의존성이 삭제된 사용자의 토큰을 DB 조회 없이 거부하도록 표시
+            await RevocationIndex.mark_user_deleted(user_id=user.user_id)
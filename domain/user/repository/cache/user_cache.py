@@ -0,0 +1,100 @@
+from typing import Any
+from core.cache.backend.cache_backend import CacheBackend
+from core.cache.backend.memory_cache_backend import MemoryCacheBackend
+from core.cache.backend.redis_cache_backend import RedisCacheBackend
+from core.cache.redis.redis_client_provider import RedisClientProvider
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+
+
+# 사용자 조회용 read-through 캐시 (사용자 행의 컬럼 스냅샷 저장)
+# 스냅샷에는 비밀번호 해시 / 버전이 포함되므로, 여러 워커에서는 무효화가 공유되는 redis 저장소에서만 사용
+# 무효화는 삭제 대신 짧은 TTL 의 표시(tombstone)를 남기고, 저장은 키가 없을 때만 하므로
+# 변경 전에 시작된 조회가 무효화 이후에 오래된 스냅샷을 다시 저장하지 못함
+class UserCache:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("domain.user.repository.user_cache")
+
+    BACKEND: str = environment_config.user_cache_backend  # memory | redis
+    ENABLED: bool = environment_config.user_cache_enabled
+    TTL: int = environment_config.user_cache_ttl
+    INVALIDATION_TTL: int = environment_config.user_cache_invalidation_ttl  # 진행 중인 조회가 끝날 때까지 저장을 막는 시간 (초)
+    TOMBSTONE: str = "invalidated"  # 무효화 표시 값 (스냅샷은 dict)
+    KEY_PREFIX: str = "user"
+    INDEXED_FIELDS: tuple[str, ...] = ("email",)  # user_id를 가리키는 보조 키 (고유 컬럼만 가능)
+
+    # 캐시 저장소 (configure로 교체 가능)
+    backend: CacheBackend = (
+        RedisCacheBackend(client=RedisClientProvider.get())
+        if BACKEND == "redis" else MemoryCacheBackend(max_size=environment_config.user_cache_size)
+    )
+
+    # 워커별 메모리 저장소는 다른 워커의 무효화를 알 수 없으므로 단일 워커에서만 사용
+    if ENABLED and BACKEND != "redis" and environment_config.server_workers > 1:
+        logger.warning("USER_CACHE_BACKEND=memory 는 단일 워커에서만 사용할 수 있어 사용자 캐시를 끕니다. (SERVER_WORKERS=%d)", environment_config.server_workers)
+        ENABLED = False
+
+    # 통계 값
+    hits: int = 0
+    misses: int = 0
+
+    # 캐시 저장소 교체
+    @classmethod
+    def configure(cls, backend: CacheBackend, enabled: bool = True) -> None:
+        cls.backend = backend
+        cls.ENABLED = enabled
+
+    # 캐시 키 생성
+    @classmethod
+    def _key(cls, field: str, value: Any) -> str:
+        return f"{cls.KEY_PREFIX}:{field}:{value}"
+
+    # 캐시 가능한 조회 조건인지 확인
+    @classmethod
+    def supports(cls, field: str) -> bool:
+        return cls.ENABLED and (field == "user_id" or field in cls.INDEXED_FIELDS)
+
+    # 스냅샷 조회, 없으면 None
+    @classmethod
+    async def get(cls, field: str, value: Any) -> dict[str, Any] | None:
+        user_id = value if field == "user_id" else await cls.backend.get(cls._key(field, value))
+        snapshot = await cls.backend.get(cls._key("user_id", user_id)) if user_id is not None else None
+
+        # 무효화 표시 / 보조 키가 변경 전 값을 가리키는 경우는 캐시 미스로 처리
+        if not isinstance(snapshot, dict) or snapshot.get(field) != value:
+            cls.misses += 1
+            return None
+
+        cls.hits += 1
+        return snapshot
+
+    # 스냅샷 저장 (키가 없을 때만, 무효화 표시나 다른 스냅샷이 있으면 저장하지 않음)
+    @classmethod
+    async def put(cls, snapshot: dict[str, Any]) -> None:
+        user_id = snapshot["user_id"]
+        if not await cls.backend.add(cls._key("user_id", user_id), snapshot, cls.TTL):
+            return
+
+        for field in cls.INDEXED_FIELDS:
+            if snapshot.get(field) is not None:
+                await cls.backend.set(cls._key(field, snapshot[field]), user_id, cls.TTL)
+
+    # 사용자 스냅샷 무효화 (보조 키는 조회 시 값 비교로 걸러짐)
+    # INVALIDATION_TTL 동안 무효화 표시를 남겨 변경 전에 읽은 스냅샷이 다시 저장되지 않도록 함
+    @classmethod
+    async def invalidate(cls, user_id: str) -> None:
+        if cls.ENABLED:
+            await cls.backend.set(cls._key("user_id", user_id), cls.TOMBSTONE, cls.INVALIDATION_TTL)
+
+    # 적중률 통계
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        total = cls.hits + cls.misses
+        return {
+            "enabled": cls.ENABLED,
+            "backend": type(cls.backend).__name__,
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_ratio": cls.hits / total if total else 0.0,
+        }
@@ -0,0 +1,29 @@
+import asyncio
+from core.config.environment.environment_config import environment_config
+from core.config.logging.logger_config import LoggerConfig
+from core.db.database import Database
+from domain.user.repository.refresh_token.refresh_token_repository import RefreshTokenRepository
+
+# 만료된 Refresh Token 행을 주기적으로 삭제 (애플리케이션 실행 중 백그라운드 태스크로 실행)
+class RefreshTokenCleaner:
+
+    # 로거 정의
+    logger = LoggerConfig.get_logger("domain.user.repository.refresh_token_cleaner")
+
+    INTERVAL: float = environment_config.refresh_token_cleanup_interval
+
+    @classmethod
+    async def run(cls) -> None:
+        while True:
+            try:
+                async with Database.async_session_factory() as session:
+                    deleted = await RefreshTokenRepository.delete_expired(session=session)
+
+                if deleted:
+                    cls.logger.info("만료된 Refresh Token %d 건 삭제", deleted)
+
+            except Exception as e:
+                # 실패해도 다음 주기에 다시 시도
+                cls.logger.warning("만료된 Refresh Token 삭제 실패: %s", e)
+
+            await asyncio.sleep(cls.INTERVAL)
\ No newline at end of file
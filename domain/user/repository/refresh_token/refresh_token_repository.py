@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from core.security.jwt.token_digest import TokenDigest
+from core.db.routing.database_router import DatabaseRouter
+from domain.user.entity.refresh_token.refresh_token_entity import RefreshTokenEntity
+
+# Refresh Token 테이블 접근 레이어
+class RefreshTokenRepository:
+    entity = RefreshTokenEntity
+
+    # DB 저장용 현재 시각 (UTC, timezone 정보 제거)
+    @staticmethod
+    def _utcnow() -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    # 새 Refresh Token 저장
+    @classmethod
+    async def save(cls, session: AsyncSession, user_id: str, token: str, expires_at: datetime) -> RefreshTokenEntity:
+        refresh_token = cls.entity(
+            token_hash=TokenDigest.hexdigest(token),
+            user_id=user_id,
+            expires_at=expires_at.astimezone(timezone.utc).replace(tzinfo=None),
+        )
+        session.add(refresh_token)
+        await session.commit()
+        return refresh_token
+
+    # 만료되지 않은 Refresh Token 조회 (다이제스트 인덱스 조회)
+    # 발급 직후 / 폐기 직후 상태를 정확히 보기 위해 항상 primary 에서 조회
+    @classmethod
+    async def find_valid_by_token(cls, session: AsyncSession, token: str) -> RefreshTokenEntity | None:
+        DatabaseRouter.use_primary(session=session)
+        stmt = select(cls.entity).where(
+            cls.entity.token_hash == TokenDigest.hexdigest(token),
+            cls.entity.expires_at > cls._utcnow(),
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    # Refresh Token 삭제
+    @classmethod
+    async def delete_by_token(cls, session: AsyncSession, token: str) -> None:
+        await session.execute(delete(cls.entity).where(cls.entity.token_hash == TokenDigest.hexdigest(token)))
+        await session.commit()
+
+    # 사용자의 모든 Refresh Token 삭제
+    @classmethod
+    async def delete_by_user_id(cls, session: AsyncSession, user_id: str) -> None:
+        await session.execute(delete(cls.entity).where(cls.entity.user_id == user_id))
+        await session.commit()
+
+    # 만료된 Refresh Token 정리, 삭제된 행 수 반환
+    @classmethod
+    async def delete_expired(cls, session: AsyncSession) -> int:
+        result = await session.execute(delete(cls.entity).where(cls.entity.expires_at <= cls._utcnow()))
+        await session.commit()
+        return result.rowcount
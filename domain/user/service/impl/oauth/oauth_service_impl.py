@@ -1,20 +1,33 @@
 import uuid
-import re
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status, Header, Request
 from fastapi.responses import JSONResponse
+from core.response.dto_response import DtoResponse
+from starlette.background import BackgroundTask
 from core.security.jwt.jwt_provider import JWTProvider
 from core.security.password.argon2_password_hasher import Argon2PasswordHasher
+from core.security.password.password_policy import PasswordPolicy
 from domain.user.service.oauth.oauth_service import OauthService
 from domain.user.entity.oauth.oauth_entity import OauthEntity
 from domain.user.repository.oauth.oauth_repository import OauthRepository
+from domain.user.repository.refresh_token.refresh_token_repository import RefreshTokenRepository
+from domain.user.repository.activity.user_activity_repository import UserActivityRepository
 from domain.user.dto.request.oauth.signup_dto_request import SignupDtoRequest
 from domain.user.dto.request.oauth.signin_dto_request import SigninDtoRequest
 from domain.user.dto.response.oauth.signup_dto_response import SignupDtoResponse
 from domain.user.dto.response.oauth.signin_dto_response import SigninDtoResponse
 from domain.user.dto.response.oauth.refresh_token_dto_response import RefreshTokenDtoResponse
+from domain.user.dto.response.oauth.signout_dto_response import SignoutDtoResponse
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
+from core.security.auth.revocation_index import RevocationIndex
 from core.config.environment.environment_config import environment_config
 from core.security.cookie.cookie_util import CookieUtil
+from core.config.logging.logger_config import LoggerConfig
+from core.db.database import Database
+
+# 로거 생성
+logger = LoggerConfig.get_logger("domain.service.oauth_service_impl")
 
 
 class OauthServiceImpl(OauthService):
@@ -23,32 +36,19 @@ class OauthServiceImpl(OauthService):
     @staticmethod
     async def signup(dto: SignupDtoRequest, session: AsyncSession) -> JSONResponse:
         
-        # 사용자 고유 ID 생성
-        user_id = str(uuid.uuid4())
-
-        # 사용자 고유 id 생성 중복 체크
-        if await OauthRepository.find_by_user_id(session=session, user_id=user_id):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="사용자 고유 ID 생성 과정에서 문제가 발생했습니다. 잠시 후 다시시도하세요."
-            )        
-
-        # 이메일 중복 체크
-        if await OauthRepository.find_by_email(session=session, email=dto.email):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="이미 등록된 이메일입니다."
-            )
-        
         # 비밀번호 유효성 검사 (영문, 숫자, 일반적으로 자주 사용되는 특수문자만 허용)
-        if not re.compile(r"^[A-Za-z0-9!@#$%^&*()_+\-]+$").match(dto.password):
+        if not PasswordPolicy.is_allowed(dto.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="비밀번호는 영어, 숫자, 특수문자만 포함해야 합니다."
+                detail=PasswordPolicy.MESSAGE
             )
         
+        # 사용자 고유 ID 생성
+        # user_id / email 중복은 INSERT 시 고유 제약 조건으로 검출되어 IntegrityError 핸들러에서 409로 변환됨
+        user_id = str(uuid.uuid4())
+        
         # 비밀번호 암호화
-        hasd_password = Argon2PasswordHasher.hash_password(password=dto.password)
+        hasd_password = await Argon2PasswordHasher.hash_password_async(password=dto.password)
         
         # 사용자 생성
         user = OauthEntity(
@@ -59,20 +59,17 @@ class OauthServiceImpl(OauthService):
             password=hasd_password,
             )
         
-        # DB에 저장
+        # DB에 저장 (INSERT 한 번)
         saved_user = await OauthRepository.save(session=session, user=user)
 
         # 응답 dto 객체 생성
         response = SignupDtoResponse(
             user_id=saved_user.user_id,
             status_code=status.HTTP_200_OK
-            ).model_dump()
+            )
         
         # Response 반환
-        return JSONResponse(
-            content=response,
-            status_code=response.get("status_code", 500)
-        )
+        return DtoResponse.of(dto=response)
     
     # 로그인 기능
     @staticmethod
@@ -81,8 +78,6 @@ class OauthServiceImpl(OauthService):
         # 사용자 조회
         user = await OauthRepository.find_by_email(session=session, email=dto.email)
         
-        refresh_token = user.refresh_token
-        
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -90,56 +85,43 @@ class OauthServiceImpl(OauthService):
             )
 
         # 비밀번호 검증
-        if not Argon2PasswordHasher.verify_password(plain_password=dto.password, hashed_password=user.password):
+        if not await Argon2PasswordHasher.verify_password_async(plain_password=dto.password, hashed_password=user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="비밀번호가 일치하지 않습니다."
             )
 
         # JWT 토큰 생성 (로그인 성공 시)
-        # 기존에는 refresh_token도 함께 업데이트했으나, 이제는 기존 refresh_token을 그대로 유지한다.
         access_token = JWTProvider.create_access_token(user_id=user.user_id)
-        refresh_token = user.refresh_token
+        refresh_token = JWTProvider.create_refresh_token(user_id=user.user_id)
         
-        # refresh_token 유효성 체크
-        try:
-            JWTProvider.verify_token(token=refresh_token)
-            # 유효하면 그대로 사용
-            
-        except ValueError:
-            # 만료 또는 유효하지 않으면 새로 생성
-            refresh_token = JWTProvider.create_refresh_token(user_id=user.user_id)
-            
-        # DB에 토큰 저장 또는 업데이트
-        await OauthRepository.update_tokens(
+        # Refresh Token 다이제스트만 저장 (Access Token은 저장하지 않음)
+        await RefreshTokenRepository.save(
             session=session,
             user_id=user.user_id,
-            access_token=access_token,
-            refresh_token=refresh_token
+            token=refresh_token,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=environment_config.refresh_token_expire)
         )
-
-        # 다시 조회
-        update_user = await OauthRepository.find_by_user_id(session=session, user_id=user.user_id)
+        
+        # 마지막 활동 시각 기록 (지연 쓰기, Refresh Token 저장과 달리 응답 전에 반영될 필요 없음)
+        await UserActivityRepository.touch_user(user_id=user.user_id)
         
         # 응답 dto 생성
         response = SigninDtoResponse(
-            user_id=update_user.user_id,
-            access_token=update_user.access_token,
+            user_id=user.user_id,
+            access_token=access_token,
             status_code=status.HTTP_200_OK
-        ).model_dump()
+        )
         
         
         # Response 객체 생성
-        json_response = JSONResponse(
-            content=response,
-            status_code=response.get("status_code", 500)
-        )
+        json_response = DtoResponse.of(dto=response)
         
         # 쿠키 설정
         CookieUtil.set_cookie(
             response=json_response,
             key="refresh_token",
-            value=update_user.refresh_token, # refresh token 쿠키에 저장
+            value=refresh_token, # refresh token 쿠키에 저장
             http_only=True,
             secure=True,
             same_site="strict",
@@ -147,9 +129,32 @@ class OauthServiceImpl(OauthService):
             path="/"
         )
         
+        # 이전 파라미터로 만들어진 해시는 응답 후 백그라운드에서 재해싱
+        if Argon2PasswordHasher.needs_rehash(hashed_password=user.password):
+            json_response.background = BackgroundTask(
+                OauthServiceImpl.rehash_password,
+                user_id=user.user_id,
+                password=dto.password
+            )
+        
         # Response 반환
         return json_response
 
+    # 비밀번호 재해싱 (로그인 성공 후 백그라운드 실행, 요청 세션은 이미 닫혀 있으므로 새 세션 사용)
+    @staticmethod
+    async def rehash_password(user_id: str, password: str) -> None:
+        try:
+            new_hashed_password = await Argon2PasswordHasher.hash_password_async(password=password)
+
+            async with Database.async_session_factory() as session:
+                await OauthRepository.update_password(session=session, user_id=user_id, new_password=new_hashed_password)
+
+            logger.info("비밀번호 해시 갱신 완료 (user_id=%s)", user_id)
+
+        except Exception as e:
+            # 실패해도 다음 로그인 시 다시 시도됨
+            logger.warning("비밀번호 해시 갱신 실패 (user_id=%s): %s", user_id, e)
+
     # 토큰 재발급
     @staticmethod
     async def refresh_token(request: Request, session: AsyncSession) -> JSONResponse:
@@ -171,6 +176,22 @@ class OauthServiceImpl(OauthService):
                 detail="Refresh Token이 유효하지 않습니다."
             )
 
+        # 폐기된 Refresh Token 은 DB 조회 없이 거부
+        if RevocationIndex.is_token_revoked(token=refresh_token) or RevocationIndex.is_user_deleted(user_id=user_id):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="폐기된 Refresh Token입니다."
+            )
+
+        # 저장된 Refresh Token 확인 (다이제스트 인덱스 조회)
+        stored_token = await RefreshTokenRepository.find_valid_by_token(session=session, token=refresh_token)
+        
+        if not stored_token or stored_token.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh Token이 일치하지 않습니다."
+            )
+
         # 사용자 조회
         user = await OauthRepository.find_by_user_id(session=session, user_id=user_id)
         
@@ -180,38 +201,54 @@ class OauthServiceImpl(OauthService):
                 detail="해당 사용자가 존재하지 않습니다."
             )
 
-        # DB에 저장된 리프레시 토큰 일치 확인
-        if user.refresh_token != refresh_token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Refresh Token이 일치하지 않습니다."
-            )
+        # 마지막 활동 / Refresh Token 사용 시각 기록 (지연 쓰기)
+        await UserActivityRepository.touch_user(user_id=user.user_id)
+        await UserActivityRepository.touch_refresh_token(token=refresh_token)
 
-        # 새로운 Access Token 생성
+        # 새로운 Access Token 생성 (DB에 저장하지 않음)
         new_access_token = JWTProvider.create_access_token(user_id=user.user_id)
-
-        # DB에 Access Token 업데이트
-        await OauthRepository.update_tokens(
-            session=session,
-            user_id=user.user_id,
-            access_token=new_access_token,
-            refresh_token=user.refresh_token
-        )
-
-        # 다시 조회
-        update_user = await OauthRepository.find_by_user_id(session=session, user_id=user.user_id)
         
         # 응답 Dto 생성
         response = RefreshTokenDtoResponse(
-            user_id=update_user.user_id,
-            username=update_user.username,
-            email=update_user.email,
-            access_token=update_user.access_token,
+            user_id=user.user_id,
+            username=user.username,
+            email=user.email,
+            access_token=new_access_token,
             status_code=status.HTTP_200_OK
-        ).model_dump()
+        )
         
         # Response 반환
-        return JSONResponse(
-            content=response,
-            status_code=response.get("status_code", 500)
-        )
\ No newline at end of file
+        return DtoResponse.of(dto=response)
+
+    # 로그아웃 (Access Token / Refresh Token 폐기)
+    @staticmethod
+    async def signout(principal: AuthenticatedPrincipal, request: Request, session: AsyncSession) -> JSONResponse:
+
+        # Access Token 폐기 (만료 시각까지 모든 워커에서 거부)
+        await RevocationIndex.revoke_token(token=principal.token, exp=principal.payload["exp"])
+
+        # 쿠키의 Refresh Token 폐기 (본인 토큰인 경우만)
+        refresh_token = CookieUtil.get_cookie(request=request, key="refresh_token")
+
+        if refresh_token is not None:
+            try:
+                payload = JWTProvider.verify_token(refresh_token)
+            except ValueError:
+                payload = None
+
+            if payload is not None and payload.get("sub") == principal.user_id:
+                await RevocationIndex.revoke_token(token=refresh_token, exp=payload["exp"])
+                await RefreshTokenRepository.delete_by_token(session=session, token=refresh_token)
+
+        # 응답 dto 생성
+        response = SignoutDtoResponse(
+            user_id=principal.user_id,
+            status_code=status.HTTP_200_OK
+        )
+
+        # Response 객체 생성 후 쿠키 삭제
+        json_response = DtoResponse.of(dto=response)
+        CookieUtil.delete_cookie(response=json_response, name="refresh_token", path="/")
+
+        # Response 반환
+        return json_response
\ No newline at end of file
@@ -1,39 +1,43 @@
 import uuid
 import re
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import HTTPException, status, Header, Request
-from fastapi.responses import JSONResponse
-from core.security.jwt.jwt_provider import JWTProvider
-from core.security.jwt.jwt_filter import JWTFilter
+from fastapi import HTTPException, status, Header
+from fastapi.responses import JSONResponse, Response
+from core.response.dto_response import DtoResponse
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
 from core.security.password.argon2_password_hasher import Argon2PasswordHasher
 from domain.user.service.profile.profile_service import ProfileService
 from domain.user.repository.profile.profile_repository import ProfileRepository
 from domain.user.dto.request.profile.profile_update_dto_request import ProfileUpdateDtoRequest
+from domain.user.dto.request.profile.profile_batch_dto_request import ProfileBatchDtoRequest
 from domain.user.dto.response.profile.profile_dto_response import ProfileDtoResponse
+from domain.user.dto.response.profile.profile_batch_dto_response import ProfileBatchDtoResponse
+from domain.user.dto.response.profile.profile_list_dto_response import ProfileListDtoResponse
+from core.pagination.keyset_cursor import KeysetCursor
+from core.response.etag import ETag
 from core.config.environment.environment_config import environment_config
 from core.security.cookie.cookie_util import CookieUtil
 
 class ProfileServiceImpl(ProfileService):
     
+    # 일괄 / 목록 조회 응답에 포함되는 필드 (이메일 등 본인 외에 노출하지 않는 값은 제외)
+    PUBLIC_FIELDS: tuple[str, ...] = ("user_id", "username", "bio")
+    
     # 프로필 조회
     @staticmethod
-    async def me(request: Request, session: AsyncSession) -> JSONResponse:
-        
-        # Bearer 헤더 검증
-        token = JWTFilter.resolve_token(request=request)
+    async def me(principal: AuthenticatedPrincipal, session: AsyncSession, if_none_match: str | None = None) -> Response:
         
-        # jwt 검증
-        payload = JWTProvider.verify_token(token=token)
-        user_id = payload.get("sub", None)
+        # 조건부 요청이면 버전만 확인해 변경이 없을 때 본문 없이 304 반환
+        if if_none_match:
+            version = await ProfileRepository.find_version_by_user_id(session=session, user_id=principal.user_id)
+            
+            if version is not None:
+                etag = ETag.of(principal.user_id, version)
+                if ETag.matches(if_none_match=if_none_match, etag=etag):
+                    return ETag.not_modified(etag=etag)
         
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Access Token이 유효하지 않습니다."
-            )
-
-        # 사용자 조회
-        user = await ProfileRepository.find_by_user_id(session=session, user_id=user_id)
+        # 사용자 조회 (인증은 라우터 의존성에서 완료됨)
+        user = await ProfileRepository.find_by_user_id(session=session, user_id=principal.user_id)
         
         if not user:
             raise HTTPException(
@@ -48,44 +52,27 @@ class ProfileServiceImpl(ProfileService):
             email=user.email,
             bio=user.bio,
             status_code=status.HTTP_200_OK
-        ).model_dump()
-        
-        # Response 반환
-        return JSONResponse(
-            content=response,
-            status_code=response.get("status_code", 500)
         )
+        
+        # Response 반환 (다음 요청의 If-None-Match 용 ETag 포함)
+        return DtoResponse.of(dto=response, headers={"ETag": ETag.of(user.user_id, user.version)})
 
     # 프로필 업데이트
-    async def update(request: Request, dto: ProfileUpdateDtoRequest, session: AsyncSession) -> JSONResponse:
-        # Bearer 헤더 검증
-        token = JWTFilter.resolve_token(request=request)
+    @staticmethod
+    async def update(principal: AuthenticatedPrincipal, dto: ProfileUpdateDtoRequest, session: AsyncSession, if_match: str | None = None) -> JSONResponse:
         
-        # jwt 검증
-        payload = JWTProvider.verify_token(token=token)
-        user_id = payload.get("sub", None)
+        # If-Match 가 있으면 해당 버전일 때만 변경 (다른 요청이 먼저 변경했으면 409)
+        expected_version = ETag.version_of(if_match, principal.user_id) if if_match else None
         
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Access Token이 유효하지 않습니다."
-            )
-
-        # 사용자 조회
-        user = await ProfileRepository.find_by_user_id(session=session, user_id=user_id)
+        # 자기소개 (bio) 내용 변경 후 변경된 사용자 반환 (인증은 라우터 의존성에서 완료됨)
+        update_user = await ProfileRepository.update_bio(session=session, user_id=principal.user_id, new_bio=dto.bio, expected_version=expected_version)
         
-        if not user:
+        if not update_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="해당 사용자가 존재하지 않습니다."
             )
         
-        # 자기소개 (bio) 내용 변경
-        await ProfileRepository.update_bio(session=session, user_id=user.user_id, new_bio=dto.bio)
-        
-        # 다시 조회
-        update_user = await ProfileRepository.find_by_user_id(session=session, user_id=user.user_id)
-        
         # 응답 Dto 생성
         response = ProfileDtoResponse(
             user_id=update_user.user_id,
@@ -93,10 +80,51 @@ class ProfileServiceImpl(ProfileService):
             email=update_user.email,
             bio=update_user.bio,
             status_code=status.HTTP_200_OK
-        ).model_dump()
+        )
+        
+        # Response 반환 (변경된 버전의 ETag 포함)
+        return DtoResponse.of(dto=response, headers={"ETag": ETag.of(update_user.user_id, update_user.version)})
+
+    # 프로필 일괄 조회
+    @staticmethod
+    async def batch(dto: ProfileBatchDtoRequest, session: AsyncSession) -> JSONResponse:
+        
+        # 중복 제거 (요청 순서 유지)
+        user_ids = list(dict.fromkeys(dto.user_ids))
+        
+        # IN 쿼리 한 번으로 필요한 컬럼만 조회
+        rows = await ProfileRepository.find_all_by_user_ids(session=session, user_ids=user_ids, columns=ProfileServiceImpl.PUBLIC_FIELDS)
+        found = {row[0]: list(row) for row in rows}
+        
+        # 응답 Dto 생성
+        response = ProfileBatchDtoResponse(
+            fields=list(ProfileServiceImpl.PUBLIC_FIELDS),
+            rows=[found[user_id] for user_id in user_ids if user_id in found],
+            missing=[user_id for user_id in user_ids if user_id not in found],
+            status_code=status.HTTP_200_OK
+        )
+        
+        # Response 반환
+        return DtoResponse.of(dto=response)
+
+    # 프로필 목록 조회 (keyset 페이지네이션)
+    @staticmethod
+    async def list_users(cursor: str | None, limit: int, session: AsyncSession) -> JSONResponse:
+        
+        # 커서 복원 (잘못된 커서는 ValueError -> 400)
+        after_id = KeysetCursor.decode(cursor) if cursor else None
+        
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        rows = await ProfileRepository.find_page_after_id(session=session, after_id=after_id, limit=limit + 1, columns=ProfileServiceImpl.PUBLIC_FIELDS)
+        page = rows[:limit]
+        
+        # 응답 Dto 생성
+        response = ProfileListDtoResponse(
+            fields=list(ProfileServiceImpl.PUBLIC_FIELDS),
+            rows=[list(row[1:]) for row in page],
+            next_cursor=KeysetCursor.encode(page[-1][0]) if len(rows) > limit else None,
+            status_code=status.HTTP_200_OK
+        )
         
         # Response 반환
-        return JSONResponse(
-            content=response,
-            status_code=response.get("status_code", 500)
-        )
\ No newline at end of file
+        return DtoResponse.of(dto=response)
\ No newline at end of file
@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from domain.user.dto.request.oauth.signup_dto_request import SignupDtoRequest
 from domain.user.dto.request.oauth.signin_dto_request import SigninDtoRequest
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
 
 class OauthService(ABC):
     
@@ -21,4 +22,8 @@ class OauthService(ABC):
     @abstractmethod
     async def refresh_token(request: Request, session: AsyncSession) -> JSONResponse:
         pass
-    
\ No newline at end of file
+    
+    # 로그아웃 추상화
+    @abstractmethod
+    async def signout(principal: AuthenticatedPrincipal, request: Request, session: AsyncSession) -> JSONResponse:
+        pass
\ No newline at end of file
@@ -1,17 +1,29 @@
 from abc import ABC, abstractmethod
-from fastapi import Header, Request
-from fastapi.responses import JSONResponse
+from fastapi import Header
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from core.security.auth.authenticated_principal import AuthenticatedPrincipal
 from domain.user.dto.request.profile.profile_update_dto_request import ProfileUpdateDtoRequest
+from domain.user.dto.request.profile.profile_batch_dto_request import ProfileBatchDtoRequest
 
 class ProfileService(ABC):
     
     # 프로필 조회 추상화
     @abstractmethod
-    async def me(request: Request, session: AsyncSession) -> JSONResponse:
+    async def me(principal: AuthenticatedPrincipal, session: AsyncSession, if_none_match: str | None = None) -> Response:
         pass
     
     # 프로필 업데이트 추상화
     @abstractmethod
-    async def update(request: Request, dto: ProfileUpdateDtoRequest, session: AsyncSession) -> JSONResponse:
+    async def update(principal: AuthenticatedPrincipal, dto: ProfileUpdateDtoRequest, session: AsyncSession, if_match: str | None = None) -> JSONResponse:
+        pass
+    
+    # 프로필 일괄 조회 추상화
+    @abstractmethod
+    async def batch(dto: ProfileBatchDtoRequest, session: AsyncSession) -> JSONResponse:
+        pass
+    
+    # 프로필 목록 조회 추상화
+    @abstractmethod
+    async def list_users(cursor: str | None, limit: int, session: AsyncSession) -> JSONResponse:
         pass
\ No newline at end of file